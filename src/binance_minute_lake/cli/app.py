@@ -8,15 +8,25 @@ import typer
 from rich.console import Console
 
 from binance_minute_lake.core.config import Settings
+from binance_minute_lake.core.json_codec import JsonCodec
 from binance_minute_lake.core.logging import configure_logging
 from binance_minute_lake.core.time_utils import floor_to_minute, utc_now
+from binance_minute_lake.pipeline.depth_replay import DepthReplayEngine
 from binance_minute_lake.pipeline.orchestrator import MinuteIngestionPipeline
+from binance_minute_lake.sources.http_cassette import build_http_transport
+from binance_minute_lake.sources.live_process import (
+    FeatureRingBuffer,
+    LiveIngestionProcess,
+    SharedMemoryLiveCollector,
+    build_live_supervisor,
+)
 from binance_minute_lake.sources.metrics_inspector import MetricsZipInspector
-from binance_minute_lake.sources.rest import BinanceRESTClient
+from binance_minute_lake.sources.rest import BinanceRESTClient, build_rest_client
 from binance_minute_lake.sources.vision import VisionClient
 from binance_minute_lake.sources.websocket import (
     BinanceLiveStreamSupervisor,
     InMemoryLiveCollector,
+    LiveCollector,
     LiveEventStore,
 )
 from binance_minute_lake.state.store import SQLiteStateStore
@@ -214,6 +224,7 @@ def cleanup_live_state(
         f"deleted={cleanup.total_deleted}, "
         f"ws={cleanup.ws_events_deleted}, "
         f"depth={cleanup.ws_depth_events_deleted}, "
+        f"depth_snapshots={cleanup.ws_depth_snapshots_deleted}, "
         f"liq={cleanup.ws_liq_events_deleted}, "
         f"trade={cleanup.ws_trade_events_deleted}, "
         f"heartbeats={cleanup.consumer_heartbeats_deleted}, "
@@ -221,6 +232,57 @@ def cleanup_live_state(
     )
 
 
+@app.command("replay-depth")
+def replay_depth(
+    start: str = typer.Option(..., help="UTC start datetime in ISO-8601, e.g. 2026-02-01T00:00:00Z"),
+    end: str = typer.Option(..., help="UTC end datetime in ISO-8601 (exclusive)."),
+    symbol: str | None = typer.Option(default=None, help="Symbol to replay (default: BML_SYMBOL)."),
+    event_db: str = typer.Option(
+        default="state/live_events.sqlite",
+        help="SQLite path for raw WS events and archived depth snapshots.",
+    ),
+    output: str | None = typer.Option(default=None, help="Optional parquet path for the per-minute replay output."),
+) -> None:
+    """
+    Rebuild per-minute depth features from stored WS depth diffs.
+    """
+    settings = Settings()
+    configure_logging(settings.log_level)
+    start_dt = floor_to_minute(_parse_utc_datetime(start))
+    end_dt = floor_to_minute(_parse_utc_datetime(end))
+    if end_dt <= start_dt:
+        raise typer.BadParameter("end must be after start")
+
+    store = LiveEventStore(Path(event_db).expanduser().resolve())
+    engine = DepthReplayEngine(store, impact_curve_notionals=settings.live_impact_curve_notionals or None)
+    try:
+        minutes, summary = engine.replay_minutes(
+            symbol=symbol or settings.symbol,
+            start_time_ms=int(start_dt.timestamp() * 1000),
+            end_time_ms=int(end_dt.timestamp() * 1000),
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+    if output is not None:
+        output_path = Path(output).expanduser().resolve()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        DepthReplayEngine.to_frame(minutes).write_parquet(output_path)
+        console.print(f"Wrote {len(minutes)} replayed minutes to {output_path}")
+
+    degraded = sum(1 for item in minutes if item.depth_degraded)
+    console.print(
+        "Depth replay complete: "
+        f"symbol={summary.symbol}, "
+        f"events={summary.events_replayed}, "
+        f"minutes={summary.minutes_emitted}, "
+        f"degraded_minutes={degraded}, "
+        f"gaps={summary.gaps}, "
+        f"reanchors={summary.reanchors}, "
+        f"events_per_sec={summary.events_per_second:.0f}"
+    )
+
+
 @app.command("run-once")
 def run_once(
     at: str | None = typer.Option(default=None, help="Optional UTC ISO datetime"),
@@ -324,26 +386,49 @@ def run_live_forever(
     settings = Settings()
     configure_logging(settings.log_level)
 
-    event_store = LiveEventStore(Path(event_db).expanduser().resolve())
-    live_collector = InMemoryLiveCollector(event_store=event_store, symbol=settings.symbol)
-    depth_rest = BinanceRESTClient(
-        base_url=settings.rest_base_url,
-        timeout_seconds=settings.rest_timeout_seconds,
-        retries=settings.rest_max_retries,
-    )
-    live_supervisor = BinanceLiveStreamSupervisor(
-        symbol=settings.symbol,
-        websocket_base_url=settings.websocket_base_url,
-        rest_client=depth_rest,
-        collector=live_collector,
-    )
+    json_codec = JsonCodec(settings.live_json_codec)
+    event_db_path = Path(event_db).expanduser().resolve()
+    event_store = LiveEventStore(event_db_path, codec=json_codec)
+    live_collector: LiveCollector
+    live_supervisor: BinanceLiveStreamSupervisor | None = None
+    ingestion_process: LiveIngestionProcess | None = None
+    feature_ring: FeatureRingBuffer | None = None
+    depth_rest: BinanceRESTClient | None = None
+    if settings.live_process_isolation:
+        ring_path = settings.live_feature_ring_path.expanduser().resolve()
+        feature_ring = FeatureRingBuffer.create(
+            ring_path,
+            slot_count=settings.live_feature_ring_slots,
+            codec=json_codec,
+        )
+        ingestion_process = LiveIngestionProcess(event_db=event_db_path, ring_path=ring_path)
+        live_collector = SharedMemoryLiveCollector(feature_ring, event_store, symbol=settings.symbol)
+    else:
+        in_memory_collector = InMemoryLiveCollector(
+            event_store=event_store,
+            symbol=settings.symbol,
+            impact_curve_notionals=settings.live_impact_curve_notionals or None,
+        )
+        depth_rest = build_rest_client(settings)
+        live_supervisor = build_live_supervisor(
+            settings,
+            collector=in_memory_collector,
+            rest_client=depth_rest,
+            json_codec=json_codec,
+        )
+        live_collector = in_memory_collector
 
     pipeline = MinuteIngestionPipeline(settings=settings, live_collector=live_collector)
     next_cleanup_at = utc_now()
     next_vacuum_at = utc_now()
     try:
-        live_supervisor.start()
+        if ingestion_process is not None:
+            ingestion_process.start()
+        if live_supervisor is not None:
+            live_supervisor.start()
         while True:
+            if ingestion_process is not None and not ingestion_process.ensure_running():
+                console.print("[yellow]Live ingestion process restarted[/yellow]")
             try:
                 summary = pipeline.run_once()
                 console.print(
@@ -389,9 +474,15 @@ def run_live_forever(
                 sleep_seconds = poll_seconds
             time.sleep(sleep_seconds)
     finally:
-        live_supervisor.stop()
+        if live_supervisor is not None:
+            live_supervisor.stop()
+        if ingestion_process is not None:
+            ingestion_process.stop()
+        if feature_ring is not None:
+            feature_ring.close()
         pipeline.close()
-        depth_rest.close()
+        if depth_rest is not None:
+            depth_rest.close()
 
 
 @app.command("inspect-metrics-columns")
@@ -404,7 +495,7 @@ def inspect_metrics_columns(
     symbol_value = (symbol or settings.symbol).upper()
     parsed_date = datetime.strptime(trade_date, "%Y-%m-%d").date()
 
-    vision = VisionClient(base_url=settings.vision_base_url)
+    vision = VisionClient(base_url=settings.vision_base_url, transport=build_http_transport(settings, "vision"))
     try:
         url = vision.build_daily_zip_url("metrics", symbol_value, parsed_date)
         destination = settings.root_dir / ".cache" / f"{symbol_value}-metrics-{trade_date}.zip"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -23,10 +24,38 @@ class Settings(BaseSettings):
     rest_timeout_seconds: int = Field(default=20, ge=1)
     rest_max_retries: int = Field(default=5, ge=1)
     rest_concurrency: int = Field(default=4, ge=1)
+    rest_weight_limit_per_minute: int = Field(default=2400, ge=1)
+    rest_max_in_flight: int = Field(default=16, ge=1)
+    rest_agg_trade_slices: int = Field(default=4, ge=1)
+    rest_alternate_base_urls: list[str] = Field(default_factory=list)
+    rest_hedge_quantile: float | None = Field(default=0.95, gt=0, le=1)
+    http_cassette_mode: Literal["off", "record", "replay"] = Field(default="off")
+    http_cassette_dir: Path = Field(default=Path("./state/http_cassettes"))
+    http_replay_latency_ms: int = Field(default=0, ge=0)
+    http_replay_rate_limit_every: int = Field(default=0, ge=0)
     live_event_retention_hours: int = Field(default=72, ge=1)
     live_heartbeat_retention_days: int = Field(default=14, ge=1)
     live_cleanup_interval_minutes: int = Field(default=30, ge=1)
     live_cleanup_vacuum_interval_hours: int = Field(default=24, ge=1)
+    live_impact_curve_notionals: list[float] = Field(default_factory=list)
+    live_depth_checkpoint_dir: Path = Field(default=Path("./state/depth_checkpoints"))
+    live_depth_checkpoint_interval_seconds: int = Field(default=60, ge=1)
+    live_depth_checkpoint_max_age_seconds: int = Field(default=900, ge=1)
+    live_depth_resync_weight_budget_per_minute: int = Field(default=240, ge=1)
+    live_combined_streams: bool = Field(default=True)
+    live_single_event_loop: bool = Field(default=True)
+    live_json_codec: str = Field(default="auto")
+    live_retain_raw_frames: bool = Field(default=True)
+    live_receive_queue_size: int = Field(default=10_000, ge=0)
+    live_receive_overflow_policy: Literal["block", "drop_oldest", "spill"] = Field(default="block")
+    live_receive_spill_dir: Path = Field(default=Path("./state/ws_spill"))
+    live_agg_trade_backfill_max_gap: int = Field(default=50_000, ge=0)
+    live_redundant_connections: bool = Field(default=False)
+    live_standby_websocket_base_url: str | None = Field(default=None)
+    live_process_isolation: bool = Field(default=False)
+    live_feature_ring_path: Path = Field(default=Path("./state/live_features.ring"))
+    live_feature_ring_slots: int = Field(default=4320, ge=16)
+    live_market_data_streams: bool = Field(default=True)
 
     log_level: str = Field(default="INFO")
 
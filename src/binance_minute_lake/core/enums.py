@@ -20,3 +20,10 @@ class PartitionStatus(str, Enum):
     STAGED = "STAGED"
     COMMITTED = "COMMITTED"
     FAILED = "FAILED"
+
+
+class RestPriority(str, Enum):
+    LIVE_CRITICAL = "LIVE_CRITICAL"
+    LIVE_ENRICHMENT = "LIVE_ENRICHMENT"
+    REPAIR = "REPAIR"
+    BULK_BACKFILL = "BULK_BACKFILL"
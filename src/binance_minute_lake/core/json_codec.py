@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+JSON_CODEC_BACKENDS = ("auto", "orjson", "msgspec", "json")
+JSON_CODEC_TIMING_SAMPLE_EVERY = 64
+
+
+@dataclass(frozen=True, slots=True)
+class JsonCodecStats:
+    backend: str
+    decode_count: int
+    decode_seconds: float
+    encode_count: int
+    encode_seconds: float
+    decode_timed: int = 0
+    encode_timed: int = 0
+
+    @property
+    def decode_us_per_message(self) -> float | None:
+        if self.decode_timed == 0:
+            return None
+        return self.decode_seconds * 1_000_000 / self.decode_timed
+
+    @property
+    def encode_us_per_message(self) -> float | None:
+        if self.encode_timed == 0:
+            return None
+        return self.encode_seconds * 1_000_000 / self.encode_timed
+
+
+@dataclass(slots=True)
+class _CodecCounters:
+    decode_count: int = 0
+    decode_timed: int = 0
+    decode_seconds: float = 0.0
+    encode_count: int = 0
+    encode_timed: int = 0
+    encode_seconds: float = 0.0
+
+
+def _stdlib_backend() -> tuple[Callable[[bytes | str], Any], Callable[[Any], str], tuple[type[Exception], ...]]:
+    def dumps(value: Any) -> str:
+        return json.dumps(value, separators=(",", ":"), sort_keys=True)
+
+    return json.loads, dumps, (ValueError,)
+
+
+def _orjson_backend() -> tuple[Callable[[bytes | str], Any], Callable[[Any], str], tuple[type[Exception], ...]]:
+    import orjson
+
+    def dumps(value: Any) -> str:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+
+    return orjson.loads, dumps, (orjson.JSONDecodeError,)
+
+
+def _msgspec_backend() -> tuple[Callable[[bytes | str], Any], Callable[[Any], str], tuple[type[Exception], ...]]:
+    import msgspec  # type: ignore
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder(order="sorted")
+
+    def dumps(value: Any) -> str:
+        return str(encoder.encode(value).decode("utf-8"))
+
+    return decoder.decode, dumps, (msgspec.DecodeError, ValueError)
+
+
+_BACKEND_LOADERS = {
+    "orjson": _orjson_backend,
+    "msgspec": _msgspec_backend,
+    "json": _stdlib_backend,
+}
+
+
+class JsonCodec:
+    """JSON decode/encode via orjson, msgspec or the stdlib, timing a sample of calls.
+
+    ``auto`` picks the first installed of orjson, msgspec and the stdlib. Decoding accepts bytes
+    directly; encoding is compact with sorted keys, matching the stored ``raw_json`` format.
+    Calls are counted in per-thread counters without locking, and one call in
+    ``timing_sample_every`` is timed (``0`` disables timing).
+    """
+
+    def __init__(self, backend: str = "auto", *, timing_sample_every: int = JSON_CODEC_TIMING_SAMPLE_EVERY) -> None:
+        backend_normalized = backend.strip().lower()
+        if backend_normalized not in JSON_CODEC_BACKENDS:
+            raise ValueError(f"Unsupported JSON codec {backend!r}; expected one of {', '.join(JSON_CODEC_BACKENDS)}")
+
+        candidates = ("orjson", "msgspec", "json") if backend_normalized == "auto" else (backend_normalized,)
+        for candidate in candidates:
+            try:
+                self._loads, self._dumps, self.decode_errors = _BACKEND_LOADERS[candidate]()
+            except ImportError:
+                if backend_normalized != "auto":
+                    raise ValueError(f"JSON codec {candidate!r} is not installed") from None
+                continue
+            self._backend = candidate
+            break
+
+        self._timing_sample_every = max(timing_sample_every, 0)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._counters: list[_CodecCounters] = []
+
+    @property
+    def backend(self) -> str:
+        return self._backend
+
+    def loads(self, data: bytes | str) -> Any:
+        counters = self._thread_counters()
+        counters.decode_count += 1
+        if not self._timing_sample_every or (counters.decode_count - 1) % self._timing_sample_every:
+            return self._loads(data)
+        started = time.perf_counter()
+        try:
+            return self._loads(data)
+        finally:
+            counters.decode_seconds += time.perf_counter() - started
+            counters.decode_timed += 1
+
+    def dumps(self, value: Any) -> str:
+        counters = self._thread_counters()
+        counters.encode_count += 1
+        if not self._timing_sample_every or (counters.encode_count - 1) % self._timing_sample_every:
+            return self._dumps(value)
+        started = time.perf_counter()
+        try:
+            return self._dumps(value)
+        finally:
+            counters.encode_seconds += time.perf_counter() - started
+            counters.encode_timed += 1
+
+    def stats(self) -> JsonCodecStats:
+        # Other threads may be mid-update; totals are read without stopping them.
+        with self._lock:
+            counters = list(self._counters)
+        return JsonCodecStats(
+            backend=self._backend,
+            decode_count=sum(item.decode_count for item in counters),
+            decode_seconds=sum(item.decode_seconds for item in counters),
+            encode_count=sum(item.encode_count for item in counters),
+            encode_seconds=sum(item.encode_seconds for item in counters),
+            decode_timed=sum(item.decode_timed for item in counters),
+            encode_timed=sum(item.encode_timed for item in counters),
+        )
+
+    def _thread_counters(self) -> _CodecCounters:
+        try:
+            return self._local.counters  # type: ignore[no-any-return]
+        except AttributeError:
+            counters = self._local.counters = _CodecCounters()
+            with self._lock:
+                self._counters.append(counters)
+            return counters
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass
+
+import polars as pl
+
+from binance_minute_lake.sources.websocket import (
+    DEPTH_DEGRADED_MIN_AVG_LEVEL_QTY,
+    DEPTH_DEGRADED_SPREAD_MAX_PCT,
+    DEPTH_HEALTH_LEVEL_COUNT,
+    PRICE_IMPACT_NOTIONAL_USDT,
+    DepthBookCheckpoint,
+    DepthOrderBook,
+    DepthSyncError,
+    LiveEventStore,
+    depth_health_degraded,
+    floor_to_minute_ms,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class DepthReplayMinute:
+    timestamp_ms: int
+    event_count: int
+    synced_event_count: int
+    update_id_start: int
+    update_id_end: int
+    price_impact: float | None
+    impact_fillable: bool | None
+    depth_degraded: bool
+    spread_pct: float | None
+    avg_bid_qty: float | None
+    avg_ask_qty: float | None
+    impact_curve_notionals: tuple[float, ...] | None = None
+    buy_impact_curve: tuple[float | None, ...] | None = None
+    sell_impact_curve: tuple[float | None, ...] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class DepthReplaySummary:
+    symbol: str
+    anchor_update_id: int
+    last_update_id: int | None
+    events_replayed: int
+    minutes_emitted: int
+    gaps: int
+    reanchors: int
+    elapsed_seconds: float
+
+    @property
+    def events_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.events_replayed / self.elapsed_seconds
+
+
+@dataclass(slots=True)
+class _ReplayMinuteState:
+    timestamp_ms: int
+    event_count: int = 0
+    synced_event_count: int = 0
+    update_id_start: int | None = None
+    update_id_end: int | None = None
+    sync_broken: bool = False
+
+
+class DepthReplayEngine:
+    """Rebuild per-minute depth features from stored ``ws_depth_events`` diffs.
+
+    Diffs stream from SQLite in ``final_update_id`` order through a ``DepthOrderBook`` anchored on an
+    archived snapshot/checkpoint. Unlike the live collector, book metrics are evaluated once per
+    minute (on the end-of-minute book, which is the value the live path keeps) rather than per diff.
+    """
+
+    def __init__(
+        self,
+        event_store: LiveEventStore,
+        *,
+        impact_notional_usdt: float = PRICE_IMPACT_NOTIONAL_USDT,
+        impact_curve_notionals: Sequence[float] | None = None,
+        health_level_count: int = DEPTH_HEALTH_LEVEL_COUNT,
+        spread_max_pct: float = DEPTH_DEGRADED_SPREAD_MAX_PCT,
+        min_avg_level_qty: float = DEPTH_DEGRADED_MIN_AVG_LEVEL_QTY,
+        batch_size: int = 5_000,
+    ) -> None:
+        self._event_store = event_store
+        self._impact_notional_usdt = float(impact_notional_usdt)
+        self._impact_curve_notionals = tuple(impact_curve_notionals) if impact_curve_notionals else None
+        self._health_level_count = health_level_count
+        self._spread_max_pct = spread_max_pct
+        self._min_avg_level_qty = min_avg_level_qty
+        self._batch_size = batch_size
+
+    def replay(
+        self,
+        *,
+        symbol: str,
+        start_time_ms: int,
+        end_time_ms: int,
+        on_minute: Callable[[DepthReplayMinute], None],
+        checkpoint: DepthBookCheckpoint | None = None,
+    ) -> DepthReplaySummary:
+        symbol_upper = symbol.upper()
+        anchor = checkpoint or self._find_anchor(symbol_upper, start_time_ms)
+        if anchor is None:
+            raise ValueError(f"No stored depth snapshot or checkpoint to anchor a replay for {symbol_upper}")
+
+        started = time.perf_counter()
+        anchored_book = DepthOrderBook()
+        anchored_book.restore_from_checkpoint(anchor)
+        book: DepthOrderBook | None = anchored_book
+
+        events_replayed = 0
+        minutes_emitted = 0
+        gaps = 0
+        reanchors = 0
+        minute: _ReplayMinuteState | None = None
+
+        for event in self._event_store.iter_depth_events(
+            symbol=symbol_upper,
+            after_update_id=anchor.last_update_id,
+            end_event_time_ms=end_time_ms,
+            batch_size=self._batch_size,
+        ):
+            minute_key = floor_to_minute_ms(event.event_time)
+            if minute is None or minute.timestamp_ms != minute_key:
+                if minute is not None and minute.timestamp_ms >= start_time_ms:
+                    on_minute(self._finalize_minute(minute, book))
+                    minutes_emitted += 1
+                minute = _ReplayMinuteState(timestamp_ms=minute_key)
+
+            events_replayed += 1
+            minute.event_count += 1
+            if minute.update_id_start is None or event.first_update_id < minute.update_id_start:
+                minute.update_id_start = event.first_update_id
+            if minute.update_id_end is None or event.final_update_id > minute.update_id_end:
+                minute.update_id_end = event.final_update_id
+
+            if book is None:
+                continue
+            try:
+                book.apply_event(event)
+            except DepthSyncError:
+                gaps += 1
+                minute.sync_broken = True
+                book = self._reanchor(symbol_upper, event.final_update_id)
+                if book is not None:
+                    reanchors += 1
+                continue
+            if book.is_synchronized and not book.degraded:
+                minute.synced_event_count += 1
+
+        if minute is not None and minute.timestamp_ms >= start_time_ms:
+            on_minute(self._finalize_minute(minute, book))
+            minutes_emitted += 1
+
+        summary = DepthReplaySummary(
+            symbol=symbol_upper,
+            anchor_update_id=anchor.last_update_id,
+            last_update_id=book.last_update_id if book is not None else None,
+            events_replayed=events_replayed,
+            minutes_emitted=minutes_emitted,
+            gaps=gaps,
+            reanchors=reanchors,
+            elapsed_seconds=time.perf_counter() - started,
+        )
+        logger.info(
+            "Depth replay complete",
+            extra={
+                "symbol": symbol_upper,
+                "events_replayed": summary.events_replayed,
+                "minutes_emitted": summary.minutes_emitted,
+                "events_per_second": round(summary.events_per_second, 1),
+                "gaps": summary.gaps,
+            },
+        )
+        return summary
+
+    def replay_minutes(
+        self,
+        *,
+        symbol: str,
+        start_time_ms: int,
+        end_time_ms: int,
+        checkpoint: DepthBookCheckpoint | None = None,
+    ) -> tuple[list[DepthReplayMinute], DepthReplaySummary]:
+        minutes: list[DepthReplayMinute] = []
+        summary = self.replay(
+            symbol=symbol,
+            start_time_ms=start_time_ms,
+            end_time_ms=end_time_ms,
+            on_minute=minutes.append,
+            checkpoint=checkpoint,
+        )
+        return minutes, summary
+
+    @staticmethod
+    def to_frame(minutes: list[DepthReplayMinute]) -> pl.DataFrame:
+        if not minutes:
+            return pl.DataFrame({"timestamp": []}, schema={"timestamp": pl.Datetime("ms", "UTC")})
+        return (
+            pl.DataFrame([asdict(item) for item in minutes])
+            .with_columns(
+                pl.from_epoch(pl.col("timestamp_ms"), time_unit="ms").dt.replace_time_zone("UTC").alias("timestamp")
+            )
+            .drop("timestamp_ms")
+            .sort("timestamp")
+        )
+
+    def _find_anchor(self, symbol: str, start_time_ms: int) -> DepthBookCheckpoint | None:
+        anchor = self._event_store.depth_checkpoint_at_or_before(symbol=symbol, timestamp_ms=start_time_ms)
+        if anchor is not None:
+            return anchor
+        return self._event_store.depth_checkpoint_after_update_id(symbol=symbol, update_id=0)
+
+    def _reanchor(self, symbol: str, update_id: int) -> DepthOrderBook | None:
+        anchor = self._event_store.depth_checkpoint_after_update_id(symbol=symbol, update_id=update_id)
+        if anchor is None:
+            logger.warning("Depth replay gap with no later checkpoint", extra={"symbol": symbol, "u": update_id})
+            return None
+        book = DepthOrderBook()
+        book.restore_from_checkpoint(anchor)
+        return book
+
+    def _finalize_minute(self, minute: _ReplayMinuteState, book: DepthOrderBook | None) -> DepthReplayMinute:
+        impact: float | None = None
+        fillable: bool | None = None
+        spread_pct: float | None = None
+        avg_bid_qty: float | None = None
+        avg_ask_qty: float | None = None
+        curve_notionals: tuple[float, ...] | None = None
+        buy_curve: tuple[float | None, ...] | None = None
+        sell_curve: tuple[float | None, ...] | None = None
+
+        book_usable = book is not None and book.is_synchronized and not book.degraded
+        if book is not None and book_usable and minute.synced_event_count > 0:
+            if self._impact_curve_notionals is None:
+                impact, fillable = book.compute_buy_price_impact(self._impact_notional_usdt)
+            else:
+                curve = book.compute_price_impact_curve((*self._impact_curve_notionals, self._impact_notional_usdt))
+                impact, fillable = curve.buy_impact(self._impact_notional_usdt)
+                curve_notionals = curve.notionals_usdt
+                buy_curve = curve.buy_impacts
+                sell_curve = curve.sell_impacts
+            spread_pct, avg_bid_qty, avg_ask_qty = book.compute_health_metrics(level_count=self._health_level_count)
+        elif minute.sync_broken:
+            fillable = False
+
+        degraded = (
+            minute.sync_broken
+            or minute.synced_event_count == 0
+            or fillable is False
+            or depth_health_degraded(
+                spread_pct=spread_pct,
+                avg_bid_qty=avg_bid_qty,
+                avg_ask_qty=avg_ask_qty,
+                spread_max_pct=self._spread_max_pct,
+                min_avg_level_qty=self._min_avg_level_qty,
+            )
+        )
+        return DepthReplayMinute(
+            timestamp_ms=minute.timestamp_ms,
+            event_count=minute.event_count,
+            synced_event_count=minute.synced_event_count,
+            update_id_start=minute.update_id_start if minute.update_id_start is not None else 0,
+            update_id_end=minute.update_id_end if minute.update_id_end is not None else 0,
+            price_impact=impact,
+            impact_fillable=fillable,
+            depth_degraded=degraded,
+            spread_pct=spread_pct,
+            avg_bid_qty=avg_bid_qty,
+            avg_ask_qty=avg_ask_qty,
+            impact_curve_notionals=curve_notionals,
+            buy_impact_curve=buy_curve,
+            sell_impact_curve=sell_curve,
+        )
@@ -1,28 +1,48 @@
 from __future__ import annotations
 
+import contextvars
 import logging
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
+from typing import Any
 
 import polars as pl
 
 from binance_minute_lake.core.config import Settings
-from binance_minute_lake.core.enums import IngestionBand
+from binance_minute_lake.core.enums import IngestionBand, RestPriority
 from binance_minute_lake.core.time_utils import floor_to_hour, floor_to_minute, iter_hours, utc_now
-from binance_minute_lake.sources.rest import BinanceRESTClient
+from binance_minute_lake.sources.history_mirror import HistoryMirror
+from binance_minute_lake.sources.http_cassette import build_http_transport
+from binance_minute_lake.sources.rate_limit import rest_priority
+from binance_minute_lake.sources.rest import build_rest_client
 from binance_minute_lake.sources.vision import VisionClient
 from binance_minute_lake.sources.vision_loader import VisionLoader
-from binance_minute_lake.sources.websocket import LiveCollector, LiveMinuteFeatures
+from binance_minute_lake.sources.websocket import (
+    MINUTE_BAR_BOOK_TICKER,
+    MINUTE_BAR_INDEX_PRICE,
+    MINUTE_BAR_KLINE,
+    MINUTE_BAR_MARK_PRICE,
+    MINUTE_BAR_PREMIUM_INDEX,
+    LiveCollector,
+    LiveMinuteFeatures,
+)
 from binance_minute_lake.state.store import SQLiteStateStore
-from binance_minute_lake.transforms.minute_builder import MinuteTransformEngine
+from binance_minute_lake.transforms.minute_builder import MinuteRecords, MinuteTransformEngine
 from binance_minute_lake.validation.dq import DataQualityError, DQValidator
 from binance_minute_lake.validation.partition_audit import audit_hour_partition_file
 from binance_minute_lake.writer.atomic import AtomicParquetWriter
 
 logger = logging.getLogger(__name__)
 
+KLINE_PAGE_LIMIT = 1500
+AGG_TRADE_PAGE_LIMIT = 1000
+AGG_TRADE_MAX_PAGES = 10_000
+
 
 @dataclass(frozen=True, slots=True)
 class PipelineRunSummary:
@@ -61,6 +81,13 @@ class ConsistencyBackfillSummary:
     issues_remaining: int
 
 
+@dataclass(frozen=True, slots=True)
+class _KlineBatch:
+    start: datetime
+    end: datetime
+    frame: pl.DataFrame
+
+
 class MinuteIngestionPipeline:
     def __init__(
         self,
@@ -71,18 +98,32 @@ class MinuteIngestionPipeline:
         self._state_store = SQLiteStateStore(settings.state_db)
         self._state_store.initialize()
 
-        self._rest = BinanceRESTClient(
-            base_url=settings.rest_base_url,
-            timeout_seconds=settings.rest_timeout_seconds,
-            retries=settings.rest_max_retries,
+        self._rest = build_rest_client(settings, priority=RestPriority.LIVE_ENRICHMENT)
+        self._history = HistoryMirror(settings.state_db, self._rest, settings.symbol)
+        self._vision = VisionClient(
+            base_url=settings.vision_base_url,
+            timeout_seconds=20,
+            transport=build_http_transport(settings, "vision"),
         )
-        self._vision = VisionClient(base_url=settings.vision_base_url, timeout_seconds=20)
         self._vision_loader = VisionLoader(self._vision, cache_dir=settings.root_dir.parent / ".cache" / "vision")
         self._transform = MinuteTransformEngine(max_ffill_minutes=settings.max_ffill_minutes)
         self._writer = AtomicParquetWriter(settings.root_dir, self._state_store, DQValidator())
         self._live_collector = live_collector or LiveCollector()
+        # Independent per-hour REST fetches fan out here; the shared weight limiter still paces them.
+        self._rest_pool = ThreadPoolExecutor(max_workers=settings.rest_concurrency, thread_name_prefix="rest-fanout")
+        # Slices get their own pool: they are submitted from tasks already running on the fan-out pool.
+        self._agg_trade_pool = ThreadPoolExecutor(
+            max_workers=settings.rest_agg_trade_slices,
+            thread_name_prefix="rest-agg-trades",
+        )
+        # While run_until_target catches up, REST klines are fetched once for the whole range and sliced per hour.
+        self._kline_batch_end: datetime | None = None
+        self._kline_batches: dict[str, _KlineBatch] = {}
+        self._kline_batch_lock = threading.Lock()
 
     def close(self) -> None:
+        self._rest_pool.shutdown(wait=True)
+        self._agg_trade_pool.shutdown(wait=True)
         self._rest.close()
         self._vision.close()
 
@@ -149,22 +190,35 @@ class MinuteIngestionPipeline:
         partitions = 0
         current_watermark = watermark
 
-        for hour_start in iter_hours(missing_start, capped_target):
-            hour_end = hour_start + timedelta(minutes=59)
-            window_start = max(missing_start, hour_start)
-            window_end = min(capped_target, hour_end)
-            band = self._choose_band(now_utc=now_utc, window_end=window_end)
-
-            frame = self._collect_and_transform(window_start, window_end, band)
-            if frame.height == 0:
-                raise DataQualityError(
-                    f"No rows produced for window {window_start.isoformat()}..{window_end.isoformat()}"
-                )
+        hours = iter_hours(missing_start, capped_target)
+        if len(hours) > 1:
+            self._kline_batch_end = capped_target + timedelta(minutes=1)
+        try:
+            with self._history.sync_ahead(capped_target + timedelta(minutes=1)):
+                for hour_start in hours:
+                    hour_end = hour_start + timedelta(minutes=59)
+                    window_start = max(missing_start, hour_start)
+                    window_end = min(capped_target, hour_end)
+                    band = self._choose_band(now_utc=now_utc, window_end=window_end)
+                    # Catching up older hours is repair work; only the HOT band feeds live consumers.
+                    priority = RestPriority.LIVE_ENRICHMENT if band == IngestionBand.HOT else RestPriority.REPAIR
+
+                    with rest_priority(priority):
+                        frame = self._collect_and_transform(window_start, window_end, band)
+                    if frame.height == 0:
+                        raise DataQualityError(
+                            f"No rows produced for window {window_start.isoformat()}..{window_end.isoformat()}"
+                        )
 
-            self._writer.write_hour_partition(symbol=self._settings.symbol, hour_start=hour_start, frame=frame)
-            current_watermark = window_end
-            self._state_store.upsert_watermark(self._settings.symbol, current_watermark)
-            partitions += 1
+                    self._writer.write_hour_partition(symbol=self._settings.symbol, hour_start=hour_start, frame=frame)
+                    current_watermark = window_end
+                    self._state_store.upsert_watermark(self._settings.symbol, current_watermark)
+                    partitions += 1
+        finally:
+            with self._kline_batch_lock:
+                self._kline_batch_end = None
+                self._kline_batches.clear()
+            self._rest.rate_limiter.log_priority_metrics()
 
         return PipelineRunSummary(
             symbol=self._settings.symbol,
@@ -258,46 +312,53 @@ class MinuteIngestionPipeline:
         repaired = 0
         failed = 0
 
-        for index, issue in enumerate(target_issues):
-            window_start = max(scan.start_minute, issue.hour_start)
-            window_end = min(scan.end_minute, issue.hour_start + timedelta(minutes=59))
-            band = IngestionBand.COLD if force_cold_band else self._choose_band(now_utc=now_utc, window_end=window_end)
-
-            try:
-                frame = self._collect_and_transform(
-                    window_start,
-                    window_end,
-                    band,
-                    include_rest_enrichment=include_rest_enrichment,
-                    allow_rest_fallback=allow_rest_fallback,
+        with self._history.sync_ahead(scan.end_minute + timedelta(minutes=1)):
+            for index, issue in enumerate(target_issues):
+                window_start = max(scan.start_minute, issue.hour_start)
+                window_end = min(scan.end_minute, issue.hour_start + timedelta(minutes=59))
+                band = (
+                    IngestionBand.COLD
+                    if force_cold_band
+                    else self._choose_band(now_utc=now_utc, window_end=window_end)
                 )
-                expected_rows = int((window_end - window_start).total_seconds() // 60) + 1
-                if frame.height != expected_rows:
-                    raise DataQualityError(
-                        "Unexpected row count for repaired partition: "
-                        f"expected={expected_rows}, actual={frame.height}, "
-                        f"window={window_start.isoformat()}..{window_end.isoformat()}"
+
+                try:
+                    with rest_priority(RestPriority.BULK_BACKFILL):
+                        frame = self._collect_and_transform(
+                            window_start,
+                            window_end,
+                            band,
+                            include_rest_enrichment=include_rest_enrichment,
+                            allow_rest_fallback=allow_rest_fallback,
+                        )
+                    expected_rows = int((window_end - window_start).total_seconds() // 60) + 1
+                    if frame.height != expected_rows:
+                        raise DataQualityError(
+                            "Unexpected row count for repaired partition: "
+                            f"expected={expected_rows}, actual={frame.height}, "
+                            f"window={window_start.isoformat()}..{window_end.isoformat()}"
+                        )
+                    self._writer.write_hour_partition(
+                        symbol=self._settings.symbol,
+                        hour_start=issue.hour_start,
+                        frame=frame,
+                    )
+                    repaired += 1
+                except Exception:
+                    failed += 1
+                    logger.exception(
+                        "Consistency repair failed",
+                        extra={
+                            "symbol": self._settings.symbol,
+                            "hour_start": issue.hour_start.isoformat(),
+                            "reason": issue.reason,
+                        },
                     )
-                self._writer.write_hour_partition(
-                    symbol=self._settings.symbol,
-                    hour_start=issue.hour_start,
-                    frame=frame,
-                )
-                repaired += 1
-            except Exception:
-                failed += 1
-                logger.exception(
-                    "Consistency repair failed",
-                    extra={
-                        "symbol": self._settings.symbol,
-                        "hour_start": issue.hour_start.isoformat(),
-                        "reason": issue.reason,
-                    },
-                )
 
-            if sleep_seconds > 0 and index < len(target_issues) - 1:
-                time.sleep(sleep_seconds)
+                if sleep_seconds > 0 and index < len(target_issues) - 1:
+                    time.sleep(sleep_seconds)
 
+        self._rest.rate_limiter.log_priority_metrics()
         if force_repair:
             issues_remaining = max(len(issues) - repaired, 0)
         elif max_missing_hours is None:
@@ -330,16 +391,37 @@ class MinuteIngestionPipeline:
         window_end_inclusive = window_end + timedelta(minutes=1)
         window_start_ms = int(window_start.timestamp() * 1000)
 
+        # Funding and ratio history do not depend on the band, so they are in flight from the start.
+        funding_future: Future[Any] | None = None
+        ratio_future: Future[Any] | None = None
+        if include_rest_enrichment:
+            funding_future = self._submit_enrichment(
+                "funding_rate",
+                self._history.funding_rates,
+                window_start - timedelta(hours=8),
+                window_end_inclusive,
+            )
+            ratio_future = self._submit_enrichment(
+                "long_short_ratio",
+                self._fetch_ls_ratio_rows,
+                window_start=window_start,
+                window_end=window_end_inclusive,
+            )
+
         if band == IngestionBand.COLD:
             self._log_vision_availability(window_start.date())
-            klines = self._vision_loader.load_klines(self._settings.symbol, window_start, window_end_inclusive)
-            mark_klines = self._vision_loader.load_mark_price_klines(
+            klines: MinuteRecords = self._vision_loader.load_klines(
+                self._settings.symbol, window_start, window_end_inclusive
+            )
+            mark_klines: MinuteRecords = self._vision_loader.load_mark_price_klines(
                 self._settings.symbol, window_start, window_end_inclusive
             )
-            index_klines = self._vision_loader.load_index_price_klines(
+            index_klines: MinuteRecords = self._vision_loader.load_index_price_klines(
+                self._settings.symbol, window_start, window_end_inclusive
+            )
+            agg_trades: MinuteRecords = self._vision_loader.load_agg_trades(
                 self._settings.symbol, window_start, window_end_inclusive
             )
-            agg_trades = self._vision_loader.load_agg_trades(self._settings.symbol, window_start, window_end_inclusive)
             book_ticker_snapshots = self._vision_loader.load_book_ticker(
                 self._settings.symbol, window_start, window_end_inclusive
             )
@@ -380,7 +462,7 @@ class MinuteIngestionPipeline:
                         )
             if allow_rest_fallback:
                 if not klines:
-                    klines = self._rest.fetch_klines(self._settings.symbol, window_start, window_end_inclusive)
+                    klines = self._rest_kline_frame(MINUTE_BAR_KLINE, window_start, window_end_inclusive)
                 if not agg_trades:
                     agg_trades = self._fetch_agg_trades_live_or_rest(
                         window_start,
@@ -388,101 +470,104 @@ class MinuteIngestionPipeline:
                         allow_rest_fallback=True,
                     )
                 if not mark_klines:
-                    mark_klines = self._rest.fetch_mark_price_klines(
-                        self._settings.symbol, window_start, window_end_inclusive
-                    )
+                    mark_klines = self._rest_kline_frame(MINUTE_BAR_MARK_PRICE, window_start, window_end_inclusive)
                 if not index_klines:
-                    index_klines = self._rest.fetch_index_price_klines(
-                        self._settings.symbol, window_start, window_end_inclusive
-                    )
+                    index_klines = self._rest_kline_frame(MINUTE_BAR_INDEX_PRICE, window_start, window_end_inclusive)
         else:
-            klines = self._rest.fetch_klines(self._settings.symbol, window_start, window_end_inclusive)
-            mark_klines = self._rest.fetch_mark_price_klines(
-                self._settings.symbol, window_start, window_end_inclusive
+            # Stream-built minutes come first; REST only fills minutes the live collector is missing.
+            # Every fetch below is independent, so they run concurrently on the REST pool.
+            klines_future = self._submit_in_context(
+                self._rest_pool,
+                self._live_minute_rows_or_rest,
+                MINUTE_BAR_KLINE,
+                window_start,
+                window_end_inclusive,
             )
-            index_klines = self._rest.fetch_index_price_klines(
-                self._settings.symbol, window_start, window_end_inclusive
+            mark_klines_future = self._submit_in_context(
+                self._rest_pool,
+                self._live_minute_rows_or_rest,
+                MINUTE_BAR_MARK_PRICE,
+                window_start,
+                window_end_inclusive,
             )
-            agg_trades = self._fetch_agg_trades_live_or_rest(
+            index_klines_future = self._submit_in_context(
+                self._rest_pool,
+                self._live_minute_rows_or_rest,
+                MINUTE_BAR_INDEX_PRICE,
+                window_start,
+                window_end_inclusive,
+            )
+            agg_trades_future = self._submit_in_context(
+                self._rest_pool,
+                self._fetch_agg_trades_live_or_rest,
                 window_start,
                 window_end_inclusive,
                 allow_rest_fallback=(band == IngestionBand.HOT),
             )
-            # Anchor snapshots to window_start so forward-fill can populate the full hour window.
-            book_ticker_snapshots = []
-            try:
-                ticker_snapshot = self._rest.fetch_book_ticker(self._settings.symbol)
+            book_ticker_snapshots = self._live_collector.minute_bars_for_window(
+                symbol=self._settings.symbol,
+                kind=MINUTE_BAR_BOOK_TICKER,
+                start_time=window_start,
+                end_time=window_end_inclusive,
+            )
+            ticker_future = (
+                None
+                if book_ticker_snapshots
+                else self._submit_enrichment("book_ticker", self._rest.fetch_book_ticker, self._settings.symbol)
+            )
+            premium_snapshots = self._live_collector.minute_bars_for_window(
+                symbol=self._settings.symbol,
+                kind=MINUTE_BAR_PREMIUM_INDEX,
+                start_time=window_start,
+                end_time=window_end_inclusive,
+            )
+            premium_future: Future[Any] | None = None
+            oi_future: Future[Any] | None = None
+            if include_rest_enrichment:
+                if not premium_snapshots:
+                    premium_future = self._submit_enrichment(
+                        "premium_index", self._rest.fetch_premium_index, self._settings.symbol
+                    )
+                oi_future = self._submit_enrichment(
+                    "open_interest", self._rest.fetch_open_interest, self._settings.symbol
+                )
+
+            klines = klines_future.result()
+            mark_klines = mark_klines_future.result()
+            index_klines = index_klines_future.result()
+            agg_trades = agg_trades_future.result()
+            if ticker_future is not None and (ticker_snapshot := ticker_future.result()) is not None:
+                # Anchor snapshots to window_start so forward-fill can populate the full hour window.
                 ticker_snapshot["event_time"] = window_start_ms
                 book_ticker_snapshots = [ticker_snapshot]
-            except Exception:
-                logger.warning(
-                    "Optional REST enrichment unavailable",
-                    extra={"symbol": self._settings.symbol, "enrichment": "book_ticker"},
-                )
+            if premium_future is not None and (premium_snapshot := premium_future.result()) is not None:
+                premium_snapshot["event_time"] = window_start_ms
+                premium_snapshots = [premium_snapshot]
 
             metrics_rows = []
-            premium_snapshots = []
-            if include_rest_enrichment:
-                try:
-                    premium_snapshot = self._rest.fetch_premium_index(self._settings.symbol)
-                    premium_snapshot["event_time"] = window_start_ms
-                    premium_snapshots = [premium_snapshot]
-                except Exception:
-                    logger.warning(
-                        "Optional REST enrichment unavailable",
-                        extra={"symbol": self._settings.symbol, "enrichment": "premium_index"},
-                    )
-
-                try:
-                    oi_snapshot = self._rest.fetch_open_interest(self._settings.symbol)
-                    mark_price = (
-                        float(premium_snapshots[0]["mark_price"])
-                        if premium_snapshots and premium_snapshots[0].get("mark_price") is not None
-                        else None
-                    )
-                    oi_contracts = float(oi_snapshot["open_interest"])
-                    oi_value_usdt = oi_contracts * mark_price if mark_price is not None else None
-                    metrics_rows = [
-                        {
-                            "create_time": window_start_ms,
-                            "oi_contracts": oi_contracts,
-                            "oi_value_usdt": oi_value_usdt,
-                        }
-                    ]
-                except Exception:
-                    logger.warning(
-                        "Optional REST enrichment unavailable",
-                        extra={"symbol": self._settings.symbol, "enrichment": "open_interest"},
-                    )
+            if oi_future is not None and (oi_snapshot := oi_future.result()) is not None:
+                mark_price = (
+                    float(premium_snapshots[-1]["mark_price"])
+                    if premium_snapshots and premium_snapshots[-1].get("mark_price") is not None
+                    else None
+                )
+                oi_contracts = float(oi_snapshot["open_interest"])
+                oi_value_usdt = oi_contracts * mark_price if mark_price is not None else None
+                metrics_rows = [
+                    {
+                        "create_time": window_start_ms,
+                        "oi_contracts": oi_contracts,
+                        "oi_value_usdt": oi_value_usdt,
+                    }
+                ]
 
         funding_rates: list[dict[str, object]] = []
-        if include_rest_enrichment:
-            try:
-                funding_rates = self._rest.fetch_funding_rate(
-                    self._settings.symbol,
-                    start_time=window_start - timedelta(hours=8),
-                    end_time=window_end_inclusive,
-                    limit=1000,
-                )
-                funding_rates = self._seed_funding_rates_for_window(funding_rates, window_start, window_end)
-            except Exception:
-                logger.warning(
-                    "Optional REST enrichment unavailable",
-                    extra={"symbol": self._settings.symbol, "enrichment": "funding_rate"},
-                )
+        if funding_future is not None and (funding_rows := funding_future.result()) is not None:
+            funding_rates = self._seed_funding_rates_for_window(funding_rows, window_start, window_end)
         top_trader_ratio_rows: list[dict[str, object]] = []
         global_ratio_rows: list[dict[str, object]] = []
-        if include_rest_enrichment:
-            try:
-                top_trader_ratio_rows, global_ratio_rows = self._fetch_ls_ratio_rows(
-                    window_start=window_start,
-                    window_end=window_end_inclusive,
-                )
-            except Exception:
-                logger.warning(
-                    "Optional REST enrichment unavailable",
-                    extra={"symbol": self._settings.symbol, "enrichment": "long_short_ratio"},
-                )
+        if ratio_future is not None and (ratio_rows := ratio_future.result()) is not None:
+            top_trader_ratio_rows, global_ratio_rows = ratio_rows
         live_points = self._live_points(window_start, window_end)
 
         return self._transform.build_canonical_frame(
@@ -501,6 +586,26 @@ class MinuteIngestionPipeline:
             live_features=live_points,
         )
 
+    @staticmethod
+    def _submit_in_context(pool: ThreadPoolExecutor, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future[Any]:
+        """Submit ``fn`` with a copy of the caller's context, so its REST calls keep the caller's priority."""
+        return pool.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+    def _submit_enrichment(self, enrichment: str, fetch: Callable[..., Any], *args: Any, **kwargs: Any) -> Future[Any]:
+        """Run an optional REST enrichment on the pool; its future resolves to ``None`` on failure."""
+
+        def _run() -> Any:
+            try:
+                return fetch(*args, **kwargs)
+            except Exception:
+                logger.warning(
+                    "Optional REST enrichment unavailable",
+                    extra={"symbol": self._settings.symbol, "enrichment": enrichment},
+                )
+                return None
+
+        return self._submit_in_context(self._rest_pool, _run)
+
     @staticmethod
     def _seed_funding_rates_for_window(
         funding_rates: list[dict[str, object]],
@@ -536,35 +641,50 @@ class MinuteIngestionPipeline:
         self,
         window_start: datetime,
         window_end: datetime,
-    ) -> list[dict[str, object]]:
-        all_rows: list[dict[str, object]] = []
-        cursor = window_start
+    ) -> pl.DataFrame:
+        """REST aggTrades for the window, fetched as ``rest_agg_trade_slices`` time slices in parallel.
+
+        Each slice is paged by ``fromId``; slices are stitched and deduplicated by agg trade id.
+        """
+        start_ms = int(window_start.timestamp() * 1000)
+        end_ms = int(window_end.timestamp() * 1000)
+        slice_count = max(1, min(self._settings.rest_agg_trade_slices, end_ms - start_ms + 1))
+        bounds = [start_ms + (end_ms - start_ms + 1) * index // slice_count for index in range(slice_count + 1)]
+        slices = [(bounds[index], bounds[index + 1] - 1) for index in range(slice_count)]
+
+        if slice_count == 1:
+            pages = [self._fetch_agg_trade_slice(start_ms, end_ms)]
+        else:
+            futures = [
+                self._submit_in_context(self._agg_trade_pool, self._fetch_agg_trade_slice, *bound)
+                for bound in slices
+            ]
+            pages = [future.result() for future in futures]
+        return pl.concat(pages, how="vertical").unique(subset=["agg_trade_id"], keep="first").sort("agg_trade_id")
 
-        for _ in range(10_000):
-            batch = self._rest.fetch_agg_trades(
+    def _fetch_agg_trade_slice(self, start_ms: int, end_ms: int) -> pl.DataFrame:
+        first = self._rest.fetch_agg_trades_frame(
+            symbol=self._settings.symbol,
+            start_time=datetime.fromtimestamp(start_ms / 1000, tz=UTC),
+            end_time=datetime.fromtimestamp(end_ms / 1000, tz=UTC),
+            limit=AGG_TRADE_PAGE_LIMIT,
+        )
+        pages = [first]
+        page = first
+        for _ in range(AGG_TRADE_MAX_PAGES):
+            if page.height < AGG_TRADE_PAGE_LIMIT:
+                break
+            # Ids are gapless and ordered, so fromId resumes exactly where the last page stopped.
+            page = self._rest.fetch_agg_trades_frame_from_id(
                 symbol=self._settings.symbol,
-                start_time=cursor,
-                end_time=window_end,
-                limit=1000,
+                from_id=int(page["agg_trade_id"][-1]) + 1,
+                limit=AGG_TRADE_PAGE_LIMIT,
             )
-            if not batch:
+            in_slice = page.filter(pl.col("transact_time") <= end_ms)
+            pages.append(in_slice)
+            if in_slice.height < page.height:
                 break
-
-            all_rows.extend(batch)
-            last_transact_ms = int(batch[-1]["transact_time"])
-            next_cursor = datetime.fromtimestamp(last_transact_ms / 1000, tz=UTC) + timedelta(milliseconds=1)
-            if next_cursor >= window_end:
-                break
-            if next_cursor <= cursor:
-                break
-            cursor = next_cursor
-
-            if len(batch) < 1000:
-                break
-            # soften burst rate against REST 429 limits
-            time.sleep(0.05)
-
-        return all_rows
+        return pl.concat(pages, how="vertical")
 
     def _fetch_agg_trades_live_or_rest(
         self,
@@ -572,7 +692,7 @@ class MinuteIngestionPipeline:
         window_end: datetime,
         *,
         allow_rest_fallback: bool,
-    ) -> list[dict[str, object]]:
+    ) -> MinuteRecords:
         live_rows = self._live_collector.agg_trades_for_window(
             symbol=self._settings.symbol,
             start_time=window_start,
@@ -584,28 +704,94 @@ class MinuteIngestionPipeline:
             return []
         return self._fetch_agg_trades_paginated(window_start, window_end)
 
-    def _fetch_ls_ratio_rows(
+    def _live_minute_rows_or_rest(
         self,
-        *,
+        kind: str,
         window_start: datetime,
         window_end: datetime,
-        period: str = "5m",
-    ) -> tuple[list[dict[str, object]], list[dict[str, object]]]:
-        ratio_window_start = window_start - timedelta(minutes=30)
-        top_trader = self._rest.fetch_top_trader_long_short_account_ratio(
+    ) -> MinuteRecords:
+        live_rows = self._live_collector.minute_bars_for_window(
             symbol=self._settings.symbol,
-            period=period,
-            start_time=ratio_window_start,
+            kind=kind,
+            start_time=window_start,
             end_time=window_end,
-            limit=500,
         )
-        global_ratio = self._rest.fetch_global_long_short_account_ratio(
-            symbol=self._settings.symbol,
-            period=period,
-            start_time=ratio_window_start,
-            end_time=window_end,
-            limit=500,
+        expected_minutes = int((window_end - window_start).total_seconds() // 60)
+        if live_rows and len(live_rows) >= expected_minutes:
+            return live_rows
+
+        rest_frame = self._rest_kline_frame(kind, window_start, window_end)
+        if not live_rows:
+            return rest_frame
+        live_frame = pl.DataFrame(live_rows, schema=rest_frame.schema)
+        gap_frame = rest_frame.filter(~pl.col("open_time").is_in(live_frame["open_time"].implode()))
+        logger.info(
+            "Filled live minute gaps from REST",
+            extra={"symbol": self._settings.symbol, "kind": kind, "live": len(live_rows), "rest": gap_frame.height},
         )
+        return pl.concat([live_frame, gap_frame], how="vertical").sort("open_time")
+
+    def _rest_kline_frame(self, kind: str, window_start: datetime, window_end: datetime) -> pl.DataFrame:
+        """REST klines for ``[window_start, window_end]``, sliced from a range batch during catch-up."""
+        fetch = {
+            MINUTE_BAR_KLINE: self._rest.fetch_klines_frame,
+            MINUTE_BAR_MARK_PRICE: self._rest.fetch_mark_price_klines_frame,
+            MINUTE_BAR_INDEX_PRICE: self._rest.fetch_index_price_klines_frame,
+        }[kind]
+        with self._kline_batch_lock:
+            batch_end = self._kline_batch_end
+            batch = self._kline_batches.get(kind)
+        if batch_end is None or batch_end < window_end:
+            return fetch(self._settings.symbol, window_start, window_end)
+
+        if batch is None or not (batch.start <= window_start and window_end <= batch.end):
+            batch = self._fetch_kline_batch(fetch, window_start, batch_end)
+            with self._kline_batch_lock:
+                if self._kline_batch_end is not None:
+                    self._kline_batches[kind] = batch
+            logger.info(
+                "Fetched REST kline batch",
+                extra={
+                    "symbol": self._settings.symbol,
+                    "kind": kind,
+                    "start": batch.start.isoformat(),
+                    "end": batch.end.isoformat(),
+                    "rows": batch.frame.height,
+                },
+            )
+
+        start_ms = int(window_start.timestamp() * 1000)
+        end_ms = int(window_end.timestamp() * 1000)
+        return batch.frame.filter(pl.col("open_time").is_between(start_ms, end_ms))
+
+    def _fetch_kline_batch(
+        self,
+        fetch: Callable[..., pl.DataFrame],
+        start: datetime,
+        end: datetime,
+    ) -> _KlineBatch:
+        pages: list[pl.DataFrame] = []
+        cursor = start
+        while cursor <= end:
+            page = fetch(self._settings.symbol, cursor, end, limit=KLINE_PAGE_LIMIT)
+            pages.append(page)
+            if page.height < KLINE_PAGE_LIMIT:
+                break
+            next_cursor = datetime.fromtimestamp(int(page["open_time"][-1]) / 1000, tz=UTC) + timedelta(minutes=1)
+            if next_cursor <= cursor:
+                break
+            cursor = next_cursor
+        return _KlineBatch(start=start, end=end, frame=pl.concat(pages, how="vertical"))
+
+    def _fetch_ls_ratio_rows(
+        self,
+        *,
+        window_start: datetime,
+        window_end: datetime,
+    ) -> tuple[list[dict[str, object]], list[dict[str, object]]]:
+        ratio_window_start = window_start - timedelta(minutes=30)
+        top_trader = self._history.top_trader_ratios(ratio_window_start, window_end)
+        global_ratio = self._history.global_ratios(ratio_window_start, window_end)
         return top_trader, global_ratio
 
     def _live_points(self, start: datetime, end: datetime) -> list[LiveMinuteFeatures]:
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from binance_minute_lake.core.time_utils import utc_now
+from binance_minute_lake.sources.rest import BinanceRESTClient
+
+logger = logging.getLogger(__name__)
+
+HISTORY_FUNDING_RATE = "funding_rate"
+HISTORY_TOP_TRADER_RATIO = "top_trader_long_short_account_ratio"
+HISTORY_GLOBAL_RATIO = "global_long_short_account_ratio"
+HISTORY_SETTLE_SECONDS = 600
+_MAX_PAGES_PER_SYNC = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryMirrorMetrics:
+    local_reads: int
+    rest_pages: int
+    rows_stored: int
+
+
+@dataclass(frozen=True, slots=True)
+class _HistorySeries:
+    name: str
+    time_field: str
+    page_limit: int
+    fetch: Callable[[datetime, datetime, int], list[dict[str, Any]]]
+
+
+def _ms_to_datetime(value_ms: int) -> datetime:
+    return datetime.fromtimestamp(value_ms / 1000, tz=UTC)
+
+
+class HistoryMirror:
+    """Local SQLite copy of low-frequency REST history: funding rates and long/short ratios.
+
+    Each series remembers the contiguous range it has synced, so reads only download what lies
+    outside it. Points newer than ``settle_seconds`` are re-read on every call because Binance
+    may still publish them; everything older is served from disk.
+
+    Extending a series forward pages ahead to the settle horizon in one sync, or only up to the
+    bound set with :meth:`sync_ahead`, so an hour-by-hour backfill reads later hours from disk.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        rest: BinanceRESTClient,
+        symbol: str,
+        *,
+        settle_seconds: int = HISTORY_SETTLE_SECONDS,
+        clock: Callable[[], datetime] = utc_now,
+    ) -> None:
+        self._db_path = db_path
+        self._symbol = symbol.upper()
+        self._settle = timedelta(seconds=settle_seconds)
+        self._clock = clock
+        self._series = {
+            series.name: series
+            for series in (
+                _HistorySeries(
+                    name=HISTORY_FUNDING_RATE,
+                    time_field="funding_time",
+                    page_limit=1000,
+                    fetch=lambda start, end, limit: rest.fetch_funding_rate(
+                        self._symbol, start_time=start, end_time=end, limit=limit
+                    ),
+                ),
+                _HistorySeries(
+                    name=HISTORY_TOP_TRADER_RATIO,
+                    time_field="data_time",
+                    page_limit=500,
+                    fetch=lambda start, end, limit: rest.fetch_top_trader_long_short_account_ratio(
+                        self._symbol, period="5m", start_time=start, end_time=end, limit=limit
+                    ),
+                ),
+                _HistorySeries(
+                    name=HISTORY_GLOBAL_RATIO,
+                    time_field="data_time",
+                    page_limit=500,
+                    fetch=lambda start, end, limit: rest.fetch_global_long_short_account_ratio(
+                        self._symbol, period="5m", start_time=start, end_time=end, limit=limit
+                    ),
+                ),
+            )
+        }
+        self._locks = {name: threading.Lock() for name in self._series}
+        self._sync_ahead_ms: int | None = None
+        self._metrics_lock = threading.Lock()
+        self._local_reads = 0
+        self._rest_pages = 0
+        self._rows_stored = 0
+
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS history_points (
+                    series TEXT NOT NULL,
+                    symbol TEXT NOT NULL,
+                    ts INTEGER NOT NULL,
+                    row_json TEXT NOT NULL,
+                    PRIMARY KEY (series, symbol, ts)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS history_coverage (
+                    series TEXT NOT NULL,
+                    symbol TEXT NOT NULL,
+                    synced_from INTEGER NOT NULL,
+                    synced_until INTEGER NOT NULL,
+                    PRIMARY KEY (series, symbol)
+                )
+                """
+            )
+            conn.commit()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self._db_path, timeout=30.0)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @contextmanager
+    def sync_ahead(self, until: datetime) -> Iterator[None]:
+        """Bound forward page-ahead to ``until`` (e.g. a backfill target) instead of the settle horizon."""
+        previous = self._sync_ahead_ms
+        self._sync_ahead_ms = int(until.timestamp() * 1000)
+        try:
+            yield
+        finally:
+            self._sync_ahead_ms = previous
+
+    def funding_rates(self, start_time: datetime, end_time: datetime) -> list[dict[str, Any]]:
+        return self.rows(HISTORY_FUNDING_RATE, start_time, end_time)
+
+    def top_trader_ratios(self, start_time: datetime, end_time: datetime) -> list[dict[str, Any]]:
+        return self.rows(HISTORY_TOP_TRADER_RATIO, start_time, end_time)
+
+    def global_ratios(self, start_time: datetime, end_time: datetime) -> list[dict[str, Any]]:
+        return self.rows(HISTORY_GLOBAL_RATIO, start_time, end_time)
+
+    def rows(self, series_name: str, start_time: datetime, end_time: datetime) -> list[dict[str, Any]]:
+        """Rows of ``series_name`` in ``[start_time, end_time]``, syncing uncovered ranges first."""
+        series = self._series[series_name]
+        start_ms = int(start_time.timestamp() * 1000)
+        end_ms = int(end_time.timestamp() * 1000)
+        with self._locks[series.name]:
+            self._sync(series, start_ms, end_ms)
+        with self._connect() as conn:
+            stored = conn.execute(
+                """
+                SELECT row_json FROM history_points
+                WHERE series = ? AND symbol = ? AND ts BETWEEN ? AND ?
+                ORDER BY ts
+                """,
+                (series.name, self._symbol, start_ms, end_ms),
+            ).fetchall()
+        with self._metrics_lock:
+            self._local_reads += 1
+        return [json.loads(row[0]) for row in stored]
+
+    def metrics(self) -> HistoryMirrorMetrics:
+        with self._metrics_lock:
+            return HistoryMirrorMetrics(
+                local_reads=self._local_reads,
+                rest_pages=self._rest_pages,
+                rows_stored=self._rows_stored,
+            )
+
+    def _sync(self, series: _HistorySeries, start_ms: int, end_ms: int) -> None:
+        with self._connect() as conn:
+            coverage = conn.execute(
+                "SELECT synced_from, synced_until FROM history_coverage WHERE series = ? AND symbol = ?",
+                (series.name, self._symbol),
+            ).fetchone()
+
+        # Only ranges older than the settle horizon count as covered; newer points may still change.
+        settled_ms = int((self._clock() - self._settle).timestamp() * 1000)
+        ahead_ms = settled_ms if self._sync_ahead_ms is None else min(settled_ms, self._sync_ahead_ms)
+        fetch_until_ms = max(end_ms, ahead_ms)
+
+        # A page-capped forward download only covers what it actually stored.
+        if coverage is None:
+            fetched_until_ms = self._download(series, start_ms, fetch_until_ms)
+            if start_ms > settled_ms:
+                return
+            new_from, new_until = start_ms, min(fetched_until_ms, settled_ms)
+        else:
+            synced_from, synced_until = int(coverage[0]), int(coverage[1])
+            if start_ms < synced_from:
+                self._download(series, start_ms, synced_from - 1)
+            fetched_until_ms = synced_until
+            if end_ms > synced_until:
+                fetched_until_ms = self._download(series, synced_until + 1, fetch_until_ms)
+            new_from = min(synced_from, start_ms)
+            new_until = max(synced_until, min(fetched_until_ms, settled_ms))
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO history_coverage(series, symbol, synced_from, synced_until)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(series, symbol) DO UPDATE SET
+                    synced_from = excluded.synced_from,
+                    synced_until = excluded.synced_until
+                """,
+                (series.name, self._symbol, new_from, new_until),
+            )
+            conn.commit()
+
+    def _download(self, series: _HistorySeries, start_ms: int, end_ms: int) -> int:
+        """Download ``start_ms..end_ms`` and return the last timestamp actually covered."""
+        cursor_ms = start_ms
+        for _ in range(_MAX_PAGES_PER_SYNC):
+            page = series.fetch(_ms_to_datetime(cursor_ms), _ms_to_datetime(end_ms), series.page_limit)
+            with self._metrics_lock:
+                self._rest_pages += 1
+                self._rows_stored += len(page)
+            if page:
+                with self._connect() as conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO history_points(series, symbol, ts, row_json) VALUES (?, ?, ?, ?)",
+                        [
+                            (series.name, self._symbol, int(row[series.time_field]), json.dumps(row, sort_keys=True))
+                            for row in page
+                        ],
+                    )
+                    conn.commit()
+            if len(page) < series.page_limit:
+                return end_ms
+            next_cursor_ms = max(int(row[series.time_field]) for row in page) + 1
+            if next_cursor_ms <= cursor_ms or next_cursor_ms > end_ms:
+                return end_ms
+            cursor_ms = next_cursor_ms
+        logger.warning(
+            "History mirror sync hit the page cap",
+            extra={"series": series.name, "symbol": self._symbol, "cursor_ms": cursor_ms, "end_ms": end_ms},
+        )
+        return cursor_ms - 1
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+from binance_minute_lake.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+# Bodies are stored decoded, so headers describing the wire encoding must not be replayed.
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection"})
+
+
+class CassetteMissError(LookupError):
+    """A replayed request has no recorded response."""
+
+
+@dataclass(frozen=True, slots=True)
+class CassetteMetrics:
+    replayed: int
+    misses: int
+    simulated_rate_limits: int
+
+
+def cassette_key(request: httpx.Request) -> str:
+    """Stable key of a request: method, URL with sorted query params and any ``Range`` header."""
+    params = sorted(request.url.params.multi_items())
+    url = request.url.copy_with(query=None)
+    material = json.dumps(
+        [request.method, str(url), params, request.headers.get("Range")],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class CassetteStore:
+    """Recorded responses on disk: ``<key>.json`` holds status and headers, ``<key>.body`` the body."""
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def save(self, request: httpx.Request, response: httpx.Response, body: bytes) -> None:
+        key = cassette_key(request)
+        self._root.mkdir(parents=True, exist_ok=True)
+        headers = [(name, value) for name, value in response.headers.multi_items() if name.lower() not in _WIRE_HEADERS]
+        meta = {"method": request.method, "url": str(request.url), "status": response.status_code, "headers": headers}
+        (self._root / f"{key}.body").write_bytes(body)
+        (self._root / f"{key}.json").write_text(json.dumps(meta, sort_keys=True), encoding="utf-8")
+
+    def load(self, request: httpx.Request) -> httpx.Response | None:
+        key = cassette_key(request)
+        meta_path = self._root / f"{key}.json"
+        if not meta_path.exists():
+            return None
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        return httpx.Response(
+            status_code=int(meta["status"]),
+            headers=[(str(name), str(value)) for name, value in meta["headers"]],
+            content=(self._root / f"{key}.body").read_bytes(),
+            request=request,
+        )
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Forward requests to a real transport and write every response to the cassette store."""
+
+    def __init__(self, store: CassetteStore, inner: httpx.BaseTransport | None = None) -> None:
+        self._store = store
+        self._inner = inner or httpx.HTTPTransport()
+        self._lock = threading.Lock()
+        self._recorded = 0
+
+    @property
+    def recorded(self) -> int:
+        with self._lock:
+            return self._recorded
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._inner.handle_request(request)
+        try:
+            body = response.read()
+        finally:
+            response.close()
+        self._store.save(request, response, body)
+        with self._lock:
+            self._recorded += 1
+        headers = [(name, value) for name, value in response.headers.multi_items() if name.lower() not in _WIRE_HEADERS]
+        return httpx.Response(status_code=response.status_code, headers=headers, content=body, request=request)
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """Serve recorded responses, optionally with added latency and injected 429s.
+
+    ``latency_seconds`` is slept before each response. With ``rate_limit_every=N`` every Nth
+    request is answered with a 429 and ``Retry-After: 0`` instead, exercising the retry path
+    without spending exchange weight. A request that was never recorded raises
+    :class:`CassetteMissError`, so an incomplete cassette fails loudly rather than silently.
+    """
+
+    def __init__(
+        self,
+        store: CassetteStore,
+        *,
+        latency_seconds: float = 0.0,
+        rate_limit_every: int = 0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._store = store
+        self._latency_seconds = max(0.0, latency_seconds)
+        self._rate_limit_every = max(0, rate_limit_every)
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._replayed = 0
+        self._misses = 0
+        self._simulated_rate_limits = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self._requests += 1
+            rate_limited = self._rate_limit_every > 0 and self._requests % self._rate_limit_every == 0
+        if self._latency_seconds > 0:
+            self._sleep(self._latency_seconds)
+
+        if rate_limited:
+            with self._lock:
+                self._simulated_rate_limits += 1
+            return httpx.Response(
+                status_code=429,
+                headers={"Retry-After": "0"},
+                json={"code": -1003, "msg": "Simulated rate limit"},
+                request=request,
+            )
+
+        response = self._store.load(request)
+        if response is None:
+            with self._lock:
+                self._misses += 1
+            raise CassetteMissError(f"No recorded response for {request.method} {request.url}")
+        with self._lock:
+            self._replayed += 1
+        return response
+
+    def metrics(self) -> CassetteMetrics:
+        with self._lock:
+            return CassetteMetrics(
+                replayed=self._replayed,
+                misses=self._misses,
+                simulated_rate_limits=self._simulated_rate_limits,
+            )
+
+
+def build_http_transport(settings: Settings, name: str) -> httpx.BaseTransport | None:
+    """Transport for ``settings.http_cassette_mode``; ``name`` separates REST and Vision cassettes."""
+    if settings.http_cassette_mode == "off":
+        return None
+    store = CassetteStore(settings.http_cassette_dir / name)
+    logger.info(
+        "Using HTTP cassette transport",
+        extra={"mode": settings.http_cassette_mode, "cassette_dir": str(store.root)},
+    )
+    if settings.http_cassette_mode == "record":
+        return RecordingTransport(store)
+    return ReplayTransport(
+        store,
+        latency_seconds=settings.http_replay_latency_ms / 1000.0,
+        rate_limit_every=settings.http_replay_rate_limit_every,
+    )
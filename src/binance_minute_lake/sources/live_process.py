@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+import logging
+import mmap
+import multiprocessing
+import struct
+import threading
+from dataclasses import asdict
+from datetime import datetime
+from multiprocessing.synchronize import Event as ProcessEvent
+from pathlib import Path
+from typing import Any
+
+from binance_minute_lake.core.config import Settings
+from binance_minute_lake.core.json_codec import JsonCodec
+from binance_minute_lake.core.logging import configure_logging
+from binance_minute_lake.sources.rest import BinanceRESTClient, build_rest_client
+from binance_minute_lake.sources.websocket import (
+    MINUTE_MS,
+    BinanceLiveStreamSupervisor,
+    DepthCheckpointStore,
+    InMemoryLiveCollector,
+    LiveCollector,
+    LiveEventStore,
+    LiveMinuteFeatures,
+    floor_to_minute_ms,
+    now_ms,
+)
+
+logger = logging.getLogger(__name__)
+
+FEATURE_RING_MAGIC = b"BMLRING1"
+FEATURE_RING_SLOTS = 4320
+FEATURE_RING_SLOT_SIZE = 4096
+_HEADER = struct.Struct("<8sIIQ")
+_SLOT_HEADER = struct.Struct("<QqI")
+_TUPLE_FIELDS = ("impact_curve_notionals", "buy_impact_curve", "sell_impact_curve")
+
+
+class FeatureRingBuffer:
+    """Memory-mapped, direct-mapped ring of per-minute ``LiveMinuteFeatures``.
+
+    Minute ``m`` always lives in slot ``(m // 60_000) % slot_count``, so re-publishing a minute
+    overwrites it in place and readers locate it without scanning. Each slot is guarded by a
+    sequence counter (odd while a write is in progress); there is exactly one writer process.
+    """
+
+    def __init__(self, path: Path, *, codec: JsonCodec | None = None) -> None:
+        self._path = path
+        self._codec = codec or JsonCodec()
+        self._file = path.open("r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, slot_count, slot_size, _ = _HEADER.unpack_from(self._map, 0)
+        if magic != FEATURE_RING_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a feature ring buffer")
+        self._slot_count = int(slot_count)
+        self._slot_size = int(slot_size)
+
+    @classmethod
+    def create(
+        cls,
+        path: Path,
+        *,
+        slot_count: int = FEATURE_RING_SLOTS,
+        slot_size: int = FEATURE_RING_SLOT_SIZE,
+        codec: JsonCodec | None = None,
+    ) -> FeatureRingBuffer:
+        """Create (or reset) the ring file and map it."""
+        if slot_size <= _SLOT_HEADER.size:
+            raise ValueError(f"slot_size must exceed {_SLOT_HEADER.size} bytes")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as handle:
+            handle.write(_HEADER.pack(FEATURE_RING_MAGIC, slot_count, slot_size, 0))
+            handle.truncate(_HEADER.size + slot_count * slot_size)
+        return cls(path, codec=codec)
+
+    @property
+    def slot_count(self) -> int:
+        return self._slot_count
+
+    @property
+    def publish_count(self) -> int:
+        return int(_HEADER.unpack_from(self._map, 0)[3])
+
+    def close(self) -> None:
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def publish(self, features: LiveMinuteFeatures) -> bool:
+        payload = self._codec.dumps(asdict(features)).encode("utf-8")
+        if len(payload) > self._slot_size - _SLOT_HEADER.size:
+            logger.warning(
+                "Minute features exceed the ring slot size",
+                extra={"minute": features.timestamp_ms, "bytes": len(payload), "slot_size": self._slot_size},
+            )
+            return False
+
+        offset = self._slot_offset(features.timestamp_ms)
+        sequence = int(_SLOT_HEADER.unpack_from(self._map, offset)[0])
+        writing = sequence + 1 if sequence % 2 == 0 else sequence + 2
+        _SLOT_HEADER.pack_into(self._map, offset, writing, features.timestamp_ms, len(payload))
+        body = offset + _SLOT_HEADER.size
+        self._map[body : body + len(payload)] = payload
+        struct.pack_into("<Q", self._map, offset, writing + 1)
+
+        magic, slot_count, slot_size, published = _HEADER.unpack_from(self._map, 0)
+        _HEADER.pack_into(self._map, 0, magic, slot_count, slot_size, published + 1)
+        return True
+
+    def read(self, minute_timestamp_ms: int, *, attempts: int = 3) -> LiveMinuteFeatures | None:
+        minute_key = floor_to_minute_ms(minute_timestamp_ms)
+        offset = self._slot_offset(minute_key)
+        body = offset + _SLOT_HEADER.size
+        for _ in range(attempts):
+            sequence, slot_minute, length = _SLOT_HEADER.unpack_from(self._map, offset)
+            if sequence == 0:
+                return None
+            if sequence % 2 == 1:
+                continue
+            payload = bytes(self._map[body : body + length])
+            if int(_SLOT_HEADER.unpack_from(self._map, offset)[0]) != sequence:
+                continue
+            if slot_minute != minute_key:
+                return None
+            return _decode_features(self._codec.loads(payload))
+        return None
+
+    def _slot_offset(self, minute_timestamp_ms: int) -> int:
+        slot = floor_to_minute_ms(minute_timestamp_ms) // MINUTE_MS % self._slot_count
+        return _HEADER.size + slot * self._slot_size
+
+
+def _decode_features(values: dict[str, Any]) -> LiveMinuteFeatures:
+    for name in _TUPLE_FIELDS:
+        if values.get(name) is not None:
+            values[name] = tuple(values[name])
+    return LiveMinuteFeatures(**values)
+
+
+class LiveFeaturePublisher:
+    """Copy the collector's current and recent minutes into a ``FeatureRingBuffer`` once per interval."""
+
+    def __init__(
+        self,
+        collector: LiveCollector,
+        ring: FeatureRingBuffer,
+        *,
+        interval_seconds: float = 1.0,
+        lookback_minutes: int = 2,
+    ) -> None:
+        self._collector = collector
+        self._ring = ring
+        self._interval_seconds = interval_seconds
+        self._lookback_minutes = max(lookback_minutes, 1)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_loop, name="live-feature-publisher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        self.publish_recent()
+
+    def publish_recent(self, at_ms: int | None = None) -> int:
+        current_minute = floor_to_minute_ms(at_ms if at_ms is not None else now_ms())
+        published = 0
+        for back in range(self._lookback_minutes, -1, -1):
+            features = self._collector.snapshot_for_minute(current_minute - back * MINUTE_MS)
+            if features is not None and self._ring.publish(features):
+                published += 1
+        return published
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.wait(self._interval_seconds):
+            try:
+                self.publish_recent()
+            except Exception:
+                logger.exception("Live feature publish failed")
+
+
+class SharedMemoryLiveCollector(LiveCollector):
+    """Pipeline-side collector that reads minutes published by a ``LiveIngestionProcess``.
+
+    Minutes missing from the ring (e.g. published before a restart) are rebuilt from the shared
+    SQLite event store, which also serves aggTrade windows.
+    """
+
+    def __init__(self, ring: FeatureRingBuffer, event_store: LiveEventStore, *, symbol: str) -> None:
+        self._ring = ring
+        self._event_store = event_store
+        self._symbol = symbol.upper()
+
+    def snapshot_for_minute(self, minute_timestamp_ms: int) -> LiveMinuteFeatures | None:
+        features = self._ring.read(minute_timestamp_ms)
+        if features is not None:
+            return features
+        return self._event_store.snapshot_for_minute(minute_timestamp_ms=minute_timestamp_ms, symbol=self._symbol)
+
+    def agg_trades_for_window(
+        self,
+        *,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> list[dict[str, object]]:
+        return self._event_store.agg_trades_for_window(
+            symbol=symbol,
+            start_timestamp_ms=int(start_time.timestamp() * 1000),
+            end_timestamp_ms=int(end_time.timestamp() * 1000),
+        )
+
+    def minute_bars_for_window(
+        self,
+        *,
+        symbol: str,
+        kind: str,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> list[dict[str, object]]:
+        return self._event_store.minute_bars_for_window(
+            symbol=symbol,
+            kind=kind,
+            start_timestamp_ms=int(start_time.timestamp() * 1000),
+            end_timestamp_ms=int(end_time.timestamp() * 1000),
+        )
+
+
+def build_live_supervisor(
+    settings: Settings,
+    *,
+    collector: InMemoryLiveCollector,
+    rest_client: BinanceRESTClient,
+    json_codec: JsonCodec,
+) -> BinanceLiveStreamSupervisor:
+    return BinanceLiveStreamSupervisor(
+        symbol=settings.symbol,
+        websocket_base_url=settings.websocket_base_url,
+        rest_client=rest_client,
+        collector=collector,
+        checkpoint_store=DepthCheckpointStore(settings.live_depth_checkpoint_dir.expanduser().resolve()),
+        checkpoint_interval_seconds=settings.live_depth_checkpoint_interval_seconds,
+        checkpoint_max_age_seconds=settings.live_depth_checkpoint_max_age_seconds,
+        resync_weight_budget_per_minute=settings.live_depth_resync_weight_budget_per_minute,
+        combined_streams=settings.live_combined_streams,
+        single_event_loop=settings.live_single_event_loop,
+        json_codec=json_codec,
+        retain_raw_frames=settings.live_retain_raw_frames,
+        receive_queue_size=settings.live_receive_queue_size,
+        receive_overflow_policy=settings.live_receive_overflow_policy,
+        receive_spill_dir=settings.live_receive_spill_dir.expanduser().resolve(),
+        agg_trade_backfill_max_gap=settings.live_agg_trade_backfill_max_gap,
+        redundant_connections=settings.live_redundant_connections,
+        standby_websocket_base_url=settings.live_standby_websocket_base_url,
+        market_data_streams=settings.live_market_data_streams,
+    )
+
+
+def run_live_ingestion_process(event_db: str, ring_path: str, stop_event: ProcessEvent) -> None:
+    """Child-process entry point: WS ingestion, book maintenance and SQLite writes, publishing to the ring."""
+    settings = Settings()
+    configure_logging(settings.log_level)
+
+    json_codec = JsonCodec(settings.live_json_codec)
+    event_store = LiveEventStore(Path(event_db), codec=json_codec)
+    collector = InMemoryLiveCollector(
+        event_store=event_store,
+        symbol=settings.symbol,
+        impact_curve_notionals=settings.live_impact_curve_notionals or None,
+    )
+    rest_client = build_rest_client(settings)
+    ring = FeatureRingBuffer(Path(ring_path), codec=json_codec)
+    supervisor = build_live_supervisor(settings, collector=collector, rest_client=rest_client, json_codec=json_codec)
+    publisher = LiveFeaturePublisher(collector, ring)
+    try:
+        supervisor.start()
+        publisher.start()
+        stop_event.wait()
+    finally:
+        supervisor.stop()
+        publisher.stop()
+        ring.close()
+        rest_client.close()
+
+
+class LiveIngestionProcess:
+    """Run ``BinanceLiveStreamSupervisor`` in a spawned process so the pipeline never holds its GIL."""
+
+    def __init__(self, *, event_db: Path, ring_path: Path) -> None:
+        self._event_db = event_db
+        self._ring_path = ring_path
+        self._context = multiprocessing.get_context("spawn")
+        self._stop_event = self._context.Event()
+        self._process: Any = None
+
+    def start(self) -> None:
+        if self.is_alive():
+            return
+        self._stop_event.clear()
+        self._process = self._context.Process(
+            target=run_live_ingestion_process,
+            args=(str(self._event_db), str(self._ring_path), self._stop_event),
+            name="live-ingestion",
+            daemon=True,
+        )
+        self._process.start()
+
+    def is_alive(self) -> bool:
+        return self._process is not None and bool(self._process.is_alive())
+
+    def ensure_running(self) -> bool:
+        """Restart the child if it exited; returns ``False`` when a restart was needed."""
+        if self.is_alive():
+            return True
+        exit_code = self._process.exitcode if self._process is not None else None
+        logger.warning("Live ingestion process not running; restarting", extra={"exit_code": exit_code})
+        self.start()
+        return False
+
+    def stop(self, timeout_seconds: float = 15.0) -> None:
+        self._stop_event.set()
+        if self._process is None:
+            return
+        self._process.join(timeout=timeout_seconds)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join(timeout=5.0)
+        self._process = None
@@ -0,0 +1,541 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from binance_minute_lake.core.config import Settings
+from binance_minute_lake.core.enums import RestPriority
+
+logger = logging.getLogger(__name__)
+
+REST_WEIGHT_LIMIT_PER_MINUTE = 2_400
+REST_WEIGHT_HEADROOM = 0.9
+USED_WEIGHT_HEADER = "X-MBX-USED-WEIGHT-1M"
+REST_MAX_IN_FLIGHT = 16
+REST_AIMD_RATE_INCREASE = 0.02
+REST_AIMD_DECREASE_FACTOR = 0.5
+REST_AIMD_MIN_RATE_FACTOR = 0.05
+REST_AIMD_DECREASE_COOLDOWN_SECONDS = 1.0
+REST_BAN_DEFAULT_SECONDS = 120.0
+
+# Share of the bucket each class must leave untouched, so lower classes only spend spare weight.
+REST_PRIORITY_RESERVE = {
+    RestPriority.LIVE_CRITICAL: 0.0,
+    RestPriority.LIVE_ENRICHMENT: 0.1,
+    RestPriority.REPAIR: 0.3,
+    RestPriority.BULK_BACKFILL: 0.5,
+}
+_PRIORITY_ORDER = tuple(RestPriority)
+_PRIORITY_YIELD_SECONDS = 0.05
+_TOKEN_EPSILON = 1e-6
+
+_current_priority: ContextVar[RestPriority | None] = ContextVar("rest_priority", default=None)
+
+
+@contextmanager
+def rest_priority(priority: RestPriority) -> Iterator[None]:
+    """Run REST calls made in this context (and contexts copied from it) under ``priority``."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_rest_priority() -> RestPriority | None:
+    return _current_priority.get()
+
+
+_KLINE_PATHS = frozenset(
+    {
+        "/fapi/v1/klines",
+        "/fapi/v1/markPriceKlines",
+        "/fapi/v1/indexPriceKlines",
+        "/fapi/v1/continuousKlines",
+        "/fapi/v1/premiumIndexKlines",
+    }
+)
+_FIXED_WEIGHTS = {
+    "/fapi/v1/aggTrades": 20,
+    "/fapi/v1/ticker/bookTicker": 2,
+    "/fapi/v1/premiumIndex": 1,
+    "/fapi/v1/openInterest": 1,
+    "/fapi/v1/fundingRate": 1,
+}
+
+
+def depth_snapshot_weight(limit: int) -> int:
+    """REST request weight of ``/fapi/v1/depth`` for a given ``limit``."""
+    if limit <= 50:
+        return 2
+    if limit <= 100:
+        return 5
+    if limit <= 500:
+        return 10
+    return 20
+
+
+def kline_request_weight(limit: int) -> int:
+    """REST request weight of the kline endpoints for a given ``limit``."""
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+def rest_request_weight(path: str, params: Mapping[str, Any]) -> int:
+    """Binance USD-M request weight of ``path``; unknown endpoints count as 1."""
+    if path in _KLINE_PATHS:
+        return kline_request_weight(int(params.get("limit", 500)))
+    if path == "/fapi/v1/depth":
+        return depth_snapshot_weight(int(params.get("limit", 500)))
+    return _FIXED_WEIGHTS.get(path, 1)
+
+
+@dataclass(frozen=True, slots=True)
+class RestPriorityMetrics:
+    priority: RestPriority
+    requests: int
+    waits: int
+    wait_seconds: float
+    max_wait_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimiterMetrics:
+    requests: int
+    weight_acquired: int
+    waits: int
+    wait_seconds: float
+    server_used_weight: int | None
+    priorities: tuple[RestPriorityMetrics, ...] = ()
+    rate_factor: float = 1.0
+    concurrency_limit: float = float(REST_MAX_IN_FLIGHT)
+    in_flight: int = 0
+    throttles: int = 0
+    bans: int = 0
+    paused_seconds_remaining: float = 0.0
+
+
+@dataclass(slots=True)
+class _PriorityCounters:
+    requests: int = 0
+    waits: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+@dataclass(slots=True)
+class _BucketState:
+    tokens: float
+    updated_at: float
+    rate_factor: float = 1.0
+    paused_until: float = 0.0
+    decreased_at: float = 0.0
+
+
+class _LocalBucketStore:
+    def __init__(self, capacity: float, clock: Callable[[], float]) -> None:
+        self._lock = threading.Lock()
+        self._state = _BucketState(tokens=capacity, updated_at=clock())
+
+    @contextmanager
+    def transaction(self) -> Iterator[_BucketState]:
+        with self._lock:
+            yield self._state
+
+
+class _SQLiteBucketStore:
+    """Bucket state in one SQLite row, updated under ``BEGIN IMMEDIATE`` so processes serialize."""
+
+    def __init__(self, db_path: Path, name: str, capacity: float, clock: Callable[[], float]) -> None:
+        self._db_path = db_path
+        self._name = name
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS rest_weight_bucket (
+                    name TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    rate_factor REAL NOT NULL DEFAULT 1.0,
+                    paused_until REAL NOT NULL DEFAULT 0.0,
+                    decreased_at REAL NOT NULL DEFAULT 0.0
+                )
+                """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(rest_weight_bucket)")}
+            for column, default in (("rate_factor", 1.0), ("paused_until", 0.0), ("decreased_at", 0.0)):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE rest_weight_bucket ADD COLUMN {column} REAL NOT NULL DEFAULT {default}")
+            conn.execute(
+                "INSERT OR IGNORE INTO rest_weight_bucket (name, tokens, updated_at) VALUES (?, ?, ?)",
+                (name, capacity, clock()),
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self._db_path, timeout=30.0, isolation_level=None)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[_BucketState]:
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    """
+                    SELECT tokens, updated_at, rate_factor, paused_until, decreased_at
+                    FROM rest_weight_bucket WHERE name = ?
+                    """,
+                    (self._name,),
+                ).fetchone()
+                state = _BucketState(*(float(value) for value in row))
+                yield state
+                conn.execute(
+                    """
+                    UPDATE rest_weight_bucket
+                    SET tokens = ?, updated_at = ?, rate_factor = ?, paused_until = ?, decreased_at = ?
+                    WHERE name = ?
+                    """,
+                    (
+                        state.tokens,
+                        state.updated_at,
+                        state.rate_factor,
+                        state.paused_until,
+                        state.decreased_at,
+                        self._name,
+                    ),
+                )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+
+class RestWeightLimiter:
+    """Token bucket over Binance REST request weight, shared by every client holding it.
+
+    The bucket refills at ``weight_limit_per_minute * headroom`` per minute. With ``state_path``
+    its state lives in SQLite, so separate processes on the same host draw from one budget.
+    ``X-MBX-USED-WEIGHT-1M`` readings lower the bucket when the server has seen more usage than
+    this limiter accounted for (other hosts, other tools on the same IP).
+
+    Each acquire runs under a :class:`RestPriority`: lower classes must leave their
+    ``REST_PRIORITY_RESERVE`` share of the bucket untouched (across processes too), and within a
+    process they also stand back while a higher class is waiting.
+
+    Pacing adapts to server feedback (AIMD): every success nudges the refill rate and the
+    in-flight limit up additively, every 429/418 halves both. A 418 (or a 429 with
+    ``Retry-After``) also pauses the shared bucket, so every caller waits out the ban.
+    """
+
+    def __init__(
+        self,
+        weight_limit_per_minute: int = REST_WEIGHT_LIMIT_PER_MINUTE,
+        *,
+        headroom: float = REST_WEIGHT_HEADROOM,
+        state_path: Path | None = None,
+        name: str = "default",
+        max_in_flight: int = REST_MAX_IN_FLIGHT,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._capacity = max(1.0, float(weight_limit_per_minute) * min(max(headroom, 0.01), 1.0))
+        self._refill_per_second = self._capacity / 60.0
+        self._clock = clock
+        self._sleep = sleep
+        self._store: _LocalBucketStore | _SQLiteBucketStore
+        if state_path is None:
+            self._store = _LocalBucketStore(self._capacity, clock)
+        else:
+            self._store = _SQLiteBucketStore(state_path, name, self._capacity, clock)
+
+        self._metrics_lock = threading.Lock()
+        self._requests = 0
+        self._weight_acquired = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._server_used_weight: int | None = None
+        self._waiting = dict.fromkeys(_PRIORITY_ORDER, 0)
+        self._priority_counters = {priority: _PriorityCounters() for priority in _PRIORITY_ORDER}
+        self._throttles = 0
+        self._bans = 0
+
+        self._max_in_flight = float(max(1, max_in_flight))
+        self._concurrency_limit = self._max_in_flight
+        self._concurrency_decreased_at = float("-inf")
+        self._in_flight = 0
+        self._slots = threading.Condition()
+
+    @property
+    def capacity(self) -> float:
+        return self._capacity
+
+    @property
+    def max_in_flight(self) -> int:
+        return int(self._max_in_flight)
+
+    def _refill(self, state: _BucketState, now: float) -> None:
+        elapsed = max(0.0, now - state.updated_at)
+        state.tokens = min(self._capacity, state.tokens + elapsed * self._refill_per_second * state.rate_factor)
+        state.updated_at = now
+
+    def try_acquire(self, weight: int, priority: RestPriority | None = None) -> float:
+        """Take ``weight`` tokens if available; otherwise return the seconds until they will be.
+
+        ``priority`` defaults to the context's :func:`rest_priority`, else live-critical.
+        """
+        resolved = priority or current_rest_priority() or RestPriority.LIVE_CRITICAL
+        cost = min(float(max(weight, 0)), self._capacity)
+        reserve = self._capacity * REST_PRIORITY_RESERVE[resolved]
+        needed = min(cost + reserve, self._capacity)
+        with self._store.transaction() as state:
+            now = self._clock()
+            if state.paused_until > now:
+                return state.paused_until - now
+            self._refill(state, now)
+            # Tolerate float residue so a wait computed from the refill rate always suffices.
+            if state.tokens + _TOKEN_EPSILON >= needed:
+                state.tokens = max(0.0, state.tokens - cost)
+                return 0.0
+            return (needed - state.tokens) / (self._refill_per_second * state.rate_factor)
+
+    def acquire(self, weight: int, priority: RestPriority | None = None) -> float:
+        """Block until ``weight`` tokens are taken; returns the seconds spent waiting."""
+        resolved = priority or current_rest_priority() or RestPriority.LIVE_CRITICAL
+        rank = _PRIORITY_ORDER.index(resolved)
+        waited = 0.0
+        with self._metrics_lock:
+            self._waiting[resolved] += 1
+        try:
+            while True:
+                if self._higher_priority_waiting(rank):
+                    wait = _PRIORITY_YIELD_SECONDS
+                else:
+                    wait = self.try_acquire(weight, resolved)
+                    if wait <= 0.0:
+                        break
+                self._sleep(wait)
+                waited += wait
+        finally:
+            with self._metrics_lock:
+                self._waiting[resolved] -= 1
+
+        with self._metrics_lock:
+            self._requests += 1
+            self._weight_acquired += max(weight, 0)
+            counters = self._priority_counters[resolved]
+            counters.requests += 1
+            if waited > 0.0:
+                self._waits += 1
+                self._wait_seconds += waited
+                counters.waits += 1
+                counters.wait_seconds += waited
+                counters.max_wait_seconds = max(counters.max_wait_seconds, waited)
+        return waited
+
+    def _higher_priority_waiting(self, rank: int) -> bool:
+        with self._metrics_lock:
+            return any(self._waiting[priority] > 0 for priority in _PRIORITY_ORDER[:rank])
+
+    def observe_used_weight(self, used_weight: int) -> None:
+        """Reconcile with the server's ``X-MBX-USED-WEIGHT-1M`` count for the current minute."""
+        with self._metrics_lock:
+            self._server_used_weight = used_weight
+        remaining = self._capacity - float(used_weight)
+        with self._store.transaction() as state:
+            self._refill(state, self._clock())
+            if state.tokens > remaining:
+                state.tokens = remaining
+
+    def observe_headers(self, headers: Mapping[str, str]) -> None:
+        used_weight = self._parse_used_weight(headers)
+        if used_weight is not None:
+            self.observe_used_weight(used_weight)
+
+    @staticmethod
+    def _parse_used_weight(headers: Mapping[str, str]) -> int | None:
+        raw_value = headers.get(USED_WEIGHT_HEADER)
+        if raw_value is None:
+            return None
+        try:
+            return int(raw_value)
+        except ValueError:
+            logger.debug("Ignoring malformed used-weight header", extra={"value": raw_value})
+            return None
+
+    def observe_response(
+        self,
+        status_code: int,
+        headers: Mapping[str, str],
+        retry_after_seconds: float | None = None,
+    ) -> None:
+        """Feed one response back: reconcile used weight and adapt rate and concurrency (AIMD)."""
+        used_weight = self._parse_used_weight(headers)
+        throttled = status_code in (418, 429)
+        with self._metrics_lock:
+            if used_weight is not None:
+                self._server_used_weight = used_weight
+            if status_code == 418:
+                self._bans += 1
+            elif status_code == 429:
+                self._throttles += 1
+
+        pause_seconds = retry_after_seconds
+        if status_code == 418 and pause_seconds is None:
+            pause_seconds = REST_BAN_DEFAULT_SECONDS
+        with self._store.transaction() as state:
+            now = self._clock()
+            self._refill(state, now)
+            if used_weight is not None:
+                state.tokens = min(state.tokens, self._capacity - float(used_weight))
+            if throttled:
+                # One decrease per cooldown, so a burst of concurrent 429s halves the rate only once.
+                if now - state.decreased_at >= REST_AIMD_DECREASE_COOLDOWN_SECONDS:
+                    state.rate_factor = max(REST_AIMD_MIN_RATE_FACTOR, state.rate_factor * REST_AIMD_DECREASE_FACTOR)
+                    state.decreased_at = now
+                state.tokens = min(state.tokens, 0.0)
+                if pause_seconds is not None:
+                    state.paused_until = max(state.paused_until, now + pause_seconds)
+            elif status_code < 400:
+                state.rate_factor = min(1.0, state.rate_factor + REST_AIMD_RATE_INCREASE)
+            rate_factor = state.rate_factor
+            paused_until = state.paused_until
+
+        with self._slots:
+            if throttled:
+                monotonic_now = time.monotonic()
+                if monotonic_now - self._concurrency_decreased_at >= REST_AIMD_DECREASE_COOLDOWN_SECONDS:
+                    self._concurrency_limit = max(1.0, self._concurrency_limit * REST_AIMD_DECREASE_FACTOR)
+                    self._concurrency_decreased_at = monotonic_now
+            elif status_code < 400:
+                increased = self._concurrency_limit + 1.0 / self._concurrency_limit
+                self._concurrency_limit = min(self._max_in_flight, increased)
+            self._slots.notify_all()
+
+        if status_code == 418:
+            logger.error(
+                "Binance REST IP ban; pausing every REST caller until it expires",
+                extra={"pause_seconds": pause_seconds, "paused_until": paused_until, "rate_factor": rate_factor},
+            )
+        elif throttled:
+            logger.warning(
+                "Binance REST rate limit hit; backing off shared pacing",
+                extra={"retry_after_seconds": retry_after_seconds, "rate_factor": rate_factor},
+            )
+
+    @contextmanager
+    def request_slot(self) -> Iterator[None]:
+        """Hold one of the adaptive in-flight slots for the duration of a request."""
+        self.acquire_request_slot()
+        try:
+            yield
+        finally:
+            self.release_request_slot()
+
+    def acquire_request_slot(self) -> None:
+        """Block until an in-flight slot is free and take it; pair with :meth:`release_request_slot`."""
+        with self._slots:
+            while self._in_flight >= max(1, int(self._concurrency_limit)):
+                self._slots.wait()
+            self._in_flight += 1
+
+    def try_request_slot(self) -> bool:
+        """Like :meth:`acquire_request_slot`, but return ``False`` instead of waiting."""
+        with self._slots:
+            if self._in_flight >= max(1, int(self._concurrency_limit)):
+                return False
+            self._in_flight += 1
+            return True
+
+    def release_request_slot(self) -> None:
+        with self._slots:
+            self._in_flight -= 1
+            self._slots.notify_all()
+
+    def metrics(self) -> RateLimiterMetrics:
+        with self._store.transaction() as state:
+            rate_factor = state.rate_factor
+            paused_seconds_remaining = max(0.0, state.paused_until - self._clock())
+        with self._slots:
+            concurrency_limit = self._concurrency_limit
+            in_flight = self._in_flight
+        with self._metrics_lock:
+            return RateLimiterMetrics(
+                requests=self._requests,
+                weight_acquired=self._weight_acquired,
+                waits=self._waits,
+                wait_seconds=self._wait_seconds,
+                server_used_weight=self._server_used_weight,
+                priorities=tuple(
+                    RestPriorityMetrics(
+                        priority=priority,
+                        requests=counters.requests,
+                        waits=counters.waits,
+                        wait_seconds=counters.wait_seconds,
+                        max_wait_seconds=counters.max_wait_seconds,
+                    )
+                    for priority, counters in self._priority_counters.items()
+                ),
+                rate_factor=rate_factor,
+                concurrency_limit=concurrency_limit,
+                in_flight=in_flight,
+                throttles=self._throttles,
+                bans=self._bans,
+                paused_seconds_remaining=paused_seconds_remaining,
+            )
+
+    def log_priority_metrics(self) -> None:
+        """Log request counts and queue wait per priority class that has seen traffic."""
+        for metrics in self.metrics().priorities:
+            if metrics.requests == 0:
+                continue
+            logger.info(
+                "REST weight queue wait",
+                extra={
+                    "priority": metrics.priority.value,
+                    "requests": metrics.requests,
+                    "waits": metrics.waits,
+                    "wait_seconds": round(metrics.wait_seconds, 3),
+                    "max_wait_seconds": round(metrics.max_wait_seconds, 3),
+                },
+            )
+
+
+_shared_limiters: dict[tuple[Path, str], RestWeightLimiter] = {}
+_shared_limiters_lock = threading.Lock()
+
+
+def build_rest_weight_limiter(settings: Settings) -> RestWeightLimiter:
+    """Limiter over the state DB, so every client and process of this lake shares one budget.
+
+    Clients in the same process also share one instance, and with it the in-flight limit.
+    """
+    key = (settings.state_db.resolve(), settings.rest_base_url)
+    with _shared_limiters_lock:
+        limiter = _shared_limiters.get(key)
+        if limiter is None:
+            limiter = RestWeightLimiter(
+                settings.rest_weight_limit_per_minute,
+                state_path=settings.state_db,
+                name=settings.rest_base_url,
+                max_in_flight=settings.rest_max_in_flight,
+            )
+            _shared_limiters[key] = limiter
+        return limiter
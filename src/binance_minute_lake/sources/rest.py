@@ -1,18 +1,145 @@
 from __future__ import annotations
 
 import logging
+import math
 import random
+import threading
 import time
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
 from typing import Any
 
 import httpx
+import polars as pl
+
+from binance_minute_lake.core.config import Settings
+from binance_minute_lake.core.enums import RestPriority
+from binance_minute_lake.sources.http_cassette import build_http_transport
+from binance_minute_lake.sources.rate_limit import (
+    RestWeightLimiter,
+    build_rest_weight_limiter,
+    current_rest_priority,
+    rest_request_weight,
+)
 
 logger = logging.getLogger(__name__)
 
+REST_HEDGE_QUANTILE = 0.95
+REST_HEDGE_MIN_SAMPLES = 20
+REST_HEDGE_MIN_DELAY_SECONDS = 0.05
+REST_LATENCY_WINDOW = 256
+REST_HOST_FAILURE_THRESHOLD = 3
+REST_HOST_COOLDOWN_SECONDS = 30.0
+
+# Fixed schemas of the columnar ``fetch_*_frame`` APIs, matching the keys of the row-dict variants.
+KLINE_FRAME_SCHEMA: dict[str, pl.DataType] = {
+    "open_time": pl.Int64(),
+    "open": pl.Float64(),
+    "high": pl.Float64(),
+    "low": pl.Float64(),
+    "close": pl.Float64(),
+    "volume_btc": pl.Float64(),
+    "close_time": pl.Int64(),
+    "volume_usdt": pl.Float64(),
+    "trade_count": pl.Int64(),
+    "taker_buy_vol_btc": pl.Float64(),
+    "taker_buy_vol_usdt": pl.Float64(),
+}
+MARK_PRICE_KLINE_FRAME_SCHEMA: dict[str, pl.DataType] = {
+    "open_time": pl.Int64(),
+    "mark_price_open": pl.Float64(),
+    "mark_price_high": pl.Float64(),
+    "mark_price_low": pl.Float64(),
+    "mark_price_close": pl.Float64(),
+}
+INDEX_PRICE_KLINE_FRAME_SCHEMA: dict[str, pl.DataType] = {
+    "open_time": pl.Int64(),
+    "index_price_open": pl.Float64(),
+    "index_price_high": pl.Float64(),
+    "index_price_low": pl.Float64(),
+    "index_price_close": pl.Float64(),
+}
+AGG_TRADE_FRAME_SCHEMA: dict[str, pl.DataType] = {
+    "agg_trade_id": pl.Int64(),
+    "price": pl.Float64(),
+    "qty": pl.Float64(),
+    "first_trade_id": pl.Int64(),
+    "last_trade_id": pl.Int64(),
+    "transact_time": pl.Int64(),
+    "is_buyer_maker": pl.Boolean(),
+}
+_AGG_TRADE_WIRE_SCHEMA: dict[str, pl.DataType] = {
+    "a": pl.Int64(),
+    "p": pl.String(),
+    "q": pl.String(),
+    "f": pl.Int64(),
+    "l": pl.Int64(),
+    "T": pl.Int64(),
+    "m": pl.Boolean(),
+}
+
+
+def _kline_array_frame(payload: list[list[Any]], schema: dict[str, pl.DataType]) -> pl.DataFrame:
+    """Parse kline arrays column by column; ``schema`` names the leading positional fields in order."""
+    if not payload:
+        return pl.DataFrame(schema=schema)
+    columns = list(zip(*payload, strict=False))
+    return pl.DataFrame(
+        [pl.Series(name, columns[position]).cast(dtype) for position, (name, dtype) in enumerate(schema.items())]
+    )
+
+
+def _agg_trade_payload_frame(payload: list[dict[str, Any]]) -> pl.DataFrame:
+    if not payload:
+        return pl.DataFrame(schema=AGG_TRADE_FRAME_SCHEMA)
+    return pl.from_dicts(payload, schema=_AGG_TRADE_WIRE_SCHEMA).select(
+        pl.col(wire).cast(dtype).alias(name)
+        for wire, (name, dtype) in zip(_AGG_TRADE_WIRE_SCHEMA, AGG_TRADE_FRAME_SCHEMA.items(), strict=True)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class RestHostMetrics:
+    base_url: str
+    requests: int
+    failures: int
+    excluded: bool
+
+
+@dataclass(frozen=True, slots=True)
+class RestHedgeMetrics:
+    hedged_requests: int
+    hedge_wins: int
+    hedge_delay_seconds: float | None
+    hosts: tuple[RestHostMetrics, ...]
+
+
+@dataclass(slots=True)
+class _RestHost:
+    base_url: str
+    client: httpx.Client
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    excluded_until: float = 0.0
+
 
 class BinanceRESTClient:
+    """Binance USD-M REST client with retries, a shared weight limiter and optional host failover.
+
+    With ``alternate_base_urls``, requests go to the healthiest host; a host failing
+    ``REST_HOST_FAILURE_THRESHOLD`` times in a row is skipped for ``REST_HOST_COOLDOWN_SECONDS``.
+    With ``hedge_quantile`` set as well, a request still pending after that latency quantile is
+    duplicated to the next host (when the weight budget has room) and the first success wins.
+    The hedge pool holds two workers per in-flight slot of the limiter, so neither a primary nor
+    its hedge waits for a worker; latency is measured from submission all the same.
+    """
+
     def __init__(
         self,
         base_url: str,
@@ -20,34 +147,219 @@ class BinanceRESTClient:
         retries: int = 5,
         *,
         transport: httpx.BaseTransport | None = None,
+        rate_limiter: RestWeightLimiter | None = None,
+        alternate_base_urls: Sequence[str] = (),
+        hedge_quantile: float | None = REST_HEDGE_QUANTILE,
+        priority: RestPriority = RestPriority.LIVE_CRITICAL,
     ) -> None:
-        self._client = httpx.Client(
-            base_url=base_url.rstrip("/"),
-            timeout=timeout_seconds,
-            transport=transport,
-        )
+        self._hosts = [
+            _RestHost(
+                base_url=url.rstrip("/"),
+                client=httpx.Client(base_url=url.rstrip("/"), timeout=timeout_seconds, transport=transport),
+            )
+            for url in dict.fromkeys([base_url, *alternate_base_urls])
+        ]
+        self._client = self._hosts[0].client
         self._retries = max(1, retries)
         self._min_retry_delay_seconds = 1.0
         self._max_backoff_seconds = 60.0
-        self._min_interval_seconds = 0.1  # ~10 requests/sec to avoid burst 429s
-        self._last_request_monotonic: float | None = None
+        self._rate_limiter = rate_limiter or RestWeightLimiter()
+        self._priority = priority
+
+        self._hosts_lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=REST_LATENCY_WINDOW)
+        self._hedge_quantile = hedge_quantile if len(self._hosts) > 1 else None
+        self._hedge_pool = (
+            ThreadPoolExecutor(max_workers=2 * self._rate_limiter.max_in_flight, thread_name_prefix="rest-hedge")
+            if self._hedge_quantile is not None
+            else None
+        )
+        self._hedged_requests = 0
+        self._hedge_wins = 0
+
+    @property
+    def rate_limiter(self) -> RestWeightLimiter:
+        return self._rate_limiter
 
     def close(self) -> None:
-        self._client.close()
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False)
+        for host in self._hosts:
+            host.client.close()
+
+    def hedge_metrics(self) -> RestHedgeMetrics:
+        now = time.monotonic()
+        with self._hosts_lock:
+            return RestHedgeMetrics(
+                hedged_requests=self._hedged_requests,
+                hedge_wins=self._hedge_wins,
+                hedge_delay_seconds=self._hedge_delay_locked(),
+                hosts=tuple(
+                    RestHostMetrics(
+                        base_url=host.base_url,
+                        requests=host.requests,
+                        failures=host.failures,
+                        excluded=host.excluded_until > now,
+                    )
+                    for host in self._hosts
+                ),
+            )
+
+    def _hedge_delay_locked(self) -> float | None:
+        if self._hedge_quantile is None or len(self._latencies) < REST_HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self._latencies)
+        rank = max(1, math.ceil(self._hedge_quantile * len(ordered)))
+        return max(REST_HEDGE_MIN_DELAY_SECONDS, ordered[rank - 1])
+
+    def _ranked_hosts(self) -> list[_RestHost]:
+        """Hosts outside their cooldown first, fewest consecutive failures first; never empty."""
+        now = time.monotonic()
+        with self._hosts_lock:
+            return sorted(self._hosts, key=lambda host: (host.excluded_until > now, host.consecutive_failures))
+
+    def _send_to(
+        self,
+        host: _RestHost,
+        path: str,
+        params: dict[str, Any],
+        *,
+        submitted: float | None = None,
+        started: threading.Event | None = None,
+    ) -> httpx.Response:
+        # Latency counts from submission so time spent waiting for a pool worker feeds the hedge delay.
+        begin = time.monotonic() if submitted is None else submitted
+        if started is not None:
+            started.set()
+        try:
+            response = host.client.get(path, params=params)
+        except httpx.TransportError:
+            self._record_host_result(host, failed=True, latency=None)
+            raise
+        self._record_host_result(host, failed=response.status_code >= 500, latency=time.monotonic() - begin)
+        return response
+
+    def _record_host_result(self, host: _RestHost, *, failed: bool, latency: float | None) -> None:
+        with self._hosts_lock:
+            host.requests += 1
+            if latency is not None:
+                self._latencies.append(latency)
+            if not failed:
+                host.consecutive_failures = 0
+                return
+            host.failures += 1
+            host.consecutive_failures += 1
+            if len(self._hosts) > 1 and host.consecutive_failures >= REST_HOST_FAILURE_THRESHOLD:
+                host.excluded_until = time.monotonic() + REST_HOST_COOLDOWN_SECONDS
+                logger.warning(
+                    "Excluding failing Binance REST host",
+                    extra={
+                        "base_url": host.base_url,
+                        "consecutive_failures": host.consecutive_failures,
+                        "cooldown_seconds": REST_HOST_COOLDOWN_SECONDS,
+                    },
+                )
+
+    def _send(self, path: str, params: dict[str, Any], weight: int, priority: RestPriority) -> httpx.Response:
+        """Send on an adaptive in-flight slot; a hedged request holds a second one for the duplicate.
+
+        Each slot is released when its own request finishes, so a losing request still on the wire
+        keeps counting against the limit after the winner has been returned.
+        """
+        hosts = self._ranked_hosts()
+        with self._hosts_lock:
+            delay = self._hedge_delay_locked()
+        self._rate_limiter.acquire_request_slot()
+        if self._hedge_pool is None or delay is None:
+            try:
+                return self._send_to(hosts[0], path, params)
+            finally:
+                self._rate_limiter.release_request_slot()
+
+        primary_started = threading.Event()
+        try:
+            primary = self._hedge_pool.submit(
+                self._send_to, hosts[0], path, params, submitted=time.monotonic(), started=primary_started
+            )
+        except RuntimeError:
+            self._rate_limiter.release_request_slot()
+            raise
+        primary.add_done_callback(lambda _future: self._rate_limiter.release_request_slot())
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+        # Only hedge a primary that is actually on the wire, with a free in-flight slot and spare weight.
+        if not primary_started.is_set() or not self._rate_limiter.try_request_slot():
+            return primary.result()
+        if self._rate_limiter.try_acquire(weight, priority) > 0:
+            self._rate_limiter.release_request_slot()
+            return primary.result()
+
+        hedge = self._hedge_pool.submit(self._send_to, hosts[1], path, params, submitted=time.monotonic())
+        # Runs on completion and on cancellation alike.
+        hedge.add_done_callback(lambda _future: self._rate_limiter.release_request_slot())
+        with self._hosts_lock:
+            self._hedged_requests += 1
+        pending: set[Future[httpx.Response]] = {primary, hedge}
+        fallback: Future[httpx.Response] | None = None
+        winner: Future[httpx.Response] | None = None
+        last_error: httpx.TransportError | None = None
+        try:
+            while pending and winner is None:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        response = future.result()
+                    except httpx.TransportError as exc:
+                        last_error = exc
+                        continue
+                    if response.status_code < 500:
+                        winner = future
+                        break
+                    fallback = future
+        finally:
+            # A loser still queued never reaches the wire.
+            for future in pending:
+                future.cancel()
+        returned = winner or fallback
+        # The caller reports the returned response; every other completed one still informs the limiter.
+        for future in (primary, hedge):
+            if future is not returned:
+                future.add_done_callback(self._observe_hedge_loser)
+        if winner is not None:
+            if winner is hedge:
+                with self._hosts_lock:
+                    self._hedge_wins += 1
+            return winner.result()
+        if fallback is not None:
+            return fallback.result()
+        if last_error is not None:
+            raise last_error
+        raise RuntimeError("Hedged REST request finished without a response")
+
+    def _observe_hedge_loser(self, future: Future[httpx.Response]) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        self._observe_response(future.result())
+
+    def _observe_response(self, response: httpx.Response) -> float | None:
+        """Feed a response to the limiter; returns its parsed Retry-After for error statuses."""
+        retry_after_seconds = (
+            self._parse_retry_after_seconds(response=response) if response.status_code >= 400 else None
+        )
+        self._rate_limiter.observe_response(response.status_code, response.headers, retry_after_seconds)
+        return retry_after_seconds
 
     def _get(self, path: str, params: dict[str, Any]) -> Any:
         last_transport_error: httpx.TransportError | None = None
+        weight = rest_request_weight(path, params)
+        priority = current_rest_priority() or self._priority
 
         for attempt in range(1, self._retries + 1):
+            self._rate_limiter.acquire(weight, priority)
             try:
-                # simple client-side rate limiter to avoid 429 bursts
-                now = time.monotonic()
-                if self._last_request_monotonic is not None:
-                    wait = self._min_interval_seconds - (now - self._last_request_monotonic)
-                    if wait > 0:
-                        time.sleep(wait)
-                response = self._client.get(path, params=params)
-                self._last_request_monotonic = time.monotonic()
+                response = self._send(path, params, weight, priority)
             except httpx.TransportError as exc:
                 last_transport_error = exc
                 if attempt >= self._retries:
@@ -55,11 +367,11 @@ class BinanceRESTClient:
                 self._sleep_before_retry(attempt=attempt, path=path, status_code=None, reason=exc.__class__.__name__)
                 continue
 
+            retry_after_seconds = self._observe_response(response)
             if response.status_code < 400:
                 return response.json()
 
             if self._is_retryable_status(response.status_code) and attempt < self._retries:
-                retry_after_seconds = self._parse_retry_after_seconds(response=response)
                 self._sleep_before_retry(
                     attempt=attempt,
                     path=path,
@@ -137,6 +449,24 @@ class BinanceRESTClient:
     def _to_ms(value: datetime) -> int:
         return int(value.timestamp() * 1000)
 
+    @classmethod
+    def _kline_params(
+        cls,
+        symbol_key: str,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval: str,
+        limit: int,
+    ) -> dict[str, Any]:
+        return {
+            symbol_key: symbol.upper(),
+            "interval": interval,
+            "startTime": cls._to_ms(start_time),
+            "endTime": cls._to_ms(end_time),
+            "limit": limit,
+        }
+
     def fetch_klines(
         self,
         symbol: str,
@@ -147,13 +477,7 @@ class BinanceRESTClient:
     ) -> list[dict[str, Any]]:
         payload = self._get(
             "/fapi/v1/klines",
-            {
-                "symbol": symbol.upper(),
-                "interval": interval,
-                "startTime": self._to_ms(start_time),
-                "endTime": self._to_ms(end_time),
-                "limit": limit,
-            },
+            self._kline_params("symbol", symbol, start_time, end_time, interval, limit),
         )
         return [
             {
@@ -182,13 +506,7 @@ class BinanceRESTClient:
     ) -> list[dict[str, Any]]:
         payload = self._get(
             "/fapi/v1/markPriceKlines",
-            {
-                "symbol": symbol.upper(),
-                "interval": interval,
-                "startTime": self._to_ms(start_time),
-                "endTime": self._to_ms(end_time),
-                "limit": limit,
-            },
+            self._kline_params("symbol", symbol, start_time, end_time, interval, limit),
         )
         return [
             {
@@ -211,13 +529,7 @@ class BinanceRESTClient:
     ) -> list[dict[str, Any]]:
         payload = self._get(
             "/fapi/v1/indexPriceKlines",
-            {
-                "pair": symbol.upper(),
-                "interval": interval,
-                "startTime": self._to_ms(start_time),
-                "endTime": self._to_ms(end_time),
-                "limit": limit,
-            },
+            self._kline_params("pair", symbol, start_time, end_time, interval, limit),
         )
         return [
             {
@@ -230,6 +542,49 @@ class BinanceRESTClient:
             for item in payload
         ]
 
+    def fetch_klines_frame(
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval: str = "1m",
+        limit: int = 1500,
+    ) -> pl.DataFrame:
+        """Columnar ``fetch_klines``: one typed frame with ``KLINE_FRAME_SCHEMA``, no dict per row."""
+        payload = self._get(
+            "/fapi/v1/klines",
+            self._kline_params("symbol", symbol, start_time, end_time, interval, limit),
+        )
+        return _kline_array_frame(payload, KLINE_FRAME_SCHEMA)
+
+    def fetch_mark_price_klines_frame(
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval: str = "1m",
+        limit: int = 1500,
+    ) -> pl.DataFrame:
+        payload = self._get(
+            "/fapi/v1/markPriceKlines",
+            self._kline_params("symbol", symbol, start_time, end_time, interval, limit),
+        )
+        return _kline_array_frame(payload, MARK_PRICE_KLINE_FRAME_SCHEMA)
+
+    def fetch_index_price_klines_frame(
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval: str = "1m",
+        limit: int = 1500,
+    ) -> pl.DataFrame:
+        payload = self._get(
+            "/fapi/v1/indexPriceKlines",
+            self._kline_params("pair", symbol, start_time, end_time, interval, limit),
+        )
+        return _kline_array_frame(payload, INDEX_PRICE_KLINE_FRAME_SCHEMA)
+
     def fetch_agg_trades(
         self,
         symbol: str,
@@ -259,6 +614,51 @@ class BinanceRESTClient:
             for item in payload
         ]
 
+    def fetch_agg_trades_frame(
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime,
+        limit: int = 1000,
+    ) -> pl.DataFrame:
+        """Columnar ``fetch_agg_trades`` with ``AGG_TRADE_FRAME_SCHEMA``."""
+        payload = self._get(
+            "/fapi/v1/aggTrades",
+            {
+                "symbol": symbol.upper(),
+                "startTime": self._to_ms(start_time),
+                "endTime": self._to_ms(end_time),
+                "limit": limit,
+            },
+        )
+        return _agg_trade_payload_frame(payload)
+
+    def fetch_agg_trades_frame_from_id(self, symbol: str, from_id: int, limit: int = 1000) -> pl.DataFrame:
+        """Columnar ``fetch_agg_trades_from_id``: up to ``limit`` trades with ids from ``from_id``."""
+        payload = self._get(
+            "/fapi/v1/aggTrades",
+            {"symbol": symbol.upper(), "fromId": int(from_id), "limit": limit},
+        )
+        return _agg_trade_payload_frame(payload)
+
+    def fetch_agg_trades_from_id(self, symbol: str, from_id: int, limit: int = 1000) -> list[dict[str, Any]]:
+        payload = self._get(
+            "/fapi/v1/aggTrades",
+            {"symbol": symbol.upper(), "fromId": int(from_id), "limit": limit},
+        )
+        return [
+            {
+                "agg_trade_id": int(item["a"]),
+                "price": float(item["p"]),
+                "qty": float(item["q"]),
+                "first_trade_id": int(item["f"]),
+                "last_trade_id": int(item["l"]),
+                "transact_time": int(item["T"]),
+                "is_buyer_maker": bool(item["m"]),
+            }
+            for item in payload
+        ]
+
     def fetch_book_ticker(self, symbol: str) -> dict[str, Any]:
         payload = self._get(
             "/fapi/v1/ticker/bookTicker",
@@ -411,3 +811,20 @@ class BinanceRESTClient:
                 }
             )
         return rows
+
+
+def build_rest_client(settings: Settings, *, priority: RestPriority = RestPriority.LIVE_CRITICAL) -> BinanceRESTClient:
+    """REST client wired with the shared weight limiter, cassette transport and alternate hosts.
+
+    ``priority`` applies to calls made outside any :func:`rest_priority` context.
+    """
+    return BinanceRESTClient(
+        base_url=settings.rest_base_url,
+        timeout_seconds=settings.rest_timeout_seconds,
+        retries=settings.rest_max_retries,
+        transport=build_http_transport(settings, "rest"),
+        rate_limiter=build_rest_weight_limiter(settings),
+        alternate_base_urls=settings.rest_alternate_base_urls,
+        hedge_quantile=settings.rest_hedge_quantile,
+        priority=priority,
+    )
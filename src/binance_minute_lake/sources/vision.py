@@ -50,9 +50,15 @@ _STREAM_TO_PATTERN: Final[dict[str, tuple[str, str]]] = {
 
 
 class VisionClient:
-    def __init__(self, base_url: str, timeout_seconds: int = 20) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        timeout_seconds: int = 20,
+        *,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
         self._base_url = base_url.rstrip("/")
-        self._client = httpx.Client(timeout=timeout_seconds)
+        self._client = httpx.Client(timeout=timeout_seconds, transport=transport)
 
     def close(self) -> None:
         self._client.close()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import gzip
+import itertools
 import json
 import logging
 import math
@@ -8,19 +10,50 @@ import sqlite3
 import threading
 import time
 import uuid
-from collections.abc import Callable, Iterator
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from binance_minute_lake.core.json_codec import JsonCodec, JsonCodecStats
+from binance_minute_lake.sources.rate_limit import RestWeightLimiter, depth_snapshot_weight
+
 MINUTE_MS = 60_000
 PRICE_IMPACT_NOTIONAL_USDT = 100_000.0
+DEFAULT_IMPACT_CURVE_NOTIONALS_USDT: tuple[float, ...] = (10_000.0, 100_000.0, 1_000_000.0, 5_000_000.0)
 LATENCY_BAD_MS = 500
 DEPTH_DEGRADED_SPREAD_MAX_PCT = 0.02
 DEPTH_DEGRADED_MIN_AVG_LEVEL_QTY = 1.0
 DEPTH_HEALTH_LEVEL_COUNT = 10
+DEPTH_BUFFER_MAX_EVENTS = 50_000
+DEPTH_RESYNC_WEIGHT_BUDGET_PER_MINUTE = 240
+DEPTH_RESYNC_MAX_BACKOFF_SECONDS = 60.0
+AGG_TRADE_BACKFILL_MAX_GAP = 50_000
+AGG_TRADE_BACKFILL_PAGE_LIMIT = 1000
+STREAM_DEDUP_WINDOW = 65_536
+MINUTE_BAR_KLINE = "kline"
+MINUTE_BAR_MARK_PRICE = "mark_price_kline"
+MINUTE_BAR_INDEX_PRICE = "index_price_kline"
+MINUTE_BAR_BOOK_TICKER = "book_ticker"
+MINUTE_BAR_PREMIUM_INDEX = "premium_index"
+MINUTE_BAR_MEMORY_MINUTES = 1_440
+_KLINE_FLOAT_FIELDS = (
+    ("open", "o"),
+    ("high", "h"),
+    ("low", "l"),
+    ("close", "c"),
+    ("volume_btc", "v"),
+    ("volume_usdt", "q"),
+    ("taker_buy_vol_btc", "V"),
+    ("taker_buy_vol_usdt", "Q"),
+)
+PRIMARY_CONNECTION = "primary"
+STANDBY_CONNECTION = "standby"
+RECEIVE_OVERFLOW_POLICIES = ("block", "drop_oldest", "spill")
 
 CONSUMER_WS_LATENCY = "ws_latency"
 CONSUMER_DEPTH = "depth"
@@ -75,10 +108,25 @@ def _coerce_float(value: Any) -> float | None:
     return None
 
 
-def _payload_to_json(payload: dict[str, Any] | None) -> str:
+RawPayload = dict[str, Any] | str | bytes | None
+
+
+def _payload_to_json(payload: RawPayload, codec: JsonCodec) -> str:
+    """Serialize a raw payload; original frame text/bytes are stored as received."""
     if payload is None:
         return "{}"
-    return json.dumps(payload, separators=(",", ":"), sort_keys=True)
+    if isinstance(payload, str):
+        return payload
+    if isinstance(payload, bytes):
+        return payload.decode("utf-8")
+    return codec.dumps(payload)
+
+
+def _unwrap_stream_envelope(decoded: Any) -> Any:
+    """Stored raw frames from combined streams keep the ``{"stream", "data"}`` envelope."""
+    if isinstance(decoded, dict) and "stream" in decoded and isinstance(decoded.get("data"), dict):
+        return decoded["data"]
+    return decoded
 
 
 def _parse_depth_levels(value: Any) -> tuple[tuple[float, float], ...]:
@@ -97,6 +145,27 @@ def _parse_depth_levels(value: Any) -> tuple[tuple[float, float], ...]:
     return tuple(levels)
 
 
+def _parse_depth_level_arrays(value: Any) -> DepthLevels:
+    prices: array[float] = array("d")
+    quantities: array[float] = array("d")
+    if not isinstance(value, list):
+        return DepthLevels(prices=prices, quantities=quantities)
+
+    append_price = prices.append
+    append_quantity = quantities.append
+    for level in value:
+        if not isinstance(level, (list, tuple)):
+            continue
+        try:
+            price = float(level[0])
+            quantity = float(level[1])
+        except (IndexError, TypeError, ValueError):
+            continue
+        append_price(price)
+        append_quantity(quantity)
+    return DepthLevels(prices=prices, quantities=quantities)
+
+
 def _p95_int(values: list[int]) -> int | None:
     if not values:
         return None
@@ -105,6 +174,23 @@ def _p95_int(values: list[int]) -> int | None:
     return int(ordered[rank - 1])
 
 
+def depth_health_degraded(
+    *,
+    spread_pct: float | None,
+    avg_bid_qty: float | None,
+    avg_ask_qty: float | None,
+    spread_max_pct: float = DEPTH_DEGRADED_SPREAD_MAX_PCT,
+    min_avg_level_qty: float = DEPTH_DEGRADED_MIN_AVG_LEVEL_QTY,
+) -> bool:
+    if spread_pct is not None and spread_pct > spread_max_pct:
+        return True
+    if avg_bid_qty is not None and avg_bid_qty < min_avg_level_qty:
+        return True
+    if avg_ask_qty is not None and avg_ask_qty < min_avg_level_qty:
+        return True
+    return False
+
+
 @dataclass(frozen=True, slots=True)
 class LiveMinuteFeatures:
     timestamp_ms: int
@@ -132,6 +218,9 @@ class LiveMinuteFeatures:
     liq_unfilled_supported: bool | None = None
     predicted_funding: float | None = None
     next_funding_time: int | None = None
+    impact_curve_notionals: tuple[float, ...] | None = None
+    buy_impact_curve: tuple[float | None, ...] | None = None
+    sell_impact_curve: tuple[float | None, ...] | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -144,6 +233,8 @@ class LiveEventCleanupSummary:
     ws_trade_events_deleted: int
     consumer_heartbeats_deleted: int
     vacuumed: bool
+    ws_depth_snapshots_deleted: int = 0
+    ws_minute_bars_deleted: int = 0
 
     @property
     def total_deleted(self) -> int:
@@ -153,6 +244,8 @@ class LiveEventCleanupSummary:
             + self.ws_liq_events_deleted
             + self.ws_trade_events_deleted
             + self.consumer_heartbeats_deleted
+            + self.ws_depth_snapshots_deleted
+            + self.ws_minute_bars_deleted
         )
 
 
@@ -175,22 +268,100 @@ class LiveCollector:
     ) -> list[dict[str, object]]:
         return []
 
+    def minute_bars_for_window(
+        self,
+        *,
+        symbol: str,
+        kind: str,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> list[dict[str, object]]:
+        """Stream-built rows in the matching REST row shape (``MINUTE_BAR_*`` kinds)."""
+        return []
+
 
 class DepthSyncError(RuntimeError):
     """Raised when depth diff continuity is broken."""
 
 
+class DepthCheckpointBridgeError(DepthSyncError):
+    """Raised when a restored checkpoint does not bridge the diffs; the book needs a snapshot like a cold start."""
+
+
+@dataclass(frozen=True, slots=True)
+class DepthLevels:
+    """Depth levels as parallel ``array('d')`` price/quantity columns."""
+
+    prices: array[float]
+    quantities: array[float]
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[tuple[float, float]]) -> DepthLevels:
+        prices: array[float] = array("d")
+        quantities: array[float] = array("d")
+        for price, quantity in pairs:
+            prices.append(float(price))
+            quantities.append(float(quantity))
+        return cls(prices=prices, quantities=quantities)
+
+    @classmethod
+    def coerce(cls, value: DepthLevels | Iterable[tuple[float, float]]) -> DepthLevels:
+        if isinstance(value, DepthLevels):
+            return value
+        return cls.from_pairs(value)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        return zip(self.prices, self.quantities, strict=True)
+
+
 @dataclass(frozen=True, slots=True)
 class DepthDiffEvent:
     symbol: str
     event_time: int
     first_update_id: int
     final_update_id: int
-    bid_deltas: tuple[tuple[float, float], ...]
-    ask_deltas: tuple[tuple[float, float], ...]
+    bid_deltas: DepthLevels
+    ask_deltas: DepthLevels
     previous_final_update_id: int | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class PriceImpactCurve:
+    """Impact per notional (ascending); buy walks asks, sell walks bids, both as a positive fraction of mid."""
+
+    notionals_usdt: tuple[float, ...]
+    buy_impacts: tuple[float | None, ...]
+    sell_impacts: tuple[float | None, ...]
+
+    def buy_impact(self, notional_usdt: float) -> tuple[float | None, bool]:
+        return self._lookup(self.buy_impacts, notional_usdt)
+
+    def sell_impact(self, notional_usdt: float) -> tuple[float | None, bool]:
+        return self._lookup(self.sell_impacts, notional_usdt)
+
+    def _lookup(self, impacts: tuple[float | None, ...], notional_usdt: float) -> tuple[float | None, bool]:
+        try:
+            index = self.notionals_usdt.index(float(notional_usdt))
+        except ValueError:
+            return None, False
+        impact = impacts[index]
+        return impact, impact is not None
+
+
+@dataclass(frozen=True, slots=True)
+class DepthBookCheckpoint:
+    symbol: str
+    last_update_id: int
+    created_at_ms: int
+    bids: tuple[tuple[float, float], ...]
+    asks: tuple[tuple[float, float], ...]
+    # REST snapshots are bridged by ``U <= lastUpdateId + 1 <= u``; book checkpoints by ``pu``.
+    from_snapshot: bool = False
+
+
 @dataclass(frozen=True, slots=True)
 class LiquidationOrderEvent:
     symbol: str
@@ -215,6 +386,15 @@ class ConsumerHeartbeat:
 class _WorkerConnectionState:
     connected: bool = False
     last_message_time: int | None = None
+    open_connections: set[str] = field(default_factory=set)
+
+
+@dataclass(frozen=True, slots=True)
+class _StreamRoute:
+    worker_name: str
+    stream: str
+    handler: Callable[[dict[str, Any], int, str | bytes | None], None]
+    consumer: str | None
 
 
 class DepthOrderBook:
@@ -225,6 +405,13 @@ class DepthOrderBook:
         self._last_update_id: int | None = None
         self._synchronized = False
         self._degraded = False
+        self._checkpoint_pending = False
+        self._checkpoint_from_snapshot = False
+        # Best prices are maintained incrementally; a flag marks a side whose best level was removed.
+        self._best_bid: float | None = None
+        self._best_ask: float | None = None
+        self._best_bid_stale = True
+        self._best_ask_stale = True
 
     @property
     def is_synchronized(self) -> bool:
@@ -238,16 +425,25 @@ class DepthOrderBook:
     def last_update_id(self) -> int | None:
         return self._last_update_id
 
+    @property
+    def checkpoint_pending(self) -> bool:
+        return self._checkpoint_pending
+
     def mark_degraded(self) -> None:
         self._degraded = True
         self._synchronized = False
+        self._checkpoint_pending = False
 
     def clear_degraded(self) -> None:
         self._degraded = False
 
     def buffer_event(self, event: DepthDiffEvent) -> None:
-        self._buffer.append(event)
-        self._buffer.sort(key=lambda item: item.final_update_id)
+        buffer = self._buffer
+        buffer.append(event)
+        if len(buffer) > 1 and buffer[-2].final_update_id > event.final_update_id:
+            buffer.sort(key=lambda item: item.final_update_id)
+        if len(buffer) > DEPTH_BUFFER_MAX_EVENTS:
+            del buffer[: len(buffer) - DEPTH_BUFFER_MAX_EVENTS]
 
     def sync_from_snapshot(
         self,
@@ -258,8 +454,10 @@ class DepthOrderBook:
     ) -> None:
         self._bids = {price: qty for price, qty in bids if qty > 0}
         self._asks = {price: qty for price, qty in asks if qty > 0}
+        self._invalidate_best_prices()
         self._last_update_id = int(last_update_id)
         self._synchronized = True
+        self._checkpoint_pending = False
         self.clear_degraded()
 
         if not self._buffer:
@@ -280,10 +478,97 @@ class DepthOrderBook:
                 f"got U={first.first_update_id}, u={first.final_update_id}, lastUpdateId={self._last_update_id}"
             )
 
-        for event in filtered:
+        # The bridging diff straddles the snapshot, so its ``pu`` predates ``lastUpdateId``.
+        self._apply_bid_deltas(first.bid_deltas)
+        self._apply_ask_deltas(first.ask_deltas)
+        self._last_update_id = first.final_update_id
+        self._validate_book_spread()
+        for event in filtered[1:]:
+            self.apply_event(event)
+
+    def checkpoint(self, symbol: str, *, created_at_ms: int | None = None) -> DepthBookCheckpoint | None:
+        if not self._synchronized or self._degraded or self._last_update_id is None:
+            return None
+        return DepthBookCheckpoint(
+            symbol=symbol.upper(),
+            last_update_id=self._last_update_id,
+            created_at_ms=now_ms() if created_at_ms is None else created_at_ms,
+            bids=tuple(sorted(self._bids.items(), reverse=True)),
+            asks=tuple(sorted(self._asks.items())),
+        )
+
+    def restore_from_checkpoint(self, checkpoint: DepthBookCheckpoint) -> None:
+        """Load checkpointed levels; the book stays unsynchronized until a diff bridges ``last_update_id``."""
+        self._bids = {price: qty for price, qty in checkpoint.bids if qty > 0}
+        self._asks = {price: qty for price, qty in checkpoint.asks if qty > 0}
+        self._invalidate_best_prices()
+        self._last_update_id = int(checkpoint.last_update_id)
+        self._synchronized = False
+        self._checkpoint_pending = True
+        self._checkpoint_from_snapshot = checkpoint.from_snapshot
+        self.clear_degraded()
+
+        buffered = sorted(self._buffer, key=lambda item: item.final_update_id)
+        self._buffer = []
+        for event in buffered:
             self.apply_event(event)
 
+    def _bridge_checkpoint(self, event: DepthDiffEvent) -> bool:
+        """Promote a restored checkpoint once ``event`` proves continuity; raise if it cannot."""
+        checkpoint_update_id = self._last_update_id
+        if checkpoint_update_id is None or event.final_update_id <= checkpoint_update_id:
+            return False
+
+        if self._checkpoint_from_snapshot:
+            # Like ``sync_from_snapshot``: the first diff may straddle the snapshot, so ``pu`` predates it.
+            bridged = event.first_update_id <= checkpoint_update_id + 1
+        elif event.previous_final_update_id is not None:
+            bridged = event.previous_final_update_id == checkpoint_update_id
+        else:
+            bridged = event.first_update_id <= checkpoint_update_id + 1
+        if not bridged:
+            # Nothing was ever served from this book, so it falls back to the cold-start state, not degraded.
+            self._bids = {}
+            self._asks = {}
+            self._invalidate_best_prices()
+            self._last_update_id = None
+            self._synchronized = False
+            self._checkpoint_pending = False
+            self.buffer_event(event)
+            raise DepthCheckpointBridgeError(
+                "Depth checkpoint does not bridge live diffs: "
+                f"checkpoint_u={checkpoint_update_id}, U={event.first_update_id}, "
+                f"u={event.final_update_id}, pu={event.previous_final_update_id}"
+            )
+
+        self._synchronized = True
+        self._checkpoint_pending = False
+        return True
+
+    def advance_checkpoint(self, event: DepthDiffEvent) -> bool:
+        """Roll a pending checkpoint forward through a stored diff without promoting it to live.
+
+        Stored diffs end where the previous process stopped; only a live diff can prove the book is
+        current, so the book stays pending and the next diff must follow on ``pu``.
+        """
+        if not self._checkpoint_pending or event.final_update_id <= (self._last_update_id or 0):
+            return False
+        self.apply_event(event)
+        self._synchronized = False
+        self._checkpoint_pending = True
+        self._checkpoint_from_snapshot = False
+        return True
+
     def apply_event(self, event: DepthDiffEvent) -> None:
+        if self._checkpoint_pending:
+            if not self._bridge_checkpoint(event):
+                return
+            if self._checkpoint_from_snapshot:
+                self._apply_bid_deltas(event.bid_deltas)
+                self._apply_ask_deltas(event.ask_deltas)
+                self._last_update_id = event.final_update_id
+                self._validate_book_spread()
+                return
         if not self._synchronized or self._last_update_id is None:
             self.buffer_event(event)
             return
@@ -292,31 +577,52 @@ class DepthOrderBook:
             return
 
         expected_next = self._last_update_id + 1
+        # The diff that exposes a gap is kept so the next snapshot can bridge through it.
         if event.previous_final_update_id is not None and event.previous_final_update_id != self._last_update_id:
             self.mark_degraded()
+            self.buffer_event(event)
             raise DepthSyncError(
                 "Depth continuity broken on pu check: "
                 f"pu={event.previous_final_update_id}, last_u={self._last_update_id}"
             )
         if event.previous_final_update_id is None and event.first_update_id > expected_next:
             self.mark_degraded()
+            self.buffer_event(event)
             raise DepthSyncError(
                 "Depth continuity broken on U check: "
                 f"U={event.first_update_id}, expected<={expected_next}"
             )
 
-        self._apply_deltas(self._bids, event.bid_deltas)
-        self._apply_deltas(self._asks, event.ask_deltas)
+        self._apply_bid_deltas(event.bid_deltas)
+        self._apply_ask_deltas(event.ask_deltas)
         self._last_update_id = event.final_update_id
         self._validate_book_spread()
 
-    @staticmethod
-    def _apply_deltas(book_side: dict[float, float], deltas: tuple[tuple[float, float], ...]) -> None:
-        for price, quantity in deltas:
+    def _invalidate_best_prices(self) -> None:
+        self._best_bid_stale = True
+        self._best_ask_stale = True
+
+    def _apply_bid_deltas(self, deltas: DepthLevels) -> None:
+        bids = self._bids
+        for price, quantity in zip(deltas.prices, deltas.quantities, strict=True):
             if quantity <= 0:
-                book_side.pop(price, None)
+                if bids.pop(price, None) is not None and price == self._best_bid:
+                    self._best_bid_stale = True
             else:
-                book_side[price] = quantity
+                bids[price] = quantity
+                if not self._best_bid_stale and (self._best_bid is None or price > self._best_bid):
+                    self._best_bid = price
+
+    def _apply_ask_deltas(self, deltas: DepthLevels) -> None:
+        asks = self._asks
+        for price, quantity in zip(deltas.prices, deltas.quantities, strict=True):
+            if quantity <= 0:
+                if asks.pop(price, None) is not None and price == self._best_ask:
+                    self._best_ask_stale = True
+            else:
+                asks[price] = quantity
+                if not self._best_ask_stale and (self._best_ask is None or price < self._best_ask):
+                    self._best_ask = price
 
     def _validate_book_spread(self) -> None:
         best_bid = self.best_bid()
@@ -331,48 +637,83 @@ class DepthOrderBook:
             )
 
     def best_bid(self) -> float | None:
-        if not self._bids:
-            return None
-        return max(self._bids)
+        if self._best_bid_stale:
+            self._best_bid = max(self._bids) if self._bids else None
+            self._best_bid_stale = False
+        return self._best_bid
 
     def best_ask(self) -> float | None:
-        if not self._asks:
-            return None
-        return min(self._asks)
+        if self._best_ask_stale:
+            self._best_ask = min(self._asks) if self._asks else None
+            self._best_ask_stale = False
+        return self._best_ask
 
     def compute_buy_price_impact(self, notional_usdt: float = PRICE_IMPACT_NOTIONAL_USDT) -> tuple[float | None, bool]:
-        best_bid = self.best_bid()
-        best_ask = self.best_ask()
-        if best_bid is None or best_ask is None:
+        mid = self.mid_price()
+        if mid is None:
             return None, False
 
-        mid = (best_bid + best_ask) / 2.0
-        if mid <= 0:
-            return None, False
+        (impact,) = self._walk_impact_curve(sorted(self._asks.items()), (float(notional_usdt),), mid)
+        return impact, impact is not None
 
-        remaining = float(notional_usdt)
-        total_cost = 0.0
-        total_qty = 0.0
+    def compute_price_impact_curve(
+        self,
+        notionals_usdt: Sequence[float] = DEFAULT_IMPACT_CURVE_NOTIONALS_USDT,
+    ) -> PriceImpactCurve:
+        """Buy and sell impact for every notional from one cumulative walk per book side."""
+        targets = tuple(sorted({float(value) for value in notionals_usdt if value > 0}))
+        mid = self.mid_price()
+        if mid is None or not targets:
+            empty: tuple[float | None, ...] = (None,) * len(targets)
+            return PriceImpactCurve(notionals_usdt=targets, buy_impacts=empty, sell_impacts=empty)
+
+        buy_impacts = self._walk_impact_curve(sorted(self._asks.items()), targets, mid)
+        sell_impacts = self._walk_impact_curve(sorted(self._bids.items(), reverse=True), targets, mid)
+        return PriceImpactCurve(notionals_usdt=targets, buy_impacts=buy_impacts, sell_impacts=sell_impacts)
 
-        for ask_price in sorted(self._asks):
-            ask_qty = self._asks[ask_price]
-            if ask_qty <= 0:
+    @staticmethod
+    def _walk_impact_curve(
+        levels: Iterable[tuple[float, float]],
+        targets: tuple[float, ...],
+        mid: float,
+    ) -> tuple[float | None, ...]:
+        """Walk levels away from mid, emitting |avg_exec - mid| / mid each time a target notional fills.
+
+        ``targets`` must be sorted ascending. Targets the visible book cannot fill stay ``None``.
+        """
+        impacts: list[float | None] = []
+        cumulative_cost = 0.0
+        cumulative_qty = 0.0
+
+        for price, qty in levels:
+            if qty <= 0:
                 continue
-            level_notional = ask_price * ask_qty
-            take_notional = min(remaining, level_notional)
-            qty_taken = take_notional / ask_price
-            total_cost += take_notional
-            total_qty += qty_taken
-            remaining -= take_notional
-            if remaining <= 1e-9:
+            level_notional = price * qty
+            while len(impacts) < len(targets) and cumulative_cost + level_notional >= targets[len(impacts)] - 1e-9:
+                target = targets[len(impacts)]
+                total_qty = cumulative_qty + max(target - cumulative_cost, 0.0) / price
+                if total_qty <= 0:
+                    impacts.append(None)
+                    continue
+                average_execution_price = target / total_qty
+                impacts.append(abs(average_execution_price - mid) / mid)
+            if len(impacts) >= len(targets):
                 break
+            cumulative_cost += level_notional
+            cumulative_qty += qty
 
-        if remaining > 1e-9 or total_qty <= 0:
-            return None, False
+        impacts.extend([None] * (len(targets) - len(impacts)))
+        return tuple(impacts)
 
-        average_execution_price = total_cost / total_qty
-        impact = (average_execution_price - mid) / mid
-        return impact, True
+    def mid_price(self) -> float | None:
+        best_bid = self.best_bid()
+        best_ask = self.best_ask()
+        if best_bid is None or best_ask is None:
+            return None
+        mid = (best_bid + best_ask) / 2.0
+        if mid <= 0:
+            return None
+        return mid
 
     def compute_health_metrics(
         self,
@@ -399,9 +740,64 @@ class DepthOrderBook:
         return spread_pct, avg_bid_qty, avg_ask_qty
 
 
+class DepthCheckpointStore:
+    """Gzip-compressed JSON checkpoints of depth books, one file per symbol, replaced atomically."""
+
+    _FORMAT_VERSION = 1
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, symbol: str) -> Path:
+        return self._directory / f"{symbol.upper()}.depth.json.gz"
+
+    def save(self, checkpoint: DepthBookCheckpoint) -> Path:
+        final_path = self.path_for(checkpoint.symbol)
+        tmp_path = final_path.with_name(f".{final_path.name}.{uuid.uuid4().hex}.tmp")
+        document = {
+            "version": self._FORMAT_VERSION,
+            "symbol": checkpoint.symbol,
+            "last_update_id": checkpoint.last_update_id,
+            "created_at_ms": checkpoint.created_at_ms,
+            "bids": checkpoint.bids,
+            "asks": checkpoint.asks,
+        }
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=5) as handle:
+            json.dump(document, handle, separators=(",", ":"))
+        tmp_path.replace(final_path)
+        return final_path
+
+    def load(self, symbol: str) -> DepthBookCheckpoint | None:
+        path = self.path_for(symbol)
+        if not path.exists():
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                document = json.load(handle)
+        except (OSError, EOFError, json.JSONDecodeError):
+            logger.warning("Ignoring unreadable depth checkpoint", extra={"path": str(path)})
+            return None
+
+        if not isinstance(document, dict) or document.get("version") != self._FORMAT_VERSION:
+            return None
+        last_update_id = _coerce_int(document.get("last_update_id"))
+        created_at_ms = _coerce_int(document.get("created_at_ms"))
+        if last_update_id is None or created_at_ms is None:
+            return None
+        return DepthBookCheckpoint(
+            symbol=str(document.get("symbol") or symbol).upper(),
+            last_update_id=last_update_id,
+            created_at_ms=created_at_ms,
+            bids=_parse_depth_levels(document.get("bids")),
+            asks=_parse_depth_levels(document.get("asks")),
+        )
+
+
 class LiveEventStore:
-    def __init__(self, db_path: Path) -> None:
+    def __init__(self, db_path: Path, *, codec: JsonCodec | None = None) -> None:
         self._db_path = db_path
+        self._codec = codec or JsonCodec()
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._initialize()
 
@@ -442,10 +838,29 @@ class LiveEventStore:
                     final_update_id INTEGER NOT NULL,
                     bids_json TEXT NOT NULL,
                     asks_json TEXT NOT NULL,
-                    raw_json TEXT NOT NULL
+                    raw_json TEXT NOT NULL,
+                    prev_final_update_id INTEGER
+                )
+                """
+            )
+            depth_columns = {row[1] for row in connection.execute("PRAGMA table_info(ws_depth_events)")}
+            if "prev_final_update_id" not in depth_columns:
+                connection.execute("ALTER TABLE ws_depth_events ADD COLUMN prev_final_update_id INTEGER")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ws_depth_snapshots (
+                    symbol TEXT NOT NULL,
+                    last_update_id INTEGER NOT NULL,
+                    created_at_ms INTEGER NOT NULL,
+                    levels_gz BLOB NOT NULL,
+                    from_snapshot INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (symbol, last_update_id)
                 )
                 """
             )
+            snapshot_columns = {row[1] for row in connection.execute("PRAGMA table_info(ws_depth_snapshots)")}
+            if "from_snapshot" not in snapshot_columns:
+                connection.execute("ALTER TABLE ws_depth_snapshots ADD COLUMN from_snapshot INTEGER NOT NULL DEFAULT 0")
             connection.execute(
                 """
                 CREATE TABLE IF NOT EXISTS ws_liq_events (
@@ -472,6 +887,20 @@ class LiveEventStore:
                 )
                 """
             )
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ws_minute_bars (
+                    symbol TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    minute_ts INTEGER NOT NULL,
+                    row_json TEXT NOT NULL,
+                    PRIMARY KEY (symbol, kind, minute_ts)
+                )
+                """
+            )
+            trade_columns = {row[1] for row in connection.execute("PRAGMA table_info(ws_trade_events)")}
+            if "agg_trade_id" not in trade_columns:
+                connection.execute("ALTER TABLE ws_trade_events ADD COLUMN agg_trade_id INTEGER")
             connection.execute(
                 """
                 CREATE TABLE IF NOT EXISTS consumer_heartbeats (
@@ -493,6 +922,13 @@ class LiveEventStore:
                 "CREATE INDEX IF NOT EXISTS idx_ws_depth_symbol_event ON ws_depth_events(symbol, event_time)"
             )
             connection.execute("CREATE INDEX IF NOT EXISTS idx_ws_depth_event_time ON ws_depth_events(event_time)")
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ws_depth_symbol_final_update "
+                "ON ws_depth_events(symbol, final_update_id)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ws_depth_snapshots_created ON ws_depth_snapshots(created_at_ms)"
+            )
             connection.execute(
                 "CREATE INDEX IF NOT EXISTS idx_ws_liq_symbol_event ON ws_liq_events(symbol, event_time)"
             )
@@ -505,6 +941,9 @@ class LiveEventStore:
             connection.execute(
                 "CREATE INDEX IF NOT EXISTS idx_ws_trade_transact_time ON ws_trade_events(transact_time)"
             )
+            connection.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_ws_trade_symbol_agg_id ON ws_trade_events(symbol, agg_trade_id)"
+            )
             connection.execute(
                 "CREATE INDEX IF NOT EXISTS idx_consumer_heartbeats_minute_ts ON consumer_heartbeats(minute_ts)"
             )
@@ -522,7 +961,7 @@ class LiveEventStore:
         event_time: int | None,
         transact_time: int | None,
         arrival_time: int,
-        raw_payload: dict[str, Any] | None,
+        raw_payload: RawPayload,
     ) -> str:
         ingest_id = uuid.uuid4().hex
         with self._connect() as connection:
@@ -539,7 +978,7 @@ class LiveEventStore:
                     event_time,
                     transact_time,
                     arrival_time,
-                    _payload_to_json(raw_payload),
+                    _payload_to_json(raw_payload, self._codec),
                 ),
             )
             connection.commit()
@@ -553,9 +992,10 @@ class LiveEventStore:
         arrival_time: int,
         first_update_id: int,
         final_update_id: int,
-        bids: tuple[tuple[float, float], ...],
-        asks: tuple[tuple[float, float], ...],
-        raw_payload: dict[str, Any] | None,
+        bids: DepthLevels | tuple[tuple[float, float], ...],
+        asks: DepthLevels | tuple[tuple[float, float], ...],
+        raw_payload: RawPayload,
+        previous_final_update_id: int | None = None,
     ) -> str:
         ingest_id = uuid.uuid4().hex
         with self._connect() as connection:
@@ -563,8 +1003,8 @@ class LiveEventStore:
                 """
                 INSERT INTO ws_depth_events(
                     ingest_id, symbol, event_time, arrival_time, first_update_id, final_update_id,
-                    bids_json, asks_json, raw_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    bids_json, asks_json, raw_json, prev_final_update_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     ingest_id,
@@ -573,9 +1013,10 @@ class LiveEventStore:
                     arrival_time,
                     first_update_id,
                     final_update_id,
-                    json.dumps(bids, separators=(",", ":")),
-                    json.dumps(asks, separators=(",", ":")),
-                    _payload_to_json(raw_payload),
+                    self._codec.dumps(list(bids)),
+                    self._codec.dumps(list(asks)),
+                    _payload_to_json(raw_payload, self._codec),
+                    previous_final_update_id,
                 ),
             )
             connection.commit()
@@ -590,7 +1031,7 @@ class LiveEventStore:
         side: str,
         price: float,
         quantity: float,
-        raw_payload: dict[str, Any] | None,
+        raw_payload: RawPayload,
     ) -> str:
         ingest_id = uuid.uuid4().hex
         with self._connect() as connection:
@@ -608,7 +1049,7 @@ class LiveEventStore:
                     side.upper(),
                     float(price),
                     float(quantity),
-                    _payload_to_json(raw_payload),
+                    _payload_to_json(raw_payload, self._codec),
                 ),
             )
             connection.commit()
@@ -621,15 +1062,17 @@ class LiveEventStore:
         event_time: int | None,
         arrival_time: int,
         transact_time: int | None,
-        raw_payload: dict[str, Any] | None,
+        raw_payload: RawPayload,
+        agg_trade_id: int | None = None,
     ) -> str:
         ingest_id = uuid.uuid4().hex
         with self._connect() as connection:
+            # A trade id already stored (e.g. by a backfill) is ignored rather than duplicated.
             connection.execute(
                 """
-                INSERT INTO ws_trade_events(
-                    ingest_id, symbol, event_time, arrival_time, transact_time, raw_json
-                ) VALUES (?, ?, ?, ?, ?, ?)
+                INSERT OR IGNORE INTO ws_trade_events(
+                    ingest_id, symbol, event_time, arrival_time, transact_time, raw_json, agg_trade_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     ingest_id,
@@ -637,12 +1080,102 @@ class LiveEventStore:
                     event_time,
                     arrival_time,
                     transact_time,
-                    _payload_to_json(raw_payload),
+                    _payload_to_json(raw_payload, self._codec),
+                    agg_trade_id,
                 ),
             )
             connection.commit()
         return ingest_id
 
+    def append_backfilled_agg_trades(
+        self,
+        *,
+        symbol: str,
+        trades: Sequence[dict[str, Any]],
+        arrival_time: int,
+    ) -> int:
+        """Store REST aggTrades (``fetch_agg_trades`` row shape) as aggTrade payloads; returns rows inserted."""
+        symbol_upper = symbol.upper()
+        rows = []
+        for trade in trades:
+            agg_trade_id = int(trade["agg_trade_id"])
+            transact_time = int(trade["transact_time"])
+            payload = {
+                "e": "aggTrade",
+                "E": transact_time,
+                "s": symbol_upper,
+                "a": agg_trade_id,
+                "p": trade["price"],
+                "q": trade["qty"],
+                "f": trade["first_trade_id"],
+                "l": trade["last_trade_id"],
+                "T": transact_time,
+                "m": bool(trade["is_buyer_maker"]),
+            }
+            rows.append(
+                (
+                    uuid.uuid4().hex,
+                    symbol_upper,
+                    transact_time,
+                    arrival_time,
+                    transact_time,
+                    self._codec.dumps(payload),
+                    agg_trade_id,
+                )
+            )
+        with self._connect() as connection:
+            before = connection.total_changes
+            connection.executemany(
+                """
+                INSERT OR IGNORE INTO ws_trade_events(
+                    ingest_id, symbol, event_time, arrival_time, transact_time, raw_json, agg_trade_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            inserted = connection.total_changes - before
+            connection.commit()
+        return inserted
+
+    def upsert_minute_bars(self, *, symbol: str, rows: Sequence[tuple[str, int, dict[str, Any]]]) -> None:
+        """Store ``(kind, minute_ts, row)`` stream-built minute rows, replacing earlier versions."""
+        if not rows:
+            return
+        symbol_upper = symbol.upper()
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO ws_minute_bars(symbol, kind, minute_ts, row_json) VALUES (?, ?, ?, ?)",
+                [(symbol_upper, kind, int(minute_ts), self._codec.dumps(row)) for kind, minute_ts, row in rows],
+            )
+            connection.commit()
+
+    def minute_bars_for_window(
+        self,
+        *,
+        symbol: str,
+        kind: str,
+        start_timestamp_ms: int,
+        end_timestamp_ms: int,
+    ) -> list[dict[str, object]]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                """
+                SELECT row_json FROM ws_minute_bars
+                WHERE symbol = ? AND kind = ? AND minute_ts >= ? AND minute_ts < ?
+                ORDER BY minute_ts ASC
+                """,
+                (symbol.upper(), kind, int(start_timestamp_ms), int(end_timestamp_ms)),
+            ).fetchall()
+        return [self._codec.loads(row_json) for (row_json,) in rows]
+
+    def last_agg_trade_id(self, symbol: str) -> int | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT MAX(agg_trade_id) FROM ws_trade_events WHERE symbol = ?",
+                (symbol.upper(),),
+            ).fetchone()
+        return _coerce_int(row[0]) if row is not None else None
+
     def upsert_heartbeat(
         self,
         *,
@@ -718,6 +1251,18 @@ class LiveEventStore:
                     (event_cutoff_ms,),
                 )
             )
+            ws_depth_snapshots_deleted = self._rows_deleted(
+                connection.execute(
+                    "DELETE FROM ws_depth_snapshots WHERE created_at_ms < ?",
+                    (event_cutoff_ms,),
+                )
+            )
+            ws_minute_bars_deleted = self._rows_deleted(
+                connection.execute(
+                    "DELETE FROM ws_minute_bars WHERE minute_ts < ?",
+                    (event_cutoff_ms,),
+                )
+            )
             ws_liq_events_deleted = self._rows_deleted(
                 connection.execute(
                     "DELETE FROM ws_liq_events WHERE event_time < ?",
@@ -762,6 +1307,8 @@ class LiveEventStore:
             ws_trade_events_deleted=ws_trade_events_deleted,
             consumer_heartbeats_deleted=consumer_heartbeats_deleted,
             vacuumed=vacuumed,
+            ws_depth_snapshots_deleted=ws_depth_snapshots_deleted,
+            ws_minute_bars_deleted=ws_minute_bars_deleted,
         )
 
     def snapshot_for_minute(
@@ -883,8 +1430,8 @@ class LiveEventStore:
                 parsed_payload: dict[str, Any] = {}
                 if isinstance(raw_json, str):
                     try:
-                        payload = json.loads(raw_json)
-                    except json.JSONDecodeError:
+                        payload = _unwrap_stream_envelope(self._codec.loads(raw_json))
+                    except self._codec.decode_errors:
                         payload = {}
                     if isinstance(payload, dict):
                         parsed_payload = payload
@@ -943,6 +1490,119 @@ class LiveEventStore:
             next_funding_time=None,
         )
 
+    def append_depth_checkpoint(self, checkpoint: DepthBookCheckpoint) -> None:
+        """Archive a snapshot/checkpoint as a replay anchor for ``ws_depth_events``."""
+        levels = json.dumps({"bids": checkpoint.bids, "asks": checkpoint.asks}, separators=(",", ":"))
+        with self._connect() as connection:
+            connection.execute(
+                """
+                INSERT OR REPLACE INTO ws_depth_snapshots(
+                    symbol, last_update_id, created_at_ms, levels_gz, from_snapshot
+                )
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (
+                    checkpoint.symbol.upper(),
+                    checkpoint.last_update_id,
+                    checkpoint.created_at_ms,
+                    gzip.compress(levels.encode("utf-8"), compresslevel=5),
+                    int(checkpoint.from_snapshot),
+                ),
+            )
+            connection.commit()
+
+    def depth_checkpoint_at_or_before(self, *, symbol: str, timestamp_ms: int) -> DepthBookCheckpoint | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                """
+                SELECT symbol, last_update_id, created_at_ms, levels_gz, from_snapshot
+                FROM ws_depth_snapshots
+                WHERE symbol = ? AND created_at_ms <= ?
+                ORDER BY created_at_ms DESC
+                LIMIT 1
+                """,
+                (symbol.upper(), int(timestamp_ms)),
+            ).fetchone()
+        return self._checkpoint_from_row(row)
+
+    def depth_checkpoint_after_update_id(self, *, symbol: str, update_id: int) -> DepthBookCheckpoint | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                """
+                SELECT symbol, last_update_id, created_at_ms, levels_gz, from_snapshot
+                FROM ws_depth_snapshots
+                WHERE symbol = ? AND last_update_id >= ?
+                ORDER BY last_update_id ASC
+                LIMIT 1
+                """,
+                (symbol.upper(), int(update_id)),
+            ).fetchone()
+        return self._checkpoint_from_row(row)
+
+    @staticmethod
+    def _checkpoint_from_row(row: tuple[Any, ...] | None) -> DepthBookCheckpoint | None:
+        if row is None:
+            return None
+        symbol_value, last_update_id, created_at_ms, levels_gz, from_snapshot = row
+        levels = json.loads(gzip.decompress(levels_gz).decode("utf-8"))
+        return DepthBookCheckpoint(
+            symbol=str(symbol_value),
+            last_update_id=int(last_update_id),
+            created_at_ms=int(created_at_ms),
+            bids=_parse_depth_levels(levels.get("bids")),
+            asks=_parse_depth_levels(levels.get("asks")),
+            from_snapshot=bool(from_snapshot),
+        )
+
+    def iter_depth_events(
+        self,
+        *,
+        symbol: str,
+        after_update_id: int,
+        end_event_time_ms: int | None = None,
+        batch_size: int = 5_000,
+    ) -> Iterator[DepthDiffEvent]:
+        """Stream stored depth diffs with ``final_update_id > after_update_id`` in update-id order."""
+        symbol_upper = symbol.upper()
+        query = """
+            SELECT event_time, first_update_id, final_update_id, prev_final_update_id, bids_json, asks_json
+            FROM ws_depth_events
+            WHERE symbol = ? AND final_update_id > ?
+        """
+        params: list[int | str] = [symbol_upper, int(after_update_id)]
+        if end_event_time_ms is not None:
+            query += " AND event_time < ?"
+            params.append(int(end_event_time_ms))
+        query += " ORDER BY final_update_id ASC"
+
+        with self._connect() as connection:
+            cursor = connection.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for event_time, first_update_id, final_update_id, prev_final_update_id, bids_json, asks_json in rows:
+                    yield DepthDiffEvent(
+                        symbol=symbol_upper,
+                        event_time=int(event_time or 0),
+                        first_update_id=int(first_update_id),
+                        final_update_id=int(final_update_id),
+                        bid_deltas=_parse_depth_level_arrays(self._codec.loads(bids_json)),
+                        ask_deltas=_parse_depth_level_arrays(self._codec.loads(asks_json)),
+                        previous_final_update_id=_coerce_int(prev_final_update_id),
+                    )
+
+    def depth_events_after(
+        self,
+        *,
+        symbol: str,
+        after_update_id: int,
+        limit: int | None = None,
+    ) -> list[DepthDiffEvent]:
+        """Stored depth diffs with ``final_update_id > after_update_id`` in update-id order."""
+        events = self.iter_depth_events(symbol=symbol, after_update_id=after_update_id)
+        return list(events if limit is None else itertools.islice(events, limit))
+
     def agg_trades_for_window(
         self,
         *,
@@ -972,8 +1632,8 @@ class LiveEventStore:
             payload: dict[str, Any] = {}
             if isinstance(raw_json, str):
                 try:
-                    decoded = json.loads(raw_json)
-                except json.JSONDecodeError:
+                    decoded = _unwrap_stream_envelope(self._codec.loads(raw_json))
+                except self._codec.decode_errors:
                     decoded = {}
                 if isinstance(decoded, dict):
                     payload = decoded
@@ -1022,6 +1682,24 @@ class LiveEventStore:
         return parsed_rows
 
 
+@dataclass(slots=True)
+class _MarketMinuteState:
+    minute_ms: int
+    mark_ohlc: list[float] | None = None
+    index_ohlc: list[float] | None = None
+    premium_index: dict[str, Any] | None = None
+    book_ticker: dict[str, Any] | None = None
+
+
+def _extend_ohlc(ohlc: list[float] | None, price: float) -> list[float]:
+    if ohlc is None:
+        return [price, price, price, price]
+    ohlc[1] = max(ohlc[1], price)
+    ohlc[2] = min(ohlc[2], price)
+    ohlc[3] = price
+    return ohlc
+
+
 @dataclass(slots=True)
 class _MinuteAccumulator:
     event_time: int | None = None
@@ -1054,6 +1732,7 @@ class _MinuteAccumulator:
     has_ls_ratio: bool = False
     predicted_funding: float | None = None
     next_funding_time: int | None = None
+    impact_curve: PriceImpactCurve | None = None
 
 
 class InMemoryLiveCollector(LiveCollector):
@@ -1065,13 +1744,21 @@ class InMemoryLiveCollector(LiveCollector):
         event_store: LiveEventStore | None = None,
         liquidation_unfilled_supported: bool = True,
         symbol: str | None = None,
+        impact_curve_notionals: Sequence[float] | None = None,
     ) -> None:
         self._event_store = event_store
         self._liquidation_unfilled_supported = liquidation_unfilled_supported
         self._symbol = symbol.upper() if symbol is not None else None
+        self._impact_curve_notionals = (
+            tuple(sorted({float(value) for value in impact_curve_notionals if value > 0}))
+            if impact_curve_notionals
+            else None
+        )
         self._minutes: dict[int, _MinuteAccumulator] = {}
         self._depth_books: dict[str, DepthOrderBook] = {}
         self._heartbeats: dict[tuple[str, int], ConsumerHeartbeat] = {}
+        self._market_minutes: dict[str, _MarketMinuteState] = {}
+        self._minute_bars: dict[tuple[str, str], dict[int, dict[str, Any]]] = {}
         self._lock = threading.RLock()
 
     def mark_consumer_heartbeat(
@@ -1159,7 +1846,7 @@ class InMemoryLiveCollector(LiveCollector):
         event_time: int | None,
         transact_time: int | None = None,
         arrival_time: int | None = None,
-        raw_payload: dict[str, Any] | None = None,
+        raw_payload: RawPayload = None,
     ) -> None:
         with self._lock:
             self._remember_symbol(symbol)
@@ -1184,7 +1871,8 @@ class InMemoryLiveCollector(LiveCollector):
         event_time: int | None,
         transact_time: int | None,
         arrival_time: int | None = None,
-        raw_payload: dict[str, Any] | None = None,
+        raw_payload: RawPayload = None,
+        agg_trade_id: int | None = None,
     ) -> None:
         with self._lock:
             self._remember_symbol(symbol)
@@ -1196,8 +1884,21 @@ class InMemoryLiveCollector(LiveCollector):
                     arrival_time=arrival,
                     transact_time=transact_time,
                     raw_payload=raw_payload,
+                    agg_trade_id=agg_trade_id,
                 )
 
+    def ingest_backfilled_agg_trades(self, *, symbol: str, trades: Sequence[dict[str, Any]]) -> int:
+        if self._event_store is None or not trades:
+            return 0
+        with self._lock:
+            return self._event_store.append_backfilled_agg_trades(symbol=symbol, trades=trades, arrival_time=now_ms())
+
+    def last_agg_trade_id(self, symbol: str) -> int | None:
+        if self._event_store is None:
+            return None
+        with self._lock:
+            return self._event_store.last_agg_trade_id(symbol)
+
     def set_depth_snapshot(
         self,
         *,
@@ -1211,6 +1912,17 @@ class InMemoryLiveCollector(LiveCollector):
             self._remember_symbol(symbol)
             symbol_upper = symbol.upper()
             book = self._depth_books.setdefault(symbol_upper, DepthOrderBook())
+            if self._event_store is not None:
+                self._event_store.append_depth_checkpoint(
+                    DepthBookCheckpoint(
+                        symbol=symbol_upper,
+                        last_update_id=int(last_update_id),
+                        created_at_ms=minute_timestamp_ms if minute_timestamp_ms is not None else now_ms(),
+                        bids=tuple(bids),
+                        asks=tuple(asks),
+                        from_snapshot=True,
+                    )
+                )
             try:
                 book.sync_from_snapshot(last_update_id=last_update_id, bids=bids, asks=asks)
             except DepthSyncError:
@@ -1226,13 +1938,45 @@ class InMemoryLiveCollector(LiveCollector):
                 bucket = self._bucket(minute_key)
                 if bucket.depth_event_count > 0:
                     bucket.depth_synced_event_count = max(bucket.depth_synced_event_count, 1)
-                impact, fillable = book.compute_buy_price_impact()
-                spread_pct, avg_bid_qty, avg_ask_qty = book.compute_health_metrics()
-                bucket.price_impact_100k = impact
-                bucket.impact_fillable = fillable
-                bucket.depth_spread_pct = spread_pct
-                bucket.depth_avg_bid_qty = avg_bid_qty
-                bucket.depth_avg_ask_qty = avg_ask_qty
+                self._update_depth_metrics(bucket, book)
+
+    def depth_checkpoint(self, symbol: str) -> DepthBookCheckpoint | None:
+        with self._lock:
+            book = self._depth_books.get(symbol.upper())
+            if book is None:
+                return None
+            return book.checkpoint(symbol)
+
+    def archive_depth_checkpoint(self, checkpoint: DepthBookCheckpoint) -> None:
+        if self._event_store is None:
+            return
+        with self._lock:
+            self._event_store.append_depth_checkpoint(checkpoint)
+
+    def depth_book_synchronized(self, symbol: str) -> bool:
+        with self._lock:
+            book = self._depth_books.get(symbol.upper())
+            return book is not None and book.is_synchronized and not book.degraded
+
+    def restore_depth_checkpoint(self, checkpoint: DepthBookCheckpoint, *, replay_stored_diffs: bool = True) -> bool:
+        """Restore a depth book from ``checkpoint`` and roll it forward through stored diffs.
+
+        Returns whether stored diffs moved the book past the checkpoint. Either way the book stays
+        pending until a live diff proves continuity. Raises ``DepthSyncError`` when stored diffs
+        show a gap, in which case a REST snapshot is required.
+        """
+        with self._lock:
+            self._remember_symbol(checkpoint.symbol)
+            book = self._depth_books.setdefault(checkpoint.symbol.upper(), DepthOrderBook())
+            book.restore_from_checkpoint(checkpoint)
+            advanced = False
+            if replay_stored_diffs and self._event_store is not None:
+                for event in self._event_store.depth_events_after(
+                    symbol=checkpoint.symbol,
+                    after_update_id=checkpoint.last_update_id,
+                ):
+                    advanced = book.advance_checkpoint(event) or advanced
+            return advanced
 
     def ingest_depth_diff(
         self,
@@ -1242,11 +1986,11 @@ class InMemoryLiveCollector(LiveCollector):
         transact_time: int | None,
         first_update_id: int,
         final_update_id: int,
-        bid_deltas: list[tuple[float, float]],
-        ask_deltas: list[tuple[float, float]],
+        bid_deltas: DepthLevels | Sequence[tuple[float, float]],
+        ask_deltas: DepthLevels | Sequence[tuple[float, float]],
         arrival_time: int | None = None,
         previous_final_update_id: int | None = None,
-        raw_payload: dict[str, Any] | None = None,
+        raw_payload: RawPayload = None,
     ) -> None:
         with self._lock:
             self._remember_symbol(symbol)
@@ -1279,8 +2023,8 @@ class InMemoryLiveCollector(LiveCollector):
             self.mark_ws_heartbeat(minute_key, alive=True, last_message_time=arrival)
             self.mark_depth_heartbeat(minute_key, alive=True, last_message_time=arrival)
 
-            bid_tuple = tuple((float(price), float(quantity)) for price, quantity in bid_deltas)
-            ask_tuple = tuple((float(price), float(quantity)) for price, quantity in ask_deltas)
+            bid_levels = DepthLevels.coerce(bid_deltas)
+            ask_levels = DepthLevels.coerce(ask_deltas)
 
             if self._event_store is not None:
                 self._event_store.append_depth_event(
@@ -1289,9 +2033,10 @@ class InMemoryLiveCollector(LiveCollector):
                     arrival_time=arrival,
                     first_update_id=first_update_id,
                     final_update_id=final_update_id,
-                    bids=bid_tuple,
-                    asks=ask_tuple,
+                    bids=bid_levels,
+                    asks=ask_levels,
                     raw_payload=None,
+                    previous_final_update_id=previous_final_update_id,
                 )
                 self._event_store.append_event(
                     stream=f"{symbol.lower()}@depth@100ms",
@@ -1309,8 +2054,8 @@ class InMemoryLiveCollector(LiveCollector):
                 event_time=event_time,
                 first_update_id=first_update_id,
                 final_update_id=final_update_id,
-                bid_deltas=bid_tuple,
-                ask_deltas=ask_tuple,
+                bid_deltas=bid_levels,
+                ask_deltas=ask_levels,
                 previous_final_update_id=previous_final_update_id,
             )
 
@@ -1318,24 +2063,22 @@ class InMemoryLiveCollector(LiveCollector):
                 book.apply_event(event)
                 if book.is_synchronized and not book.degraded:
                     bucket.depth_synced_event_count += 1
-                    impact, fillable = book.compute_buy_price_impact()
-                    spread_pct, avg_bid_qty, avg_ask_qty = book.compute_health_metrics()
-                    bucket.price_impact_100k = impact
-                    bucket.impact_fillable = fillable
-                    bucket.depth_spread_pct = spread_pct
-                    bucket.depth_avg_bid_qty = avg_bid_qty
-                    bucket.depth_avg_ask_qty = avg_ask_qty
+                    self._update_depth_metrics(bucket, book)
+            except DepthCheckpointBridgeError:
+                # A warm start that does not bridge is a cold start: no book was served, so nothing degraded.
+                raise
             except DepthSyncError:
                 bucket.depth_degraded = True
                 bucket.impact_fillable = False
                 bucket.price_impact_100k = None
+                bucket.impact_curve = None
                 raise
 
     def ingest_liquidation_event(
         self,
         event: LiquidationOrderEvent,
         *,
-        raw_payload: dict[str, Any] | None = None,
+        raw_payload: RawPayload = None,
     ) -> None:
         with self._lock:
             self._remember_symbol(event.symbol)
@@ -1388,7 +2131,7 @@ class InMemoryLiveCollector(LiveCollector):
         predicted_funding: float | None,
         next_funding_time: int | None,
         arrival_time: int | None = None,
-        raw_payload: dict[str, Any] | None = None,
+        raw_payload: RawPayload = None,
     ) -> None:
         with self._lock:
             minute_key = floor_to_minute_ms(event_time)
@@ -1396,16 +2139,166 @@ class InMemoryLiveCollector(LiveCollector):
             bucket.predicted_funding = predicted_funding
             bucket.next_funding_time = next_funding_time
 
-    def snapshot_for_minute(self, minute_timestamp_ms: int) -> LiveMinuteFeatures:
-        minute_key = floor_to_minute_ms(minute_timestamp_ms)
+    def ingest_kline(self, *, symbol: str, row: dict[str, Any], closed: bool) -> None:
+        """Keep a ``kline_1m`` bar (REST ``fetch_klines`` row shape) once the exchange closes it."""
+        if not closed:
+            return
         with self._lock:
-            bucket = self._minutes.get(minute_key)
-            if bucket is None:
-                bucket = _MinuteAccumulator(liq_unfilled_supported=self._liquidation_unfilled_supported)
+            self._record_minute_bars(symbol, [(MINUTE_BAR_KLINE, int(row["open_time"]), row)])
 
-            has_ws_latency = bucket.latency_event_count > 0
-            has_depth = bucket.depth_event_count > 0
-            has_liq = bucket.liq_event_count > 0
+    def ingest_mark_price(
+        self,
+        *,
+        symbol: str,
+        event_time: int,
+        mark_price: float | None,
+        index_price: float | None,
+        funding_rate: float | None,
+        next_funding_time: int | None,
+    ) -> None:
+        with self._lock:
+            state = self._market_minute(symbol, event_time)
+            if state is None:
+                return
+            if mark_price is not None:
+                state.mark_ohlc = _extend_ohlc(state.mark_ohlc, mark_price)
+            if index_price is not None:
+                state.index_ohlc = _extend_ohlc(state.index_ohlc, index_price)
+            if mark_price is not None and index_price is not None and funding_rate is not None:
+                state.premium_index = {
+                    "mark_price": mark_price,
+                    "index_price": index_price,
+                    "last_funding_rate": funding_rate,
+                    "next_funding_time": next_funding_time or 0,
+                    "predicted_funding": funding_rate,
+                    "event_time": event_time,
+                }
+
+    def ingest_book_ticker(
+        self,
+        *,
+        symbol: str,
+        event_time: int,
+        bid_price: float,
+        bid_qty: float,
+        ask_price: float,
+        ask_qty: float,
+    ) -> None:
+        with self._lock:
+            state = self._market_minute(symbol, event_time)
+            if state is None:
+                return
+            state.book_ticker = {
+                "bid_price": bid_price,
+                "bid_qty": bid_qty,
+                "ask_price": ask_price,
+                "ask_qty": ask_qty,
+                "event_time": event_time,
+            }
+
+    def flush_market_minutes(self, now_timestamp_ms: int | None = None) -> None:
+        """Finalize mark/index/bookTicker minutes that ended before ``now_timestamp_ms``."""
+        current_minute = floor_to_minute_ms(now_timestamp_ms if now_timestamp_ms is not None else now_ms())
+        with self._lock:
+            for symbol, state in list(self._market_minutes.items()):
+                if state.minute_ms < current_minute:
+                    del self._market_minutes[symbol]
+                    self._flush_market_minute(symbol, state)
+
+    def minute_bars_for_window(
+        self,
+        *,
+        symbol: str,
+        kind: str,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> list[dict[str, object]]:
+        start_ms = int(start_time.astimezone(UTC).timestamp() * 1000)
+        end_ms = int(end_time.astimezone(UTC).timestamp() * 1000)
+        if self._event_store is not None:
+            return self._event_store.minute_bars_for_window(
+                symbol=symbol,
+                kind=kind,
+                start_timestamp_ms=start_ms,
+                end_timestamp_ms=end_ms,
+            )
+        with self._lock:
+            bars = self._minute_bars.get((symbol.upper(), kind), {})
+            return [dict(bars[minute]) for minute in sorted(bars) if start_ms <= minute < end_ms]
+
+    def _market_minute(self, symbol: str, event_time: int) -> _MarketMinuteState | None:
+        symbol_upper = symbol.upper()
+        minute_key = floor_to_minute_ms(event_time)
+        state = self._market_minutes.get(symbol_upper)
+        if state is not None and state.minute_ms == minute_key:
+            return state
+        if state is not None and minute_key < state.minute_ms:
+            return None
+        if state is not None:
+            self._flush_market_minute(symbol_upper, state)
+        state = _MarketMinuteState(minute_ms=minute_key)
+        self._market_minutes[symbol_upper] = state
+        return state
+
+    def _flush_market_minute(self, symbol: str, state: _MarketMinuteState) -> None:
+        minute = state.minute_ms
+        rows: list[tuple[str, int, dict[str, Any]]] = []
+        if state.mark_ohlc is not None:
+            mark_open, mark_high, mark_low, mark_close = state.mark_ohlc
+            rows.append(
+                (
+                    MINUTE_BAR_MARK_PRICE,
+                    minute,
+                    {
+                        "open_time": minute,
+                        "mark_price_open": mark_open,
+                        "mark_price_high": mark_high,
+                        "mark_price_low": mark_low,
+                        "mark_price_close": mark_close,
+                    },
+                )
+            )
+        if state.index_ohlc is not None:
+            index_open, index_high, index_low, index_close = state.index_ohlc
+            rows.append(
+                (
+                    MINUTE_BAR_INDEX_PRICE,
+                    minute,
+                    {
+                        "open_time": minute,
+                        "index_price_open": index_open,
+                        "index_price_high": index_high,
+                        "index_price_low": index_low,
+                        "index_price_close": index_close,
+                    },
+                )
+            )
+        if state.premium_index is not None:
+            rows.append((MINUTE_BAR_PREMIUM_INDEX, minute, state.premium_index))
+        if state.book_ticker is not None:
+            rows.append((MINUTE_BAR_BOOK_TICKER, minute, state.book_ticker))
+        self._record_minute_bars(symbol, rows)
+
+    def _record_minute_bars(self, symbol: str, rows: list[tuple[str, int, dict[str, Any]]]) -> None:
+        symbol_upper = symbol.upper()
+        for kind, minute, row in rows:
+            bars = self._minute_bars.setdefault((symbol_upper, kind), {})
+            bars[minute] = row
+            while len(bars) > MINUTE_BAR_MEMORY_MINUTES:
+                del bars[min(bars)]
+        if self._event_store is not None:
+            self._event_store.upsert_minute_bars(symbol=symbol_upper, rows=rows)
+
+    def snapshot_for_minute(self, minute_timestamp_ms: int) -> LiveMinuteFeatures:
+        minute_key = floor_to_minute_ms(minute_timestamp_ms)
+        with self._lock:
+            bucket = self._minutes.get(minute_key)
+            if bucket is None:
+                bucket = _MinuteAccumulator(liq_unfilled_supported=self._liquidation_unfilled_supported)
+
+            has_ws_latency = bucket.latency_event_count > 0
+            has_depth = bucket.depth_event_count > 0
+            has_liq = bucket.liq_event_count > 0
 
             latency_engine = _p95_int(bucket.latency_engine_values) if has_ws_latency else None
             latency_network = _p95_int(bucket.latency_network_values) if has_ws_latency else None
@@ -1453,6 +2346,7 @@ class InMemoryLiveCollector(LiveCollector):
             update_id_end = bucket.update_id_end if has_depth else None
             price_impact_100k = bucket.price_impact_100k if has_depth else None
             impact_fillable = bucket.impact_fillable if has_depth else None
+            impact_curve = bucket.impact_curve if has_depth else None
 
             db_snapshot = (
                 self._event_store.snapshot_for_minute(minute_timestamp_ms=minute_key, symbol=self._symbol)
@@ -1513,6 +2407,9 @@ class InMemoryLiveCollector(LiveCollector):
                 liq_unfilled_supported=liq_unfilled_supported,
                 predicted_funding=bucket.predicted_funding,
                 next_funding_time=bucket.next_funding_time,
+                impact_curve_notionals=impact_curve.notionals_usdt if impact_curve is not None else None,
+                buy_impact_curve=impact_curve.buy_impacts if impact_curve is not None else None,
+                sell_impact_curve=impact_curve.sell_impacts if impact_curve is not None else None,
             )
 
     def agg_trades_for_window(
@@ -1532,6 +2429,20 @@ class InMemoryLiveCollector(LiveCollector):
             end_timestamp_ms=end_ms,
         )
 
+    def _update_depth_metrics(self, bucket: _MinuteAccumulator, book: DepthOrderBook) -> None:
+        if self._impact_curve_notionals is None:
+            impact, fillable = book.compute_buy_price_impact()
+        else:
+            curve = book.compute_price_impact_curve((*self._impact_curve_notionals, PRICE_IMPACT_NOTIONAL_USDT))
+            impact, fillable = curve.buy_impact(PRICE_IMPACT_NOTIONAL_USDT)
+            bucket.impact_curve = curve
+        spread_pct, avg_bid_qty, avg_ask_qty = book.compute_health_metrics()
+        bucket.price_impact_100k = impact
+        bucket.impact_fillable = fillable
+        bucket.depth_spread_pct = spread_pct
+        bucket.depth_avg_bid_qty = avg_bid_qty
+        bucket.depth_avg_ask_qty = avg_ask_qty
+
     @staticmethod
     def _depth_degraded_for_bucket(bucket: _MinuteAccumulator) -> bool:
         if bucket.depth_degraded:
@@ -1540,19 +2451,11 @@ class InMemoryLiveCollector(LiveCollector):
             return True
         if bucket.impact_fillable is False:
             return True
-        if bucket.depth_spread_pct is not None and bucket.depth_spread_pct > DEPTH_DEGRADED_SPREAD_MAX_PCT:
-            return True
-        if (
-            bucket.depth_avg_bid_qty is not None
-            and bucket.depth_avg_bid_qty < DEPTH_DEGRADED_MIN_AVG_LEVEL_QTY
-        ):
-            return True
-        if (
-            bucket.depth_avg_ask_qty is not None
-            and bucket.depth_avg_ask_qty < DEPTH_DEGRADED_MIN_AVG_LEVEL_QTY
-        ):
-            return True
-        return False
+        return depth_health_degraded(
+            spread_pct=bucket.depth_spread_pct,
+            avg_bid_qty=bucket.depth_avg_bid_qty,
+            avg_ask_qty=bucket.depth_avg_ask_qty,
+        )
 
     def _heartbeat_for(self, consumer_name: str, minute_timestamp_ms: int) -> ConsumerHeartbeat | None:
         return self._heartbeats.get((consumer_name, minute_timestamp_ms))
@@ -1588,26 +2491,60 @@ class BinanceWsPayloadProcessor:
         stream_name: str,
         payload: dict[str, Any],
         arrival_time_ms: int | None = None,
+        raw_frame: str | bytes | None = None,
     ) -> None:
+        """Route one stream payload; ``raw_frame`` (the received text) is stored instead of re-encoding."""
         stream_lower = stream_name.lower()
 
         if "@depth" in stream_lower:
             self._process_depth_payload(stream_name=stream_name, payload=payload, arrival_time_ms=arrival_time_ms)
             return
+        raw_payload: RawPayload = raw_frame if raw_frame is not None else payload
         if "@forceorder" in stream_lower:
-            self._process_liquidation_payload(stream_name=stream_name, payload=payload, arrival_time_ms=arrival_time_ms)
+            self._process_liquidation_payload(
+                stream_name=stream_name,
+                payload=payload,
+                arrival_time_ms=arrival_time_ms,
+                raw_payload=raw_payload,
+            )
             return
         if "@aggtrade" in stream_lower:
-            self._process_agg_trade_payload(stream_name=stream_name, payload=payload, arrival_time_ms=arrival_time_ms)
+            self._process_agg_trade_payload(
+                stream_name=stream_name,
+                payload=payload,
+                arrival_time_ms=arrival_time_ms,
+                raw_payload=raw_payload,
+            )
             return
         if "@markprice" in stream_lower:
-            self._process_mark_price_payload(payload=payload, arrival_time_ms=arrival_time_ms)
+            self._process_mark_price_payload(
+                stream_name=stream_name,
+                payload=payload,
+                arrival_time_ms=arrival_time_ms,
+                raw_payload=raw_payload,
+            )
+            return
+        if "@kline_" in stream_lower:
+            self._process_kline_payload(stream_name=stream_name, payload=payload)
+            return
+        if "@bookticker" in stream_lower:
+            self._process_book_ticker_payload(stream_name=stream_name, payload=payload)
 
-    def process_combined_payload(self, payload: dict[str, Any], arrival_time_ms: int | None = None) -> None:
+    def process_combined_payload(
+        self,
+        payload: dict[str, Any],
+        arrival_time_ms: int | None = None,
+        raw_frame: str | bytes | None = None,
+    ) -> None:
         stream = payload.get("stream")
         data = payload.get("data")
         if isinstance(stream, str) and isinstance(data, dict):
-            self.process_stream_payload(stream_name=stream, payload=data, arrival_time_ms=arrival_time_ms)
+            self.process_stream_payload(
+                stream_name=stream,
+                payload=data,
+                arrival_time_ms=arrival_time_ms,
+                raw_frame=raw_frame,
+            )
 
     def _process_depth_payload(
         self,
@@ -1624,8 +2561,8 @@ class BinanceWsPayloadProcessor:
             return
 
         symbol = str(payload.get("s") or self._symbol_from_stream(stream_name))
-        bid_deltas = list(_parse_depth_levels(payload.get("b")))
-        ask_deltas = list(_parse_depth_levels(payload.get("a")))
+        bid_deltas = _parse_depth_level_arrays(payload.get("b"))
+        ask_deltas = _parse_depth_level_arrays(payload.get("a"))
         previous_final_update_id = _coerce_int(payload.get("pu"))
 
         self._collector.ingest_depth_diff(
@@ -1647,6 +2584,7 @@ class BinanceWsPayloadProcessor:
         stream_name: str,
         payload: dict[str, Any],
         arrival_time_ms: int | None,
+        raw_payload: RawPayload,
     ) -> None:
         order_payload = payload.get("o")
         if not isinstance(order_payload, dict):
@@ -1683,7 +2621,7 @@ class BinanceWsPayloadProcessor:
                 orig_quantity=orig_qty,
                 executed_quantity=executed_qty,
             ),
-            raw_payload=payload,
+            raw_payload=raw_payload,
         )
 
     def _process_agg_trade_payload(
@@ -1692,6 +2630,7 @@ class BinanceWsPayloadProcessor:
         stream_name: str,
         payload: dict[str, Any],
         arrival_time_ms: int | None,
+        raw_payload: RawPayload,
     ) -> None:
         symbol = str(payload.get("s") or self._symbol_from_stream(stream_name))
         event_time = _coerce_int(payload.get("E"))
@@ -1704,10 +2643,18 @@ class BinanceWsPayloadProcessor:
             event_time=event_time,
             transact_time=transact_time,
             arrival_time=arrival_time_ms,
-            raw_payload=payload,
+            raw_payload=raw_payload,
+            agg_trade_id=_coerce_int(payload.get("a")),
         )
 
-    def _process_mark_price_payload(self, *, payload: dict[str, Any], arrival_time_ms: int | None) -> None:
+    def _process_mark_price_payload(
+        self,
+        *,
+        stream_name: str,
+        payload: dict[str, Any],
+        arrival_time_ms: int | None,
+        raw_payload: RawPayload,
+    ) -> None:
         event_time = _coerce_int(payload.get("E"))
         if event_time is None:
             return
@@ -1720,7 +2667,57 @@ class BinanceWsPayloadProcessor:
             predicted_funding=predicted_funding,
             next_funding_time=next_funding_time,
             arrival_time=arrival_time_ms,
-            raw_payload=payload,
+            raw_payload=raw_payload,
+        )
+        self._collector.ingest_mark_price(
+            symbol=str(payload.get("s") or self._symbol_from_stream(stream_name)),
+            event_time=event_time,
+            mark_price=_coerce_float(payload.get("p")),
+            index_price=_coerce_float(payload.get("i")),
+            funding_rate=predicted_funding,
+            next_funding_time=next_funding_time,
+        )
+
+    def _process_kline_payload(self, *, stream_name: str, payload: dict[str, Any]) -> None:
+        kline = payload.get("k")
+        if not isinstance(kline, dict) or kline.get("i") != "1m":
+            return
+        open_time = _coerce_int(kline.get("t"))
+        close_time = _coerce_int(kline.get("T"))
+        trade_count = _coerce_int(kline.get("n"))
+        if open_time is None or close_time is None or trade_count is None:
+            return
+        row: dict[str, Any] = {"open_time": open_time, "close_time": close_time, "trade_count": trade_count}
+        for column, key in _KLINE_FLOAT_FIELDS:
+            value = _coerce_float(kline.get(key))
+            if value is None:
+                return
+            row[column] = value
+
+        self._collector.ingest_kline(
+            symbol=str(payload.get("s") or kline.get("s") or self._symbol_from_stream(stream_name)),
+            row=row,
+            closed=bool(kline.get("x")),
+        )
+
+    def _process_book_ticker_payload(self, *, stream_name: str, payload: dict[str, Any]) -> None:
+        event_time = _coerce_int(payload.get("E"))
+        if event_time is None:
+            event_time = _coerce_int(payload.get("T"))
+        bid_price = _coerce_float(payload.get("b"))
+        bid_qty = _coerce_float(payload.get("B"))
+        ask_price = _coerce_float(payload.get("a"))
+        ask_qty = _coerce_float(payload.get("A"))
+        if event_time is None or bid_price is None or bid_qty is None or ask_price is None or ask_qty is None:
+            return
+
+        self._collector.ingest_book_ticker(
+            symbol=str(payload.get("s") or self._symbol_from_stream(stream_name)),
+            event_time=event_time,
+            bid_price=bid_price,
+            bid_qty=bid_qty,
+            ask_price=ask_price,
+            ask_qty=ask_qty,
         )
 
     def _symbol_from_stream(self, stream_name: str) -> str:
@@ -1730,25 +2727,611 @@ class BinanceWsPayloadProcessor:
         return self._symbol
 
 
+@dataclass(frozen=True, slots=True)
+class ReceiveStreamMetrics:
+    stream: str
+    depth: int
+    enqueued: int
+    processed: int
+    dropped: int
+    spilled: int
+    last_lag_ms: int | None
+    max_lag_ms: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class ReceiveQueueMetrics:
+    name: str
+    depth: int
+    high_watermark: int
+    enqueued: int
+    processed: int
+    dropped: int
+    spilled: int
+    last_lag_ms: int | None
+    max_lag_ms: int | None
+    streams: tuple[ReceiveStreamMetrics, ...] = ()
+
+
+@dataclass(slots=True)
+class _ReceiveStreamCounters:
+    depth: int = 0
+    enqueued: int = 0
+    processed: int = 0
+    dropped: int = 0
+    spilled: int = 0
+    last_lag_ms: int | None = None
+    max_lag_ms: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _ReceiveSource:
+    handler: Callable[[dict[str, Any], int, str | bytes], None]
+    stream: str
+
+
+class ReceiveQueue:
+    """Bounded hand-off between socket readers and their message handlers.
+
+    One dispatcher thread runs the handlers so slow collector/SQLite work does not stall socket reads.
+    Several readers may ``register`` as sources of one queue; their frames are then handled on that
+    single thread in enqueue order, so a supervisor keeps one hand-off point into its collector.
+    When full, ``block`` holds the reader (pings keep flowing on the loop), ``drop_oldest`` evicts
+    the oldest frame, and ``spill`` appends frames to ``spill_path`` until the backlog drains. Spill
+    writes go through a writer thread with one buffered handle, so readers never touch the disk.
+    Depth, lag and drop counters are kept per stream: the combined-stream envelope's ``stream``, or
+    the stream a source registered with.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        handler: Callable[[dict[str, Any], int, str | bytes], None] | None = None,
+        codec: JsonCodec,
+        maxsize: int = 10_000,
+        overflow_policy: str = "block",
+        spill_path: Path | None = None,
+    ) -> None:
+        if overflow_policy not in RECEIVE_OVERFLOW_POLICIES:
+            raise ValueError(f"Unsupported receive overflow policy: {overflow_policy}")
+        if overflow_policy == "spill" and spill_path is None:
+            raise ValueError("spill overflow policy requires spill_path")
+        self._name = name
+        self._codec = codec
+        self._maxsize = max(maxsize, 1)
+        self._overflow_policy = overflow_policy
+        self._spill_path = spill_path
+        self._sources: dict[str, _ReceiveSource] = {}
+        if handler is not None:
+            self._sources[name] = _ReceiveSource(handler=handler, stream=name)
+
+        self._items: deque[tuple[str, str, dict[str, Any], int, str | bytes]] = deque()
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._writer: threading.Thread | None = None
+        # Once spilling starts, newer frames keep going to disk until the spill file is replayed.
+        self._spilling = False
+        self._spill_pending = 0
+        # Spilled lines wait here for the writer; ``_spill_written`` counts those on disk, not yet replayed.
+        self._spill_lines: list[str] = []
+        self._spill_written = 0
+        self._spill_file_lock = threading.Lock()
+        self._spill_handle: Any = None
+        self._space_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+
+        self._high_watermark = 0
+        self._enqueued = 0
+        self._processed = 0
+        self._dropped = 0
+        self._spilled = 0
+        self._last_lag_ms: int | None = None
+        self._max_lag_ms: int | None = None
+        self._streams: dict[str, _ReceiveStreamCounters] = {}
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def register(
+        self,
+        source: str,
+        handler: Callable[[dict[str, Any], int, str | bytes], None],
+        *,
+        stream: str | None = None,
+    ) -> None:
+        """Route frames offered under ``source`` to ``handler``; ``stream`` labels non-envelope frames."""
+        with self._condition:
+            self._sources[source] = _ReceiveSource(handler=handler, stream=stream or source)
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._dispatch_loop, name=f"ws-dispatch-{self._name}", daemon=True)
+        self._thread.start()
+        if self._overflow_policy == "spill":
+            self._writer = threading.Thread(target=self._spill_loop, name=f"ws-spill-{self._name}", daemon=True)
+            self._writer.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        with self._condition:
+            self._condition.notify_all()
+            waiters, self._space_waiters = self._space_waiters, []
+        _wake_space_waiters(waiters)
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        if self._writer is not None:
+            self._writer.join(timeout=5.0)
+            self._writer = None
+        self._close_spill_handle()
+
+    def offer(
+        self,
+        message: dict[str, Any],
+        arrival_time_ms: int,
+        raw_frame: str | bytes,
+        *,
+        source: str | None = None,
+    ) -> bool:
+        """Enqueue without blocking; returns ``False`` only when full under the ``block`` policy."""
+        source_name = source or self._name
+        with self._condition:
+            stream = self._stream_of(source_name, message)
+            if self._spilling or (len(self._items) >= self._maxsize and self._overflow_policy == "spill"):
+                self._spill(source_name, stream, arrival_time_ms, raw_frame)
+                self._condition.notify()
+                return True
+            if len(self._items) >= self._maxsize:
+                if self._overflow_policy == "block":
+                    return False
+                _, dropped_stream, *_ = self._items.popleft()
+                self._dropped += 1
+                dropped_counters = self._stream_counters(dropped_stream)
+                dropped_counters.dropped += 1
+                dropped_counters.depth -= 1
+            self._items.append((source_name, stream, message, arrival_time_ms, raw_frame))
+            self._enqueued += 1
+            counters = self._stream_counters(stream)
+            counters.enqueued += 1
+            counters.depth += 1
+            self._high_watermark = max(self._high_watermark, len(self._items))
+            self._condition.notify()
+        return True
+
+    async def put(
+        self,
+        message: dict[str, Any],
+        arrival_time_ms: int,
+        raw_frame: str | bytes,
+        *,
+        source: str | None = None,
+    ) -> None:
+        while not self.offer(message, arrival_time_ms, raw_frame, source=source):
+            space = asyncio.Event()
+            with self._condition:
+                if self._stop_event.is_set():
+                    return
+                if len(self._items) < self._maxsize:
+                    continue
+                # The dispatcher sets this once it takes a frame off the queue.
+                self._space_waiters.append((asyncio.get_running_loop(), space))
+            await space.wait()
+
+    def metrics(self) -> ReceiveQueueMetrics:
+        with self._condition:
+            return ReceiveQueueMetrics(
+                name=self._name,
+                depth=len(self._items) + self._spill_pending,
+                high_watermark=self._high_watermark,
+                enqueued=self._enqueued,
+                processed=self._processed,
+                dropped=self._dropped,
+                spilled=self._spilled,
+                last_lag_ms=self._last_lag_ms,
+                max_lag_ms=self._max_lag_ms,
+                streams=tuple(
+                    ReceiveStreamMetrics(
+                        stream=stream,
+                        depth=counters.depth,
+                        enqueued=counters.enqueued,
+                        processed=counters.processed,
+                        dropped=counters.dropped,
+                        spilled=counters.spilled,
+                        last_lag_ms=counters.last_lag_ms,
+                        max_lag_ms=counters.max_lag_ms,
+                    )
+                    for stream, counters in sorted(self._streams.items())
+                ),
+            )
+
+    def drain(self) -> int:
+        """Process everything queued (memory, then spill) on the calling thread."""
+        processed = 0
+        while True:
+            waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+            with self._condition:
+                item = self._items.popleft() if self._items else None
+                if item is not None and self._space_waiters:
+                    waiters, self._space_waiters = self._space_waiters, []
+            _wake_space_waiters(waiters)
+            if item is not None:
+                self._dispatch(*item)
+                processed += 1
+                continue
+            if self._writer is None:
+                self._write_spill()
+            replayed = self._replay_spill()
+            if replayed == 0:
+                return processed
+            processed += replayed
+
+    def _stream_of(self, source: str, message: dict[str, Any]) -> str:
+        stream = message.get("stream")
+        if isinstance(stream, str):
+            return stream
+        registered = self._sources.get(source)
+        return registered.stream if registered is not None else source
+
+    def _stream_counters(self, stream: str) -> _ReceiveStreamCounters:
+        counters = self._streams.get(stream)
+        if counters is None:
+            counters = self._streams[stream] = _ReceiveStreamCounters()
+        return counters
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._items and self._spill_written == 0 and not self._stop_event.is_set():
+                    self._condition.wait(timeout=1.0)
+                if self._stop_event.is_set() and not self._items and self._spill_pending == 0:
+                    return
+            self.drain()
+            if self._stop_event.is_set():
+                # The writer may still hold the last spilled lines; wait for them instead of spinning.
+                with self._condition:
+                    if not self._items and self._spill_written == 0 and self._spill_pending > 0:
+                        self._condition.wait(timeout=0.05)
+
+    def _spill_loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._spill_lines and not self._stop_event.is_set():
+                    self._condition.wait(timeout=1.0)
+                if not self._spill_lines and self._stop_event.is_set():
+                    return
+            self._write_spill()
+
+    def _write_spill(self) -> None:
+        """Append queued spill lines through the buffered handle; the disk I/O runs outside ``_condition``."""
+        with self._spill_file_lock:
+            with self._condition:
+                lines, self._spill_lines = self._spill_lines, []
+            if not lines or self._spill_path is None:
+                return
+            if self._spill_handle is None:
+                self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+                self._spill_handle = self._spill_path.open("a", encoding="utf-8")
+            self._spill_handle.writelines(lines)
+            self._spill_handle.flush()
+            with self._condition:
+                self._spill_written += len(lines)
+                self._condition.notify_all()
+
+    def _close_spill_handle(self) -> None:
+        with self._spill_file_lock:
+            if self._spill_handle is not None:
+                self._spill_handle.close()
+                self._spill_handle = None
+
+    def _dispatch(
+        self,
+        source: str,
+        stream: str,
+        message: dict[str, Any],
+        arrival_time_ms: int,
+        raw_frame: str | bytes,
+    ) -> None:
+        lag_ms = max(now_ms() - arrival_time_ms, 0)
+        with self._condition:
+            registered = self._sources.get(source)
+        if registered is None:
+            logger.warning("Dropping frame from unregistered receive source", extra={"queue": self._name})
+        else:
+            try:
+                registered.handler(message, arrival_time_ms, raw_frame)
+            except Exception:
+                logger.exception("Receive queue handler failed", extra={"queue": self._name, "stream": stream})
+        with self._condition:
+            self._processed += 1
+            self._last_lag_ms = lag_ms
+            self._max_lag_ms = lag_ms if self._max_lag_ms is None else max(self._max_lag_ms, lag_ms)
+            counters = self._stream_counters(stream)
+            counters.processed += 1
+            counters.depth -= 1
+            counters.last_lag_ms = lag_ms
+            counters.max_lag_ms = lag_ms if counters.max_lag_ms is None else max(counters.max_lag_ms, lag_ms)
+
+    def _spill(self, source: str, stream: str, arrival_time_ms: int, raw_frame: str | bytes) -> None:
+        if self._spill_path is None:
+            return
+        raw_text = raw_frame.decode("utf-8") if isinstance(raw_frame, bytes) else raw_frame
+        # JSON frames only contain newlines as insignificant whitespace, so one frame per line is safe.
+        single_line = raw_text.replace("\n", " ")
+        self._spill_lines.append(f"{arrival_time_ms}\t{source}\t{stream}\t{single_line}\n")
+        self._spilling = True
+        self._spill_pending += 1
+        self._spilled += 1
+        self._enqueued += 1
+        counters = self._stream_counters(stream)
+        counters.spilled += 1
+        counters.enqueued += 1
+        counters.depth += 1
+
+    def _replay_spill(self) -> int:
+        if self._spill_path is None:
+            return 0
+        draining_path = self._spill_path.with_suffix(self._spill_path.suffix + ".draining")
+        with self._spill_file_lock:
+            with self._condition:
+                if self._spill_written == 0 or self._items:
+                    return 0
+            # Lines the writer appends from here on start a new spill file behind this one.
+            if self._spill_handle is not None:
+                self._spill_handle.close()
+                self._spill_handle = None
+            self._spill_path.replace(draining_path)
+
+        replayed = 0
+        with draining_path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                arrival_text, source, stream, raw_text = line.rstrip("\n").split("\t", maxsplit=3)
+                with self._condition:
+                    self._spill_pending = max(self._spill_pending - 1, 0)
+                    self._spill_written = max(self._spill_written - 1, 0)
+                try:
+                    message = self._codec.loads(raw_text)
+                except self._codec.decode_errors:
+                    message = None
+                if isinstance(message, dict):
+                    self._dispatch(source, stream, message, int(arrival_text), raw_text)
+                    replayed += 1
+                else:
+                    with self._condition:
+                        self._stream_counters(stream).depth -= 1
+        draining_path.unlink(missing_ok=True)
+        with self._condition:
+            if self._spill_pending == 0:
+                self._spilling = False
+        return replayed
+
+
+def _wake_space_waiters(waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]]) -> None:
+    for loop, space in waiters:
+        try:
+            loop.call_soon_threadsafe(space.set)
+        except RuntimeError:
+            pass
+
+
+def _build_receive_queue(
+    name: str,
+    *,
+    codec: JsonCodec,
+    maxsize: int,
+    overflow_policy: str,
+    spill_dir: Path | None,
+) -> ReceiveQueue | None:
+    if maxsize <= 0:
+        return None
+    return ReceiveQueue(
+        name=name,
+        codec=codec,
+        maxsize=maxsize,
+        overflow_policy=overflow_policy,
+        spill_path=spill_dir / f"{name}.spill.jsonl" if spill_dir is not None else None,
+    )
+
+
+def _log_receive_queue_metrics(metrics: ReceiveQueueMetrics) -> None:
+    for stream in metrics.streams:
+        logger.info(
+            "WebSocket receive queue",
+            extra={
+                "queue": metrics.name,
+                "stream": stream.stream,
+                "depth": stream.depth,
+                "enqueued": stream.enqueued,
+                "dropped": stream.dropped,
+                "spilled": stream.spilled,
+                "last_lag_ms": stream.last_lag_ms,
+                "max_lag_ms": stream.max_lag_ms,
+            },
+        )
+    logger.info(
+        "WebSocket receive queue totals",
+        extra={
+            "queue": metrics.name,
+            "depth": metrics.depth,
+            "high_watermark": metrics.high_watermark,
+            "dropped": metrics.dropped,
+            "spilled": metrics.spilled,
+            "max_lag_ms": metrics.max_lag_ms,
+        },
+    )
+
+
+def stream_event_dedup_key(stream_name: str, payload: dict[str, Any]) -> tuple[object, ...] | None:
+    """Identity of a stream event across redundant connections: agg trade id, depth ``u``, forceOrder fields."""
+    stream = stream_name.lower()
+    event_type = payload.get("e")
+    if event_type == "aggTrade":
+        return (stream, payload.get("a"))
+    if event_type == "depthUpdate":
+        return (stream, payload.get("u"))
+    if event_type == "forceOrder":
+        order = payload.get("o")
+        if not isinstance(order, dict):
+            return None
+        return (stream, payload.get("E"), order.get("S"), order.get("p"), order.get("q"), order.get("T"))
+    event_time = payload.get("E")
+    if event_time is None:
+        return None
+    return (stream, event_type, event_time)
+
+
+@dataclass(frozen=True, slots=True)
+class RedundantConnectionMetrics:
+    connection: str
+    wins: int
+    losses: int
+    lead_ms_total: int
+
+    @property
+    def win_rate(self) -> float | None:
+        total = self.wins + self.losses
+        if total == 0:
+            return None
+        return self.wins / total
+
+    @property
+    def mean_lead_ms(self) -> float | None:
+        if self.wins == 0:
+            return None
+        return self.lead_ms_total / self.wins
+
+
+class StreamDeduplicator:
+    """Forward the earliest copy of each event received over redundant connections.
+
+    Event keys are remembered for the last ``window`` distinct events. Dispatch happens under the
+    dedup lock, so handlers see one ordered stream even when connections deliver on different threads.
+    """
+
+    def __init__(self, connections: Sequence[str], *, window: int = STREAM_DEDUP_WINDOW) -> None:
+        self._window = max(1, window)
+        self._lock = threading.Lock()
+        self._seen: dict[tuple[object, ...], tuple[str, int]] = {}
+        self._wins = dict.fromkeys(connections, 0)
+        self._losses = dict.fromkeys(connections, 0)
+        self._lead_ms = dict.fromkeys(connections, 0)
+
+    def dispatch(
+        self,
+        connection: str,
+        stream_name: str,
+        payload: dict[str, Any],
+        arrival_time_ms: int,
+        raw_frame: str | bytes | None,
+        handler: Callable[[dict[str, Any], int, str | bytes | None], None],
+    ) -> bool:
+        """Run ``handler`` if this is the first arrival of the event; returns whether it ran."""
+        key = stream_event_dedup_key(stream_name, payload)
+        with self._lock:
+            if key is not None:
+                first = self._seen.get(key)
+                if first is not None:
+                    winner, first_arrival_ms = first
+                    self._losses[connection] = self._losses.get(connection, 0) + 1
+                    self._lead_ms[winner] = self._lead_ms.get(winner, 0) + max(arrival_time_ms - first_arrival_ms, 0)
+                    return False
+                self._seen[key] = (connection, arrival_time_ms)
+                if len(self._seen) > self._window:
+                    # dicts keep insertion order, so the first key is the oldest.
+                    del self._seen[next(iter(self._seen))]
+                self._wins[connection] = self._wins.get(connection, 0) + 1
+            handler(payload, arrival_time_ms, raw_frame)
+        return True
+
+    def metrics(self) -> list[RedundantConnectionMetrics]:
+        with self._lock:
+            return [
+                RedundantConnectionMetrics(
+                    connection=connection,
+                    wins=self._wins[connection],
+                    losses=self._losses.get(connection, 0),
+                    lead_ms_total=self._lead_ms.get(connection, 0),
+                )
+                for connection in self._wins
+            ]
+
+
+def combined_stream_url(websocket_base_url: str, stream_names: Sequence[str]) -> str:
+    base = websocket_base_url.rstrip("/")
+    for suffix in ("/ws", "/stream"):
+        if base.endswith(suffix):
+            base = base[: -len(suffix)]
+            break
+    if not stream_names:
+        return f"{base}/stream"
+    return f"{base}/stream?streams={'/'.join(stream_names)}"
+
+
+def _load_websockets_module() -> Any | None:
+    try:
+        import websockets  # type: ignore
+    except ImportError:
+        logger.error("websockets package is required for live stream workers; install with `pip install websockets`")
+        return None
+    return websockets
+
+
 class BinanceWebSocketWorker:
     def __init__(
         self,
         *,
         name: str,
-        url: str,
-        on_message: Callable[[dict[str, Any], int], None],
+        url: str | Callable[[], str],
+        on_message: Callable[[dict[str, Any], int, str | bytes], None],
         on_connection_change: Callable[[bool], None] | None = None,
         reconnect_seconds: float = 2.0,
-        read_timeout_seconds: float = 1.0,
+        max_reconnect_seconds: float = 30.0,
+        codec: JsonCodec | None = None,
+        receive_queue_size: int = 0,
+        overflow_policy: str = "block",
+        spill_dir: Path | None = None,
+        receive_queue: ReceiveQueue | None = None,
+        stream: str | None = None,
     ) -> None:
         self._name = name
         self._url = url
         self._on_message = on_message
+        self._codec = codec or JsonCodec()
+        # A shared ``receive_queue`` is started and stopped by its owner; a private one by this worker.
+        self._receive_queue = receive_queue
+        self._owns_receive_queue = False
+        if receive_queue is None and receive_queue_size > 0:
+            self._receive_queue = ReceiveQueue(
+                name=name,
+                codec=self._codec,
+                maxsize=receive_queue_size,
+                overflow_policy=overflow_policy,
+                spill_path=spill_dir / f"{name}.spill.jsonl" if spill_dir is not None else None,
+            )
+            self._owns_receive_queue = True
+        if self._receive_queue is not None:
+            self._receive_queue.register(name, on_message, stream=stream)
         self._on_connection_change = on_connection_change
         self._reconnect_seconds = reconnect_seconds
-        self._read_timeout_seconds = read_timeout_seconds
+        self._max_reconnect_seconds = max(max_reconnect_seconds, reconnect_seconds)
         self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
+        self._connected_since_retry = False
+        self._reconnect_event = threading.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def receive_queue_metrics(self) -> ReceiveQueueMetrics | None:
+        if self._receive_queue is None:
+            return None
+        return self._receive_queue.metrics()
 
     def start(self) -> None:
         if self._thread is not None and self._thread.is_alive():
@@ -1758,170 +3341,914 @@ class BinanceWebSocketWorker:
         self._thread.start()
 
     def stop(self) -> None:
-        self._stop_event.set()
+        self.request_stop()
         if self._thread is not None:
             self._thread.join(timeout=5.0)
 
-    def _run_loop(self) -> None:
+    def request_stop(self) -> None:
+        self._stop_event.set()
+        self._signal_wake()
+
+    def request_reconnect(self) -> None:
+        """Drop the current connection and reconnect immediately (re-evaluating a callable ``url``)."""
+        self._reconnect_event.set()
+        self._signal_wake()
+
+    def _signal_wake(self) -> None:
+        # Safe from any thread: the wake event belongs to the worker's event loop.
+        loop, wake = self._loop, self._wake
+        if loop is None or wake is None or loop.is_closed():
+            return
         try:
-            import websockets  # type: ignore
-        except ImportError:
-            logger.error(
-                "websockets package is required for live stream workers; install with `pip install websockets`"
-            )
+            loop.call_soon_threadsafe(wake.set)
+        except RuntimeError:
+            pass
+
+    def _current_url(self) -> str:
+        return self._url() if callable(self._url) else self._url
+
+    def clear_stop(self) -> None:
+        self._stop_event.clear()
+
+    def _run_loop(self) -> None:
+        websockets = _load_websockets_module()
+        if websockets is None:
             return
 
         with asyncio.Runner() as runner:
-            while not self._stop_event.is_set():
-                try:
-                    runner.run(self._run_once(websockets))
-                except Exception:
-                    logger.exception("WebSocket worker failed", extra={"worker": self._name, "url": self._url})
-                finally:
-                    self._publish_connection(False)
+            runner.run(self.run_forever(websockets))
+
+    async def run_forever(self, websockets_module: Any) -> None:
+        """Connect and reconnect until stopped; backoff doubles per failed attempt and resets once connected."""
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        if self._receive_queue is not None and self._owns_receive_queue:
+            self._receive_queue.start()
+        try:
+            await self._reconnect_forever(websockets_module)
+        finally:
+            self._loop = None
+            self._wake = None
+            if self._receive_queue is not None and self._owns_receive_queue:
+                self._receive_queue.stop()
 
-                if self._stop_event.is_set():
-                    break
-                time.sleep(self._reconnect_seconds)
+    async def _reconnect_forever(self, websockets_module: Any) -> None:
+        failures = 0
+        while not self._stop_event.is_set():
+            self._connected_since_retry = False
+            try:
+                await self._run_once(websockets_module)
+            except Exception:
+                logger.exception("WebSocket worker failed", extra={"worker": self._name})
+            finally:
+                self._publish_connection(False)
+
+            if self._stop_event.is_set():
+                break
+            if self._reconnect_event.is_set():
+                self._reconnect_event.clear()
+                self._clear_wake()
+                continue
+            failures = 0 if self._connected_since_retry else failures + 1
+            delay = min(self._reconnect_seconds * (2**failures), self._max_reconnect_seconds)
+            await self._sleep_unless_woken(delay)
+            if self._reconnect_event.is_set() and not self._stop_event.is_set():
+                self._reconnect_event.clear()
+                self._clear_wake()
+
+    def _clear_wake(self) -> None:
+        if self._wake is not None:
+            self._wake.clear()
+
+    def _wake_requested(self) -> bool:
+        return self._stop_event.is_set() or self._reconnect_event.is_set()
+
+    async def _sleep_unless_woken(self, delay: float) -> None:
+        if self._wake is None:
+            await asyncio.sleep(delay)
+            return
+        deadline = asyncio.get_running_loop().time() + delay
+        while not self._wake_requested():
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=remaining)
+            except TimeoutError:
+                return
+            # A wake scheduled before its request was already handled carries no request; re-arm.
+            if not self._wake_requested():
+                self._wake.clear()
 
     async def _run_once(self, websockets_module: Any) -> None:
         async with websockets_module.connect(
-            self._url,
+            self._current_url(),
             ping_interval=20,
             ping_timeout=20,
             close_timeout=5,
             max_size=2**22,
         ) as websocket:
             self._publish_connection(True)
+            if self._wake is None:
+                await self._receive(websocket)
+                return
 
-            while not self._stop_event.is_set():
-                try:
-                    payload = await asyncio.wait_for(websocket.recv(), timeout=self._read_timeout_seconds)
-                except TimeoutError:
-                    continue
-
-                raw_text: str
-                if isinstance(payload, bytes):
-                    raw_text = payload.decode("utf-8")
-                else:
-                    raw_text = payload
-
-                try:
-                    message = json.loads(raw_text)
-                except json.JSONDecodeError:
-                    logger.debug("Dropping non-JSON WebSocket payload", extra={"worker": self._name})
-                    continue
+            # Race the receive loop against the wake event so stop/reconnect never waits on a read timeout.
+            receive_task = asyncio.ensure_future(self._receive(websocket))
+            wake_task: asyncio.Future[Any] | None = None
+            try:
+                while True:
+                    wake_task = asyncio.ensure_future(self._wake.wait())
+                    done, _ = await asyncio.wait({receive_task, wake_task}, return_when=asyncio.FIRST_COMPLETED)
+                    if receive_task in done or self._wake_requested():
+                        break
+                    # A stale wake (its request already handled) must not end a healthy connection.
+                    self._wake.clear()
+            finally:
+                tasks = [task for task in (receive_task, wake_task) if task is not None]
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            error = receive_task.exception() if receive_task.done() and not receive_task.cancelled() else None
+            if error is not None:
+                raise error
+
+    async def _receive(self, websocket: Any) -> None:
+        async for payload in websocket:
+            try:
+                message = self._codec.loads(payload)
+            except self._codec.decode_errors:
+                logger.debug("Dropping non-JSON WebSocket payload", extra={"worker": self._name})
+                continue
 
-                self._on_message(message, now_ms())
+            if self._receive_queue is not None:
+                await self._receive_queue.put(message, now_ms(), payload, source=self._name)
+            else:
+                self._on_message(message, now_ms(), payload)
 
     def _publish_connection(self, connected: bool) -> None:
+        if connected:
+            self._connected_since_retry = True
         if self._on_connection_change is None:
             return
         self._on_connection_change(connected)
 
 
-class BinanceLiveStreamSupervisor:
-    """Supervisor for depth, forceOrder, and aggTrade stream ingestion."""
+class BinanceWebSocketLoop:
+    """Run several ``BinanceWebSocketWorker`` connections as tasks on one asyncio loop thread.
 
-    def __init__(
-        self,
-        *,
-        symbol: str,
-        websocket_base_url: str,
-        rest_client: Any,
-        collector: InMemoryLiveCollector,
-        depth_snapshot_limit: int = 1000,
-        reconnect_seconds: float = 2.0,
-        heartbeat_interval_seconds: float = 1.0,
-    ) -> None:
-        self._symbol = symbol.upper()
-        self._symbol_lower = self._symbol.lower()
-        self._websocket_base_url = websocket_base_url
-        self._rest_client = rest_client
-        self._collector = collector
-        self._depth_snapshot_limit = depth_snapshot_limit
-        self._reconnect_seconds = reconnect_seconds
-        self._heartbeat_interval_seconds = heartbeat_interval_seconds
-        self._processor = BinanceWsPayloadProcessor(collector=collector, symbol=self._symbol)
+    Every message handler runs on that single thread, so cross-stream ordering follows arrival order.
+    """
 
-        self._connection_state: dict[str, _WorkerConnectionState] = {
-            CONSUMER_WS_LATENCY: _WorkerConnectionState(),
-            CONSUMER_DEPTH: _WorkerConnectionState(),
-            CONSUMER_LIQUIDATION: _WorkerConnectionState(),
-        }
-        self._state_lock = threading.RLock()
+    def __init__(self, workers: Sequence[BinanceWebSocketWorker], *, name: str = "ws-loop") -> None:
+        self._workers = list(workers)
+        self._name = name
+        self._thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._websockets_module: Any = None
+        self._tasks: set[asyncio.Task[None]] = set()
 
-        self._workers: list[BinanceWebSocketWorker] = []
-        self._heartbeat_thread: threading.Thread | None = None
-        self._stop_event = threading.Event()
+    def add_worker(self, worker: BinanceWebSocketWorker) -> None:
+        """Attach another connection; safe to call from any thread while the loop is running."""
+        self._workers.append(worker)
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._spawn, worker)
 
     def start(self) -> None:
-        if self._workers:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        for worker in self._workers:
+            worker.clear_stop()
+        self._thread = threading.Thread(target=self._run_loop, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        for worker in self._workers:
+            worker.request_stop()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def _run_loop(self) -> None:
+        websockets = _load_websockets_module()
+        if websockets is None:
+            return
+
+        with asyncio.Runner() as runner:
+            runner.run(self.run_workers(websockets))
+
+    async def run_workers(self, websockets_module: Any) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._websockets_module = websockets_module
+        for worker in list(self._workers):
+            self._spawn(worker)
+        try:
+            while self._tasks:
+                done, _ = await asyncio.wait(self._tasks)
+                self._tasks -= done
+        finally:
+            self._loop = None
+
+    def _spawn(self, worker: BinanceWebSocketWorker) -> None:
+        self._tasks.add(asyncio.get_running_loop().create_task(worker.run_forever(self._websockets_module)))
+
+
+@dataclass(frozen=True, slots=True)
+class DepthResyncMetrics:
+    requests: int
+    coalesced: int
+    resyncs: int
+    failures: int
+    in_flight: bool
+    last_duration_ms: int | None
+    total_duration_ms: int
+    degraded_minutes: int
+
+
+@dataclass(frozen=True, slots=True)
+class DepthWarmStartMetrics:
+    attempts: int
+    confirmed: int
+    fallbacks: int
+
+
+class DepthResyncController:
+    """Run depth REST resyncs off the receive thread.
+
+    Requests that arrive while one is already queued are coalesced, snapshots are spaced so they
+    stay within ``weight_budget_per_minute`` of REST weight, and failures back off exponentially.
+    """
+
+    def __init__(
+        self,
+        *,
+        symbol: str,
+        resync: Callable[[int], bool],
+        snapshot_weight: int = 20,
+        weight_budget_per_minute: int = DEPTH_RESYNC_WEIGHT_BUDGET_PER_MINUTE,
+        max_backoff_seconds: float = DEPTH_RESYNC_MAX_BACKOFF_SECONDS,
+    ) -> None:
+        self._symbol = symbol.upper()
+        self._resync = resync
+        self._min_interval_seconds = 60.0 * snapshot_weight / max(weight_budget_per_minute, 1)
+        self._max_backoff_seconds = max(max_backoff_seconds, self._min_interval_seconds)
+
+        self._lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._pending = False
+        self._in_flight = False
+        self._requested_at_ms = 0
+        self._degraded_since_ms: int | None = None
+        self._next_allowed_monotonic = 0.0
+        self._consecutive_failures = 0
+
+        self._requests = 0
+        self._coalesced = 0
+        self._resyncs = 0
+        self._failures = 0
+        self._last_duration_ms: int | None = None
+        self._total_duration_ms = 0
+        self._degraded_minutes = 0
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_loop, name=f"depth-resync-{self._symbol}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def request(self, arrival_time_ms: int, *, degraded: bool = True) -> bool:
+        """Queue a resync; returns ``False`` when it was coalesced into one already queued.
+
+        ``degraded=False`` marks a first snapshot (no book was being served), which does not count
+        towards ``degraded_minutes``.
+        """
+        with self._lock:
+            self._requests += 1
+            if degraded and self._degraded_since_ms is None:
+                self._degraded_since_ms = arrival_time_ms
+            self._requested_at_ms = arrival_time_ms
+            if self._pending:
+                self._coalesced += 1
+                return False
+            self._pending = True
+        self._wake_event.set()
+        return True
+
+    def metrics(self) -> DepthResyncMetrics:
+        with self._lock:
+            return DepthResyncMetrics(
+                requests=self._requests,
+                coalesced=self._coalesced,
+                resyncs=self._resyncs,
+                failures=self._failures,
+                in_flight=self._in_flight,
+                last_duration_ms=self._last_duration_ms,
+                total_duration_ms=self._total_duration_ms,
+                degraded_minutes=self._degraded_minutes,
+            )
+
+    def run_pending(self) -> bool:
+        """Run the queued resync now if pacing allows; returns whether a resync was attempted."""
+        with self._lock:
+            if not self._pending or time.monotonic() < self._next_allowed_monotonic:
+                return False
+            self._pending = False
+            self._in_flight = True
+            requested_at_ms = self._requested_at_ms
+
+        started = time.monotonic()
+        succeeded = False
+        try:
+            succeeded = self._resync(requested_at_ms)
+        except Exception:
+            logger.exception("Depth resync raised", extra={"symbol": self._symbol})
+        finished = time.monotonic()
+        duration_ms = int((finished - started) * 1000)
+
+        with self._lock:
+            self._in_flight = False
+            self._last_duration_ms = duration_ms
+            self._total_duration_ms += duration_ms
+            if succeeded:
+                self._resyncs += 1
+                self._consecutive_failures = 0
+                self._next_allowed_monotonic = finished + self._min_interval_seconds
+                if not self._pending and self._degraded_since_ms is not None:
+                    self._degraded_minutes += (
+                        floor_to_minute_ms(now_ms()) - floor_to_minute_ms(self._degraded_since_ms)
+                    ) // MINUTE_MS + 1
+                    self._degraded_since_ms = None
+            else:
+                self._failures += 1
+                self._consecutive_failures += 1
+                backoff = min(
+                    self._min_interval_seconds * (2**self._consecutive_failures),
+                    self._max_backoff_seconds,
+                )
+                self._next_allowed_monotonic = finished + backoff
+                self._pending = True
+            retry_pending = self._pending
+
+        logger.info(
+            "Depth resync finished",
+            extra={"symbol": self._symbol, "succeeded": succeeded, "duration_ms": duration_ms},
+        )
+        if retry_pending:
+            self._wake_event.set()
+        return True
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.is_set():
+            if not self._wake_event.wait(timeout=1.0):
+                continue
+            self._wake_event.clear()
+            with self._lock:
+                delay = self._next_allowed_monotonic - time.monotonic() if self._pending else 0.0
+            if delay > 0 and self._stop_event.wait(delay):
+                break
+            self.run_pending()
+
+
+@dataclass(frozen=True, slots=True)
+class AggTradeGap:
+    symbol: str
+    first_missing_id: int
+    last_missing_id: int
+    detected_at_ms: int
+
+    @property
+    def size(self) -> int:
+        return self.last_missing_id - self.first_missing_id + 1
+
+
+@dataclass(frozen=True, slots=True)
+class AggTradeBackfillMetrics:
+    last_agg_trade_id: int | None
+    gaps_detected: int
+    gaps_filled: int
+    gaps_skipped: int
+    pending_gaps: int
+    missing_trades: int
+    trades_backfilled: int
+    failures: int
+
+
+class AggTradeBackfiller:
+    """Track aggTrade ``a`` id continuity and fetch missing id ranges via REST ``fromId`` off the receive thread.
+
+    ``fetch_from_id(from_id, limit)`` returns REST aggTrades in ``fetch_agg_trades`` row shape and
+    ``store(trades)`` persists them (returning rows inserted). Gaps larger than ``max_gap_trades`` are
+    logged and left to the orchestrator's REST fallback.
+    """
+
+    def __init__(
+        self,
+        *,
+        symbol: str,
+        fetch_from_id: Callable[[int, int], list[dict[str, Any]]],
+        store: Callable[[list[dict[str, Any]]], int],
+        last_agg_trade_id: int | None = None,
+        max_gap_trades: int = AGG_TRADE_BACKFILL_MAX_GAP,
+        page_limit: int = AGG_TRADE_BACKFILL_PAGE_LIMIT,
+        retry_seconds: float = 2.0,
+        max_backoff_seconds: float = 60.0,
+    ) -> None:
+        self._symbol = symbol.upper()
+        self._fetch_from_id = fetch_from_id
+        self._store = store
+        self._max_gap_trades = max_gap_trades
+        self._page_limit = page_limit
+        self._retry_seconds = retry_seconds
+        self._max_backoff_seconds = max(max_backoff_seconds, retry_seconds)
+
+        self._lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._last_agg_trade_id = last_agg_trade_id
+        self._pending: deque[AggTradeGap] = deque()
+        self._consecutive_failures = 0
+
+        self._gaps_detected = 0
+        self._gaps_filled = 0
+        self._gaps_skipped = 0
+        self._missing_trades = 0
+        self._trades_backfilled = 0
+        self._failures = 0
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
             return
-
         self._stop_event.clear()
-        self._resync_depth_book(minute_timestamp_ms=now_ms())
+        self._thread = threading.Thread(target=self._run_loop, name=f"agg-backfill-{self._symbol}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def observe(self, agg_trade_id: int | None, arrival_time_ms: int | None = None) -> AggTradeGap | None:
+        """Record a live trade id; returns the gap it reveals (already queued for backfill), if any."""
+        if agg_trade_id is None:
+            return None
+        with self._lock:
+            previous = self._last_agg_trade_id
+            if previous is not None and agg_trade_id <= previous:
+                return None
+            self._last_agg_trade_id = agg_trade_id
+            if previous is None or agg_trade_id == previous + 1:
+                return None
+
+            gap = AggTradeGap(
+                symbol=self._symbol,
+                first_missing_id=previous + 1,
+                last_missing_id=agg_trade_id - 1,
+                detected_at_ms=arrival_time_ms if arrival_time_ms is not None else now_ms(),
+            )
+            self._gaps_detected += 1
+            if gap.size > self._max_gap_trades:
+                self._gaps_skipped += 1
+                skipped = True
+            else:
+                self._pending.append(gap)
+                self._missing_trades += gap.size
+                skipped = False
+
+        if skipped:
+            logger.warning(
+                "aggTrade gap too large for id backfill",
+                extra={"symbol": self._symbol, "first_missing_id": gap.first_missing_id, "missing": gap.size},
+            )
+        else:
+            logger.info(
+                "aggTrade gap detected",
+                extra={"symbol": self._symbol, "first_missing_id": gap.first_missing_id, "missing": gap.size},
+            )
+            self._wake_event.set()
+        return gap
+
+    def metrics(self) -> AggTradeBackfillMetrics:
+        with self._lock:
+            return AggTradeBackfillMetrics(
+                last_agg_trade_id=self._last_agg_trade_id,
+                gaps_detected=self._gaps_detected,
+                gaps_filled=self._gaps_filled,
+                gaps_skipped=self._gaps_skipped,
+                pending_gaps=len(self._pending),
+                missing_trades=self._missing_trades,
+                trades_backfilled=self._trades_backfilled,
+                failures=self._failures,
+            )
+
+    def run_pending(self) -> bool:
+        """Fill the oldest queued gap; returns ``False`` when nothing was queued or the fetch failed."""
+        with self._lock:
+            if not self._pending:
+                return False
+            gap = self._pending[0]
+
+        next_id = gap.first_missing_id
+        try:
+            while next_id <= gap.last_missing_id:
+                page = self._fetch_from_id(next_id, self._page_limit)
+                in_range = [trade for trade in page if next_id <= int(trade["agg_trade_id"]) <= gap.last_missing_id]
+                if in_range:
+                    inserted = self._store(in_range)
+                    with self._lock:
+                        self._trades_backfilled += inserted
+                if not page or int(page[-1]["agg_trade_id"]) >= gap.last_missing_id:
+                    break
+                next_id = int(page[-1]["agg_trade_id"]) + 1
+        except Exception:
+            logger.exception("aggTrade backfill failed", extra={"symbol": self._symbol, "from_id": next_id})
+            with self._lock:
+                self._failures += 1
+                self._consecutive_failures += 1
+                # Resume from the first id not yet stored.
+                self._pending[0] = AggTradeGap(
+                    symbol=gap.symbol,
+                    first_missing_id=next_id,
+                    last_missing_id=gap.last_missing_id,
+                    detected_at_ms=gap.detected_at_ms,
+                )
+            return False
+
+        with self._lock:
+            self._pending.popleft()
+            self._gaps_filled += 1
+            self._consecutive_failures = 0
+        return True
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.is_set():
+            if not self._wake_event.wait(timeout=1.0):
+                continue
+            self._wake_event.clear()
+            while not self._stop_event.is_set():
+                with self._lock:
+                    has_pending = bool(self._pending)
+                if not has_pending:
+                    break
+                if not self.run_pending():
+                    with self._lock:
+                        backoff = min(
+                            self._retry_seconds * (2 ** max(self._consecutive_failures - 1, 0)),
+                            self._max_backoff_seconds,
+                        )
+                    if self._stop_event.wait(backoff):
+                        return
 
+
+class BinanceLiveStreamSupervisor:
+    """Supervisor for depth, forceOrder, and aggTrade stream ingestion."""
+
+    def __init__(
+        self,
+        *,
+        symbol: str,
+        websocket_base_url: str,
+        rest_client: Any,
+        collector: InMemoryLiveCollector,
+        depth_snapshot_limit: int = 1000,
+        reconnect_seconds: float = 2.0,
+        heartbeat_interval_seconds: float = 1.0,
+        checkpoint_store: DepthCheckpointStore | None = None,
+        checkpoint_interval_seconds: float = 60.0,
+        checkpoint_max_age_seconds: float = 900.0,
+        resync_weight_budget_per_minute: int = DEPTH_RESYNC_WEIGHT_BUDGET_PER_MINUTE,
+        combined_streams: bool = True,
+        single_event_loop: bool = True,
+        json_codec: JsonCodec | None = None,
+        retain_raw_frames: bool = True,
+        receive_queue_size: int = 10_000,
+        receive_overflow_policy: str = "block",
+        receive_spill_dir: Path | None = None,
+        agg_trade_backfill_max_gap: int = AGG_TRADE_BACKFILL_MAX_GAP,
+        redundant_connections: bool = False,
+        standby_websocket_base_url: str | None = None,
+        market_data_streams: bool = True,
+    ) -> None:
+        self._symbol = symbol.upper()
+        self._symbol_lower = self._symbol.lower()
+        self._websocket_base_url = websocket_base_url
+        self._connection_base_urls = {PRIMARY_CONNECTION: websocket_base_url}
+        if redundant_connections:
+            self._connection_base_urls[STANDBY_CONNECTION] = standby_websocket_base_url or websocket_base_url
+        self._deduplicator = StreamDeduplicator(list(self._connection_base_urls)) if redundant_connections else None
+        self._market_data_streams = market_data_streams
+        self._rest_client = rest_client
+        self._collector = collector
+        self._depth_snapshot_limit = depth_snapshot_limit
+        self._reconnect_seconds = reconnect_seconds
+        self._heartbeat_interval_seconds = heartbeat_interval_seconds
+        self._combined_streams = combined_streams
+        self._single_event_loop = single_event_loop
+        self._json_codec = json_codec or JsonCodec()
+        self._retain_raw_frames = retain_raw_frames
+        # Every connection feeds one queue, so the collector sees a single dispatcher thread.
+        self._receive_queue = _build_receive_queue(
+            f"ws-{self._symbol_lower}",
+            codec=self._json_codec,
+            maxsize=receive_queue_size,
+            overflow_policy=receive_overflow_policy,
+            spill_dir=receive_spill_dir,
+        )
+        self._processor = BinanceWsPayloadProcessor(collector=collector, symbol=self._symbol)
+        self._checkpoint_store = checkpoint_store
+        self._checkpoint_interval_ms = int(checkpoint_interval_seconds * 1000)
+        self._checkpoint_max_age_ms = int(checkpoint_max_age_seconds * 1000)
+        self._last_checkpoint_ms: int | None = None
+        self._warm_start_lock = threading.Lock()
+        self._warm_start_pending = False
+        self._warm_start_attempts = 0
+        self._warm_start_confirmed = 0
+        self._warm_start_fallbacks = 0
+        self._resync_controller = DepthResyncController(
+            symbol=self._symbol,
+            resync=lambda requested_at_ms: self._resync_depth_book(minute_timestamp_ms=requested_at_ms),
+            snapshot_weight=depth_snapshot_weight(depth_snapshot_limit),
+            weight_budget_per_minute=resync_weight_budget_per_minute,
+        )
+        self._trade_backfiller: AggTradeBackfiller | None = None
+        if agg_trade_backfill_max_gap > 0:
+            self._trade_backfiller = AggTradeBackfiller(
+                symbol=self._symbol,
+                fetch_from_id=lambda from_id, limit: rest_client.fetch_agg_trades_from_id(
+                    self._symbol, from_id=from_id, limit=limit
+                ),
+                store=lambda trades: collector.ingest_backfilled_agg_trades(symbol=self._symbol, trades=trades),
+                last_agg_trade_id=collector.last_agg_trade_id(self._symbol),
+                max_gap_trades=agg_trade_backfill_max_gap,
+            )
+
+        self._connection_state: dict[str, _WorkerConnectionState] = {
+            CONSUMER_WS_LATENCY: _WorkerConnectionState(),
+            CONSUMER_DEPTH: _WorkerConnectionState(),
+            CONSUMER_LIQUIDATION: _WorkerConnectionState(),
+        }
+        self._state_lock = threading.RLock()
+
+        self._routes = self._build_stream_routes()
+        self._workers: list[BinanceWebSocketWorker] = []
+        self._worker_loop: BinanceWebSocketLoop | None = None
+        self._heartbeat_thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._started = False
+
+    @property
+    def symbol(self) -> str:
+        return self._symbol
+
+    def stream_names(self) -> list[str]:
+        return [route.stream for route in self._routes.values()]
+
+    def start(self, *, open_connections: bool = True) -> None:
+        """Start ingestion; with ``open_connections=False`` the caller feeds ``dispatch_stream_payload``."""
+        if self._started:
+            return
+        self._started = True
+
+        self._stop_event.clear()
+        if not self._warm_start_depth_book():
+            self._resync_depth_book(minute_timestamp_ms=now_ms())
+        self._resync_controller.start()
+        if self._trade_backfiller is not None:
+            self._trade_backfiller.start()
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop,
+            name=f"ws-heartbeats-{self._symbol_lower}",
+            daemon=True,
+        )
+        self._heartbeat_thread.start()
+        if not open_connections:
+            return
+
+        if self._receive_queue is not None:
+            self._receive_queue.start()
+        self._workers = []
+        for connection, base_url in self._connection_base_urls.items():
+            if self._combined_streams:
+                self._workers.append(self._combined_worker(connection, base_url))
+            else:
+                self._workers.extend(
+                    self._stream_worker(route, connection, base_url) for route in self._routes.values()
+                )
+
+        if self._single_event_loop:
+            self._worker_loop = BinanceWebSocketLoop(self._workers, name=f"ws-loop-{self._symbol_lower}")
+            self._worker_loop.start()
+        else:
+            for worker in self._workers:
+                worker.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._started = False
+
+        if self._worker_loop is not None:
+            self._worker_loop.stop()
+            self._worker_loop = None
+        for worker in self._workers:
+            worker.stop()
+        self._workers = []
+        if self._receive_queue is not None:
+            self._receive_queue.stop()
+        self._resync_controller.stop()
+        if self._trade_backfiller is not None:
+            self._trade_backfiller.stop()
+
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join(timeout=5.0)
+            self._heartbeat_thread = None
+
+        self._write_depth_checkpoint()
+
+    def _build_stream_routes(self) -> dict[str, _StreamRoute]:
         depth_stream = f"{self._symbol_lower}@depth@100ms"
         liq_stream = f"{self._symbol_lower}@forceOrder"
         trade_stream = f"{self._symbol_lower}@aggTrade"
         mark_price_stream = f"{self._symbol_lower}@markPrice@1s"
-
-        self._workers = [
-            BinanceWebSocketWorker(
-                name="depth",
-                url=self._stream_url(depth_stream),
-                on_message=lambda payload, arrival: self._on_depth_message(depth_stream, payload, arrival),
-                on_connection_change=lambda connected: self._on_connection_change(CONSUMER_DEPTH, connected),
-                reconnect_seconds=self._reconnect_seconds,
+        routes = [
+            _StreamRoute(
+                worker_name="depth",
+                stream=depth_stream,
+                handler=lambda payload, arrival, _raw: self._on_depth_message(depth_stream, payload, arrival),
+                consumer=CONSUMER_DEPTH,
             ),
-            BinanceWebSocketWorker(
-                name="force_order",
-                url=self._stream_url(liq_stream),
-                on_message=lambda payload, arrival: self._on_liq_message(liq_stream, payload, arrival),
-                on_connection_change=lambda connected: self._on_connection_change(CONSUMER_LIQUIDATION, connected),
-                reconnect_seconds=self._reconnect_seconds,
+            _StreamRoute(
+                worker_name="force_order",
+                stream=liq_stream,
+                handler=lambda payload, arrival, raw: self._on_liq_message(liq_stream, payload, arrival, raw),
+                consumer=CONSUMER_LIQUIDATION,
             ),
-            BinanceWebSocketWorker(
-                name="agg_trade",
-                url=self._stream_url(trade_stream),
-                on_message=lambda payload, arrival: self._on_trade_message(trade_stream, payload, arrival),
-                on_connection_change=lambda connected: self._on_connection_change(CONSUMER_WS_LATENCY, connected),
-                reconnect_seconds=self._reconnect_seconds,
+            _StreamRoute(
+                worker_name="agg_trade",
+                stream=trade_stream,
+                handler=lambda payload, arrival, raw: self._on_trade_message(trade_stream, payload, arrival, raw),
+                consumer=CONSUMER_WS_LATENCY,
             ),
-            BinanceWebSocketWorker(
-                name="mark_price",
-                url=self._stream_url(mark_price_stream),
-                on_message=lambda payload, arrival: self._processor.process_stream_payload(
+            _StreamRoute(
+                worker_name="mark_price",
+                stream=mark_price_stream,
+                handler=lambda payload, arrival, raw: self._processor.process_stream_payload(
                     stream_name=mark_price_stream,
                     payload=payload,
                     arrival_time_ms=arrival,
+                    raw_frame=self._retained_frame(raw),
                 ),
-                reconnect_seconds=self._reconnect_seconds,
+                consumer=None,
             ),
         ]
+        if self._market_data_streams:
+            routes.extend(
+                _StreamRoute(
+                    worker_name=worker_name,
+                    stream=stream,
+                    handler=self._market_data_handler(stream),
+                    consumer=None,
+                )
+                for worker_name, stream in (
+                    ("kline", f"{self._symbol_lower}@kline_1m"),
+                    ("book_ticker", f"{self._symbol_lower}@bookTicker"),
+                )
+            )
+        # Combined-stream envelopes carry the stream name in lowercase.
+        return {route.stream.lower(): route for route in routes}
 
-        for worker in self._workers:
-            worker.start()
+    def _market_data_handler(self, stream: str) -> Callable[[dict[str, Any], int, str | bytes | None], None]:
+        def _handle(payload: dict[str, Any], arrival_time_ms: int, _raw: str | bytes | None) -> None:
+            self._processor.process_stream_payload(stream_name=stream, payload=payload, arrival_time_ms=arrival_time_ms)
 
-        self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, name="ws-heartbeats", daemon=True)
-        self._heartbeat_thread.start()
+        return _handle
 
-    def stop(self) -> None:
-        self._stop_event.set()
+    @staticmethod
+    def _connection_worker_name(name: str, connection: str) -> str:
+        return name if connection == PRIMARY_CONNECTION else f"{name}-{connection}"
+
+    def _combined_worker(self, connection: str, base_url: str) -> BinanceWebSocketWorker:
+        return BinanceWebSocketWorker(
+            name=self._connection_worker_name("combined", connection),
+            url=combined_stream_url(base_url, [route.stream for route in self._routes.values()]),
+            on_message=lambda payload, arrival, raw: self._on_combined_message(payload, arrival, raw, connection),
+            on_connection_change=lambda connected: self._on_combined_connection_change(connected, connection),
+            reconnect_seconds=self._reconnect_seconds,
+            codec=self._json_codec,
+            receive_queue=self._receive_queue,
+        )
 
-        for worker in self._workers:
-            worker.stop()
-        self._workers = []
+    def _stream_worker(
+        self,
+        route: _StreamRoute,
+        connection: str = PRIMARY_CONNECTION,
+        base_url: str | None = None,
+    ) -> BinanceWebSocketWorker:
+        consumer = route.consumer
+        return BinanceWebSocketWorker(
+            name=self._connection_worker_name(route.worker_name, connection),
+            url=self._stream_url(route.stream, base_url),
+            on_message=lambda payload, arrival, raw: self._dispatch_route(route, payload, arrival, raw, connection),
+            on_connection_change=(
+                (lambda connected: self._on_connection_change(consumer, connected, connection))
+                if consumer is not None
+                else None
+            ),
+            reconnect_seconds=self._reconnect_seconds,
+            codec=self._json_codec,
+            receive_queue=self._receive_queue,
+            stream=route.stream,
+        )
 
-        if self._heartbeat_thread is not None:
-            self._heartbeat_thread.join(timeout=5.0)
-            self._heartbeat_thread = None
+    def _retained_frame(self, raw_frame: str | bytes | None) -> str | bytes | None:
+        return raw_frame if self._retain_raw_frames else None
+
+    def json_codec_stats(self) -> JsonCodecStats:
+        return self._json_codec.stats()
+
+    def receive_queue_metrics(self) -> ReceiveQueueMetrics | None:
+        if self._receive_queue is None:
+            return None
+        return self._receive_queue.metrics()
+
+    def redundancy_metrics(self) -> list[RedundantConnectionMetrics]:
+        if self._deduplicator is None:
+            return []
+        return self._deduplicator.metrics()
+
+    def _on_combined_message(
+        self,
+        payload: dict[str, Any],
+        arrival_time_ms: int,
+        raw_frame: str | bytes | None = None,
+        connection: str = PRIMARY_CONNECTION,
+    ) -> None:
+        stream = payload.get("stream")
+        data = payload.get("data")
+        if not isinstance(stream, str) or not isinstance(data, dict):
+            return
+        self.dispatch_stream_payload(stream, data, arrival_time_ms, raw_frame, connection=connection)
+
+    def dispatch_stream_payload(
+        self,
+        stream_name: str,
+        payload: dict[str, Any],
+        arrival_time_ms: int,
+        raw_frame: str | bytes | None = None,
+        *,
+        connection: str = PRIMARY_CONNECTION,
+    ) -> bool:
+        route = self._routes.get(stream_name.lower())
+        if route is None:
+            logger.debug("Dropping payload for unsubscribed stream", extra={"stream": stream_name})
+            return False
+        self._dispatch_route(route, payload, arrival_time_ms, raw_frame, connection)
+        return True
+
+    def _dispatch_route(
+        self,
+        route: _StreamRoute,
+        payload: dict[str, Any],
+        arrival_time_ms: int,
+        raw_frame: str | bytes | None,
+        connection: str,
+    ) -> None:
+        if self._deduplicator is None:
+            route.handler(payload, arrival_time_ms, raw_frame)
+            return
+        self._deduplicator.dispatch(connection, route.stream, payload, arrival_time_ms, raw_frame, route.handler)
+
+    def set_connected(self, connected: bool) -> None:
+        self._on_combined_connection_change(connected)
 
-    def _on_connection_change(self, consumer_name: str, connected: bool) -> None:
+    def _on_combined_connection_change(self, connected: bool, connection: str = PRIMARY_CONNECTION) -> None:
+        for route in self._routes.values():
+            if route.consumer is not None:
+                self._on_connection_change(route.consumer, connected, connection)
+
+    def _on_connection_change(self, consumer_name: str, connected: bool, connection: str = PRIMARY_CONNECTION) -> None:
+        # With redundant connections a consumer stays connected while any of its connections is open.
         with self._state_lock:
             state = self._connection_state.setdefault(consumer_name, _WorkerConnectionState())
-            state.connected = connected
+            if connected:
+                state.open_connections.add(connection)
+            else:
+                state.open_connections.discard(connection)
+            state.connected = bool(state.open_connections)
 
     def _record_message(self, consumer_name: str, arrival_time_ms: int) -> None:
         with self._state_lock:
@@ -1936,25 +4263,85 @@ class BinanceLiveStreamSupervisor:
                 payload=payload,
                 arrival_time_ms=arrival_time_ms,
             )
+        except DepthCheckpointBridgeError:
+            self._finish_warm_start(confirmed=False)
+            self._resync_controller.request(arrival_time_ms, degraded=False)
+            return
         except DepthSyncError:
-            logger.warning("Depth continuity broken; resyncing snapshot", extra={"symbol": self._symbol})
-            self._resync_depth_book(minute_timestamp_ms=arrival_time_ms)
+            if self._resync_controller.request(arrival_time_ms):
+                logger.warning("Depth continuity broken; resync queued", extra={"symbol": self._symbol})
+            return
+        if self._warm_start_pending and self._collector.depth_book_synchronized(self._symbol):
+            self._finish_warm_start(confirmed=True)
+
+    def depth_resync_metrics(self) -> DepthResyncMetrics:
+        return self._resync_controller.metrics()
+
+    def depth_warm_start_metrics(self) -> DepthWarmStartMetrics:
+        with self._warm_start_lock:
+            return DepthWarmStartMetrics(
+                attempts=self._warm_start_attempts,
+                confirmed=self._warm_start_confirmed,
+                fallbacks=self._warm_start_fallbacks,
+            )
 
-    def _on_liq_message(self, stream_name: str, payload: dict[str, Any], arrival_time_ms: int) -> None:
+    def _finish_warm_start(self, *, confirmed: bool) -> None:
+        with self._warm_start_lock:
+            if not self._warm_start_pending:
+                return
+            self._warm_start_pending = False
+            if confirmed:
+                self._warm_start_confirmed += 1
+            else:
+                self._warm_start_fallbacks += 1
+            attempts, succeeded = self._warm_start_attempts, self._warm_start_confirmed
+        if confirmed:
+            logger.info(
+                "Depth warm start confirmed by a live diff",
+                extra={"symbol": self._symbol, "attempts": attempts, "confirmed": succeeded},
+            )
+        else:
+            logger.warning(
+                "Depth warm start did not bridge live diffs; snapshotting as on a cold start",
+                extra={"symbol": self._symbol, "attempts": attempts, "confirmed": succeeded},
+            )
+
+    def agg_trade_backfill_metrics(self) -> AggTradeBackfillMetrics | None:
+        if self._trade_backfiller is None:
+            return None
+        return self._trade_backfiller.metrics()
+
+    def _on_liq_message(
+        self,
+        stream_name: str,
+        payload: dict[str, Any],
+        arrival_time_ms: int,
+        raw_frame: str | bytes | None = None,
+    ) -> None:
         self._record_message(CONSUMER_LIQUIDATION, arrival_time_ms)
         self._processor.process_stream_payload(
             stream_name=stream_name,
             payload=payload,
             arrival_time_ms=arrival_time_ms,
+            raw_frame=self._retained_frame(raw_frame),
         )
 
-    def _on_trade_message(self, stream_name: str, payload: dict[str, Any], arrival_time_ms: int) -> None:
+    def _on_trade_message(
+        self,
+        stream_name: str,
+        payload: dict[str, Any],
+        arrival_time_ms: int,
+        raw_frame: str | bytes | None = None,
+    ) -> None:
         self._record_message(CONSUMER_WS_LATENCY, arrival_time_ms)
         self._processor.process_stream_payload(
             stream_name=stream_name,
             payload=payload,
             arrival_time_ms=arrival_time_ms,
+            raw_frame=self._retained_frame(raw_frame),
         )
+        if self._trade_backfiller is not None:
+            self._trade_backfiller.observe(_coerce_int(payload.get("a")), arrival_time_ms)
 
     def _heartbeat_loop(self) -> None:
         last_minute: int | None = None
@@ -1962,9 +4349,130 @@ class BinanceLiveStreamSupervisor:
             current_minute = floor_to_minute_ms(now_ms())
             if current_minute != last_minute:
                 self._emit_heartbeats(current_minute)
+                if last_minute is not None:
+                    self._log_stream_metrics()
                 last_minute = current_minute
+            self._maybe_write_depth_checkpoint()
+            self._collector.flush_market_minutes()
             time.sleep(self._heartbeat_interval_seconds)
 
+    def _log_stream_metrics(self) -> None:
+        queue_metrics = self.receive_queue_metrics()
+        if queue_metrics is not None:
+            _log_receive_queue_metrics(queue_metrics)
+        stats = self._json_codec.stats()
+        logger.info(
+            "WebSocket JSON codec timings",
+            extra={
+                "symbol": self._symbol,
+                "backend": stats.backend,
+                "decoded": stats.decode_count,
+                "decode_us_per_message": stats.decode_us_per_message,
+                "encoded": stats.encode_count,
+                "encode_us_per_message": stats.encode_us_per_message,
+            },
+        )
+        for redundancy in self.redundancy_metrics():
+            logger.info(
+                "WebSocket redundant connection",
+                extra={
+                    "symbol": self._symbol,
+                    "connection": redundancy.connection,
+                    "wins": redundancy.wins,
+                    "losses": redundancy.losses,
+                    "win_rate": redundancy.win_rate,
+                    "mean_lead_ms": redundancy.mean_lead_ms,
+                },
+            )
+        rate_limiter = getattr(self._rest_client, "rate_limiter", None)
+        if isinstance(rate_limiter, RestWeightLimiter):
+            rate_limiter.log_priority_metrics()
+        warm_start = self.depth_warm_start_metrics()
+        if warm_start.attempts:
+            logger.info(
+                "Depth warm start",
+                extra={
+                    "symbol": self._symbol,
+                    "attempts": warm_start.attempts,
+                    "confirmed": warm_start.confirmed,
+                    "fallbacks": warm_start.fallbacks,
+                },
+            )
+        backfill = self.agg_trade_backfill_metrics()
+        if backfill is not None and backfill.gaps_detected:
+            logger.info(
+                "aggTrade gap backfill",
+                extra={
+                    "symbol": self._symbol,
+                    "gaps_detected": backfill.gaps_detected,
+                    "gaps_filled": backfill.gaps_filled,
+                    "gaps_skipped": backfill.gaps_skipped,
+                    "pending_gaps": backfill.pending_gaps,
+                    "trades_backfilled": backfill.trades_backfilled,
+                },
+            )
+
+    def _warm_start_depth_book(self) -> bool:
+        """Resume depth from a fresh local checkpoint so start-up can skip the REST snapshot.
+
+        Stored diffs roll the checkpoint forward, but the book only becomes live once a live diff
+        follows it on ``pu``. If the first live diff shows a gap (diffs published while the process
+        was down), the depth worker snapshots straight away as on a cold start, without a degraded minute.
+        """
+        if self._checkpoint_store is None:
+            return False
+        checkpoint = self._checkpoint_store.load(self._symbol)
+        if checkpoint is None:
+            return False
+        age_ms = now_ms() - checkpoint.created_at_ms
+        if age_ms > self._checkpoint_max_age_ms:
+            logger.info("Depth checkpoint too old for warm start", extra={"symbol": self._symbol, "age_ms": age_ms})
+            return False
+
+        with self._warm_start_lock:
+            self._warm_start_attempts += 1
+        try:
+            advanced = self._collector.restore_depth_checkpoint(checkpoint)
+        except DepthSyncError:
+            with self._warm_start_lock:
+                self._warm_start_fallbacks += 1
+            logger.info("Stored depth diffs do not bridge checkpoint", extra={"symbol": self._symbol})
+            return False
+
+        with self._warm_start_lock:
+            self._warm_start_pending = True
+        logger.info(
+            "Depth book warm-started from checkpoint; awaiting a live diff",
+            extra={
+                "symbol": self._symbol,
+                "last_update_id": checkpoint.last_update_id,
+                "advanced_from_store": advanced,
+            },
+        )
+        return True
+
+    def _maybe_write_depth_checkpoint(self) -> None:
+        if self._checkpoint_store is None:
+            return
+        current_ms = now_ms()
+        last_checkpoint_ms = self._last_checkpoint_ms
+        if last_checkpoint_ms is not None and current_ms - last_checkpoint_ms < self._checkpoint_interval_ms:
+            return
+        self._write_depth_checkpoint(created_at_ms=current_ms)
+
+    def _write_depth_checkpoint(self, *, created_at_ms: int | None = None) -> None:
+        if self._checkpoint_store is None:
+            return
+        checkpoint = self._collector.depth_checkpoint(self._symbol)
+        if checkpoint is None:
+            return
+        try:
+            self._checkpoint_store.save(checkpoint)
+            self._collector.archive_depth_checkpoint(checkpoint)
+            self._last_checkpoint_ms = created_at_ms if created_at_ms is not None else checkpoint.created_at_ms
+        except (OSError, sqlite3.Error):
+            logger.exception("Depth checkpoint write failed", extra={"symbol": self._symbol})
+
     def _emit_heartbeats(self, minute_timestamp_ms: int) -> None:
         with self._state_lock:
             ws_state = self._connection_state[CONSUMER_WS_LATENCY]
@@ -1987,15 +4495,18 @@ class BinanceLiveStreamSupervisor:
             last_message_time=liq_state.last_message_time,
         )
 
-    def _stream_url(self, stream_name: str) -> str:
-        base = self._websocket_base_url.rstrip("/")
+    def _stream_url(self, stream_name: str, base_url: str | None = None) -> str:
+        base = (base_url or self._websocket_base_url).rstrip("/")
         if base.endswith("/ws"):
             return f"{base}/{stream_name}"
         if base.endswith("/stream"):
             return f"{base}?streams={stream_name}"
         return f"{base}/ws/{stream_name}"
 
-    def _resync_depth_book(self, *, minute_timestamp_ms: int) -> None:
+    def _combined_stream_url(self, stream_names: list[str]) -> str:
+        return combined_stream_url(self._websocket_base_url, stream_names)
+
+    def _resync_depth_book(self, *, minute_timestamp_ms: int) -> bool:
         try:
             snapshot = self._rest_client.fetch_depth_snapshot(self._symbol, limit=self._depth_snapshot_limit)
             self._collector.set_depth_snapshot(
@@ -2007,3 +4518,289 @@ class BinanceLiveStreamSupervisor:
             )
         except Exception:
             logger.exception("Depth snapshot resync failed", extra={"symbol": self._symbol})
+            return False
+        return True
+
+
+def plan_stream_connections(
+    streams_by_symbol: dict[str, list[str]],
+    *,
+    max_streams_per_connection: int,
+    symbol_weights: dict[str, float] | None = None,
+    connection_count: int | None = None,
+) -> list[list[str]]:
+    """Pack symbols (all of a symbol's streams together) into connections, balancing by weight.
+
+    Heaviest symbols are placed first onto the lightest connection that still has stream capacity;
+    a new connection is opened only when none has room.
+    """
+    weights = symbol_weights or {}
+    total_streams = sum(len(streams) for streams in streams_by_symbol.values())
+    minimum_connections = max(1, math.ceil(total_streams / max(max_streams_per_connection, 1)))
+    slots = max(connection_count or 0, minimum_connections)
+    plan: list[list[str]] = [[] for _ in range(slots)]
+    loads = [0.0] * slots
+    used = [0] * slots
+
+    ordered = sorted(streams_by_symbol, key=lambda symbol: (-weights.get(symbol, 1.0), symbol))
+    for symbol in ordered:
+        stream_count = len(streams_by_symbol[symbol])
+        candidates = [index for index in range(len(plan)) if used[index] + stream_count <= max_streams_per_connection]
+        if not candidates:
+            plan.append([])
+            loads.append(0.0)
+            used.append(0)
+            candidates = [len(plan) - 1]
+        target = min(candidates, key=lambda index: (loads[index], used[index], index))
+        plan[target].append(symbol)
+        loads[target] += weights.get(symbol, 1.0)
+        used[target] += stream_count
+    return plan
+
+
+@dataclass(frozen=True, slots=True)
+class ConnectionShardMetrics:
+    name: str
+    symbols: tuple[str, ...]
+    stream_count: int
+    connected: bool
+    messages: int
+    messages_per_second: float
+
+
+@dataclass(slots=True)
+class _ConnectionShardState:
+    connected: bool = False
+    messages: int = 0
+    window_messages: int = 0
+    window_started: float = field(default_factory=time.monotonic)
+    messages_per_second: float = 0.0
+
+
+class BinanceMultiSymbolSupervisor:
+    """Shard many symbols' streams across a few combined-stream connections on one event loop.
+
+    Each symbol keeps its own ``BinanceLiveStreamSupervisor`` (collector shard, depth book, resyncs);
+    this class only owns the sockets. Payloads are routed by the symbol in the message, and only the
+    connection that currently owns a symbol may feed it, so a symbol moved by a rebalance is never
+    double-counted. Rebalancing by observed message rate happens when a connection reconnects.
+    """
+
+    def __init__(
+        self,
+        *,
+        supervisors: Sequence[BinanceLiveStreamSupervisor],
+        websocket_base_url: str,
+        max_streams_per_connection: int = 200,
+        reconnect_seconds: float = 2.0,
+        rebalance_imbalance_ratio: float = 2.0,
+        json_codec: JsonCodec | None = None,
+        receive_queue_size: int = 10_000,
+        receive_overflow_policy: str = "block",
+        receive_spill_dir: Path | None = None,
+    ) -> None:
+        self._websocket_base_url = websocket_base_url
+        self._max_streams_per_connection = max_streams_per_connection
+        self._reconnect_seconds = reconnect_seconds
+        self._rebalance_imbalance_ratio = rebalance_imbalance_ratio
+        self._json_codec = json_codec or JsonCodec()
+        self._receive_queue = _build_receive_queue(
+            "ws-shards",
+            codec=self._json_codec,
+            maxsize=receive_queue_size,
+            overflow_policy=receive_overflow_policy,
+            spill_dir=receive_spill_dir,
+        )
+
+        self._lock = threading.RLock()
+        self._supervisors: dict[str, BinanceLiveStreamSupervisor] = {
+            supervisor.symbol: supervisor for supervisor in supervisors
+        }
+        self._plan: list[list[str]] = []
+        self._owner: dict[str, int] = {}
+        self._plan_dirty = False
+        self._symbol_messages: dict[str, int] = {}
+        self._shards: list[_ConnectionShardState] = []
+        self._workers: list[BinanceWebSocketWorker] = []
+        self._worker_loop: BinanceWebSocketLoop | None = None
+
+    def start(self) -> None:
+        if self._worker_loop is not None:
+            return
+        for supervisor in self._supervisors.values():
+            supervisor.start(open_connections=False)
+        with self._lock:
+            self._apply_plan(self._compute_plan(connection_count=None))
+            self._workers = [self._shard_worker(index) for index in range(len(self._plan))]
+        if self._receive_queue is not None:
+            self._receive_queue.start()
+        self._worker_loop = BinanceWebSocketLoop(self._workers, name="ws-loop-shards")
+        self._worker_loop.start()
+
+    def stop(self) -> None:
+        if self._worker_loop is not None:
+            self._worker_loop.stop()
+            self._worker_loop = None
+        self._workers = []
+        if self._receive_queue is not None:
+            self._receive_queue.stop()
+        for supervisor in self._supervisors.values():
+            supervisor.stop()
+
+    def add_symbol(self, supervisor: BinanceLiveStreamSupervisor) -> None:
+        with self._lock:
+            self._supervisors[supervisor.symbol] = supervisor
+            self._plan_dirty = True
+        if self._worker_loop is not None:
+            supervisor.start(open_connections=False)
+            self._rebalance(reconnecting_index=None)
+
+    def remove_symbol(self, symbol: str) -> None:
+        symbol_upper = symbol.upper()
+        to_reconnect: list[BinanceWebSocketWorker] = []
+        with self._lock:
+            supervisor = self._supervisors.pop(symbol_upper, None)
+            # Re-plan under the same lock so routing and metrics never see the removed symbol.
+            self._owner.pop(symbol_upper, None)
+            if self._plan:
+                changed = self._apply_plan(self._compute_plan(connection_count=len(self._plan)))
+                to_reconnect = [self._workers[index] for index in changed if index < len(self._workers)]
+        if supervisor is not None:
+            supervisor.stop()
+        for worker in to_reconnect:
+            worker.request_reconnect()
+
+    def connection_metrics(self) -> list[ConnectionShardMetrics]:
+        now = time.monotonic()
+        metrics: list[ConnectionShardMetrics] = []
+        with self._lock:
+            for index, state in enumerate(self._shards):
+                elapsed = now - state.window_started
+                if elapsed >= 1.0:
+                    state.messages_per_second = state.window_messages / elapsed
+                    state.window_messages = 0
+                    state.window_started = now
+                symbols = tuple(self._plan[index]) if index < len(self._plan) else ()
+                metrics.append(
+                    ConnectionShardMetrics(
+                        name=f"shard-{index}",
+                        symbols=symbols,
+                        stream_count=sum(
+                            len(self._supervisors[symbol].stream_names())
+                            for symbol in symbols
+                            if symbol in self._supervisors
+                        ),
+                        connected=state.connected,
+                        messages=state.messages,
+                        messages_per_second=state.messages_per_second,
+                    )
+                )
+        return metrics
+
+    def _compute_plan(self, *, connection_count: int | None) -> list[list[str]]:
+        return plan_stream_connections(
+            {symbol: supervisor.stream_names() for symbol, supervisor in self._supervisors.items()},
+            max_streams_per_connection=self._max_streams_per_connection,
+            symbol_weights={symbol: float(count) for symbol, count in self._symbol_messages.items()} or None,
+            connection_count=connection_count,
+        )
+
+    def _apply_plan(self, plan: list[list[str]]) -> list[int]:
+        changed = [
+            index
+            for index in range(max(len(plan), len(self._plan)))
+            if index >= len(self._plan) or index >= len(plan) or sorted(plan[index]) != sorted(self._plan[index])
+        ]
+        self._plan = plan
+        self._owner = {symbol: index for index, symbols in enumerate(plan) for symbol in symbols}
+        while len(self._shards) < len(plan):
+            self._shards.append(_ConnectionShardState())
+        self._plan_dirty = False
+        self._symbol_messages = dict.fromkeys(self._supervisors, 0)
+        return changed
+
+    def _needs_rebalance(self) -> bool:
+        if self._plan_dirty:
+            return True
+        loads = [sum(self._symbol_messages.get(symbol, 0) for symbol in symbols) for symbols in self._plan]
+        if len(loads) < 2 or sum(loads) == 0:
+            return False
+        mean_load = sum(loads) / len(loads)
+        return max(loads) > mean_load * self._rebalance_imbalance_ratio
+
+    def _rebalance(self, *, reconnecting_index: int | None) -> None:
+        with self._lock:
+            if not self._needs_rebalance():
+                return
+            changed = self._apply_plan(self._compute_plan(connection_count=len(self._plan)))
+            new_indexes = range(len(self._workers), len(self._plan))
+            new_workers = [self._shard_worker(index) for index in new_indexes]
+            self._workers.extend(new_workers)
+            existing = [self._workers[index] for index in changed if index < len(self._workers) - len(new_workers)]
+        logger.info("Rebalanced WebSocket shards", extra={"connections": len(self._plan), "changed": len(changed)})
+        for index, worker in zip(changed, existing, strict=False):
+            if index != reconnecting_index:
+                worker.request_reconnect()
+        if self._worker_loop is not None:
+            for worker in new_workers:
+                self._worker_loop.add_worker(worker)
+
+    def _shard_worker(self, index: int) -> BinanceWebSocketWorker:
+        return BinanceWebSocketWorker(
+            name=f"shard-{index}",
+            url=lambda: self._shard_url(index),
+            on_message=lambda payload, arrival, raw: self._on_shard_message(index, payload, arrival, raw),
+            on_connection_change=lambda connected: self._on_shard_connection_change(index, connected),
+            reconnect_seconds=self._reconnect_seconds,
+            codec=self._json_codec,
+            receive_queue=self._receive_queue,
+        )
+
+    def receive_queue_metrics(self) -> ReceiveQueueMetrics | None:
+        if self._receive_queue is None:
+            return None
+        return self._receive_queue.metrics()
+
+    def _shard_url(self, index: int) -> str:
+        # Called on every (re)connect, which is when the plan may be rebalanced.
+        self._rebalance(reconnecting_index=index)
+        with self._lock:
+            symbols = self._plan[index] if index < len(self._plan) else []
+            streams = [
+                stream
+                for symbol in symbols
+                if symbol in self._supervisors
+                for stream in self._supervisors[symbol].stream_names()
+            ]
+        return combined_stream_url(self._websocket_base_url, streams)
+
+    def _on_shard_message(
+        self,
+        index: int,
+        payload: dict[str, Any],
+        arrival_time_ms: int,
+        raw_frame: str | bytes | None,
+    ) -> None:
+        stream = payload.get("stream")
+        data = payload.get("data")
+        if not isinstance(stream, str) or not isinstance(data, dict):
+            return
+        symbol = str(data.get("s") or stream.split("@", maxsplit=1)[0]).upper()
+        with self._lock:
+            state = self._shards[index]
+            state.messages += 1
+            state.window_messages += 1
+            supervisor = self._supervisors.get(symbol)
+            if supervisor is None or self._owner.get(symbol) != index:
+                return
+            self._symbol_messages[symbol] = self._symbol_messages.get(symbol, 0) + 1
+        supervisor.dispatch_stream_payload(stream, data, arrival_time_ms, raw_frame)
+
+    def _on_shard_connection_change(self, index: int, connected: bool) -> None:
+        with self._lock:
+            if index < len(self._shards):
+                self._shards[index].connected = connected
+            symbols = self._plan[index] if index < len(self._plan) else []
+            supervisors = [self._supervisors[symbol] for symbol in symbols if symbol in self._supervisors]
+        for supervisor in supervisors:
+            supervisor.set_connected(connected)
@@ -8,6 +8,9 @@ import polars as pl
 from binance_minute_lake.core.schema import canonical_column_names, dtype_map
 from binance_minute_lake.sources.websocket import LiveMinuteFeatures
 
+# Kline and trade inputs arrive either as row dicts or as typed frames from the columnar REST API.
+MinuteRecords = list[dict[str, object]] | pl.DataFrame
+
 
 class MinuteTransformEngine:
     def __init__(self, max_ffill_minutes: int = 60) -> None:
@@ -18,10 +21,10 @@ class MinuteTransformEngine:
         self,
         start_minute: datetime,
         end_minute: datetime,
-        klines: list[dict[str, object]],
-        mark_price_klines: list[dict[str, object]],
-        index_price_klines: list[dict[str, object]],
-        agg_trades: list[dict[str, object]],
+        klines: MinuteRecords,
+        mark_price_klines: MinuteRecords,
+        index_price_klines: MinuteRecords,
+        agg_trades: MinuteRecords,
         funding_rates: list[dict[str, object]],
         book_ticker_snapshots: list[dict[str, object]] | None = None,
         premium_index_snapshots: list[dict[str, object]] | None = None,
@@ -93,11 +96,15 @@ class MinuteTransformEngine:
             .alias("timestamp")
         )
 
-    def _klines_frame(self, records: list[dict[str, object]]) -> pl.DataFrame:
-        if not records:
+    @staticmethod
+    def _records_frame(records: MinuteRecords) -> pl.DataFrame:
+        return records if isinstance(records, pl.DataFrame) else pl.DataFrame(records)
+
+    def _klines_frame(self, records: MinuteRecords) -> pl.DataFrame:
+        if len(records) == 0:
             return pl.DataFrame({"timestamp": []}, schema={"timestamp": pl.Datetime("ms", "UTC")})
         return (
-            pl.DataFrame(records)
+            self._records_frame(records)
             .with_columns(self._to_minute_timestamp("open_time"))
             .select(
                 "timestamp",
@@ -114,32 +121,32 @@ class MinuteTransformEngine:
             .unique(subset=["timestamp"], keep="last")
         )
 
-    def _mark_price_frame(self, records: list[dict[str, object]]) -> pl.DataFrame:
-        if not records:
+    def _mark_price_frame(self, records: MinuteRecords) -> pl.DataFrame:
+        if len(records) == 0:
             return pl.DataFrame({"timestamp": []}, schema={"timestamp": pl.Datetime("ms", "UTC")})
         return (
-            pl.DataFrame(records)
+            self._records_frame(records)
             .with_columns(self._to_minute_timestamp("open_time"))
             .select("timestamp", "mark_price_open", "mark_price_close")
             .unique(subset=["timestamp"], keep="last")
         )
 
-    def _index_price_frame(self, records: list[dict[str, object]]) -> pl.DataFrame:
-        if not records:
+    def _index_price_frame(self, records: MinuteRecords) -> pl.DataFrame:
+        if len(records) == 0:
             return pl.DataFrame({"timestamp": []}, schema={"timestamp": pl.Datetime("ms", "UTC")})
         return (
-            pl.DataFrame(records)
+            self._records_frame(records)
             .with_columns(self._to_minute_timestamp("open_time"))
             .select("timestamp", "index_price_open", "index_price_close")
             .unique(subset=["timestamp"], keep="last")
         )
 
-    def _agg_trade_frame(self, records: list[dict[str, object]]) -> pl.DataFrame:
-        if not records:
+    def _agg_trade_frame(self, records: MinuteRecords) -> pl.DataFrame:
+        if len(records) == 0:
             return pl.DataFrame({"timestamp": []}, schema={"timestamp": pl.Datetime("ms", "UTC")})
 
         trades = (
-            pl.DataFrame(records)
+            self._records_frame(records)
             .with_columns(
                 self._to_minute_timestamp("transact_time"),
             )
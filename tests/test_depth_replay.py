@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+from binance_minute_lake.pipeline.depth_replay import DepthReplayEngine
+from binance_minute_lake.sources.websocket import DepthOrderBook, InMemoryLiveCollector, LiveEventStore
+
+
+def _ms(dt: datetime) -> int:
+    return int(dt.timestamp() * 1000)
+
+
+def _ingest(collector: InMemoryLiveCollector, event_time: int, first_id: int, final_id: int) -> None:
+    collector.ingest_depth_diff(
+        symbol="BTCUSDT",
+        event_time=event_time,
+        transact_time=event_time - 5,
+        first_update_id=first_id,
+        final_update_id=final_id,
+        bid_deltas=[(99.5, 600.0 + final_id)],
+        ask_deltas=[(100.5, 600.0 + final_id)],
+        previous_final_update_id=first_id - 1,
+        arrival_time=event_time + 10,
+    )
+
+
+def _store_diff(store: LiveEventStore, event_time: int, first_id: int, final_id: int) -> None:
+    store.append_depth_event(
+        symbol="BTCUSDT",
+        event_time=event_time,
+        arrival_time=event_time + 10,
+        first_update_id=first_id,
+        final_update_id=final_id,
+        bids=((99.5, 50.0),),
+        asks=((100.5, 50.0),),
+        raw_payload=None,
+        previous_final_update_id=first_id - 1,
+    )
+
+
+def test_replay_matches_live_collector_minutes(tmp_path: Path) -> None:
+    store = LiveEventStore(tmp_path / "live_events.sqlite")
+    collector = InMemoryLiveCollector(event_store=store, symbol="BTCUSDT")
+    minute = _ms(datetime(2026, 1, 15, 10, 0, tzinfo=UTC))
+    collector.set_depth_snapshot(
+        symbol="BTCUSDT",
+        last_update_id=100,
+        bids=[(99.0, 2_000.0), (98.5, 2_000.0)],
+        asks=[(101.0, 2_000.0), (101.5, 2_000.0)],
+        minute_timestamp_ms=minute,
+    )
+    update_id = 101
+    for minute_offset in range(3):
+        for second in range(0, 60, 15):
+            event_time = minute + minute_offset * 60_000 + second * 1_000
+            _ingest(collector, event_time, update_id, update_id + 2)
+            update_id += 3
+
+    engine = DepthReplayEngine(store)
+    minutes, summary = engine.replay_minutes(
+        symbol="btcusdt",
+        start_time_ms=minute,
+        end_time_ms=minute + 3 * 60_000,
+    )
+
+    assert summary.events_replayed == 12
+    assert summary.gaps == 0
+    assert [item.timestamp_ms for item in minutes] == [minute, minute + 60_000, minute + 120_000]
+    for item in minutes:
+        live = collector.snapshot_for_minute(item.timestamp_ms)
+        assert item.update_id_start == live.update_id_start
+        assert item.update_id_end == live.update_id_end
+        assert item.price_impact == live.price_impact_100k
+        assert item.impact_fillable == live.impact_fillable
+        assert item.depth_degraded == live.depth_degraded
+
+    frame = DepthReplayEngine.to_frame(minutes)
+    assert frame.height == 3
+    assert "timestamp" in frame.columns
+
+
+def test_replay_bridges_rest_snapshot_anchor_through_overlapping_first_diff(tmp_path: Path) -> None:
+    store = LiveEventStore(tmp_path / "live_events.sqlite")
+    collector = InMemoryLiveCollector(event_store=store, symbol="BTCUSDT")
+    minute = _ms(datetime(2026, 1, 15, 10, 0, tzinfo=UTC))
+
+    def ingest(event_time: int, first_id: int, final_id: int, previous_final_id: int) -> None:
+        collector.ingest_depth_diff(
+            symbol="BTCUSDT",
+            event_time=event_time,
+            transact_time=event_time - 5,
+            first_update_id=first_id,
+            final_update_id=final_id,
+            bid_deltas=[(99.5, 600.0 + final_id)],
+            ask_deltas=[(100.5, 600.0 + final_id)],
+            previous_final_update_id=previous_final_id,
+            arrival_time=event_time + 10,
+        )
+
+    # The first diff straddles the snapshot's lastUpdateId, as Binance streams do.
+    ingest(minute + 1_000, 96, 103, 95)
+    collector.set_depth_snapshot(
+        symbol="BTCUSDT",
+        last_update_id=100,
+        bids=[(99.0, 2_000.0)],
+        asks=[(101.0, 2_000.0)],
+        minute_timestamp_ms=minute,
+    )
+    ingest(minute + 2_000, 104, 110, 103)
+    live = collector.snapshot_for_minute(minute)
+    assert live.depth_degraded is False
+
+    minutes, summary = DepthReplayEngine(store).replay_minutes(
+        symbol="BTCUSDT",
+        start_time_ms=minute,
+        end_time_ms=minute + 60_000,
+    )
+
+    assert summary.gaps == 0
+    assert summary.reanchors == 0
+    assert summary.last_update_id == 110
+    assert len(minutes) == 1
+    assert minutes[0].depth_degraded is False
+    assert minutes[0].price_impact == live.price_impact_100k
+
+
+def test_replay_reanchors_on_later_checkpoint_after_gap(tmp_path: Path) -> None:
+    store = LiveEventStore(tmp_path / "live_events.sqlite")
+    minute = _ms(datetime(2026, 1, 15, 10, 0, tzinfo=UTC))
+    for last_update_id, created_at_ms in ((100, minute), (130, minute + 62_000)):
+        book = DepthOrderBook()
+        book.sync_from_snapshot(last_update_id=last_update_id, bids=[(99.0, 2_000.0)], asks=[(101.0, 2_000.0)])
+        checkpoint = book.checkpoint("BTCUSDT", created_at_ms=created_at_ms)
+        assert checkpoint is not None
+        store.append_depth_checkpoint(checkpoint)
+    _store_diff(store, minute + 1_000, 101, 105)
+    # Diffs 106..119 were never stored; the later archived checkpoint lets replay recover.
+    _store_diff(store, minute + 61_000, 120, 125)
+    _store_diff(store, minute + 121_000, 131, 135)
+
+    minutes, summary = DepthReplayEngine(store).replay_minutes(
+        symbol="BTCUSDT",
+        start_time_ms=minute,
+        end_time_ms=minute + 3 * 60_000,
+    )
+
+    assert summary.gaps == 1
+    assert summary.reanchors == 1
+    assert summary.last_update_id == 135
+    assert [item.depth_degraded for item in minutes] == [False, True, False]
+    assert minutes[2].price_impact is not None
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from binance_minute_lake.sources.history_mirror import HistoryMirror
+
+
+class _FakeHistoryRest:
+    def __init__(self, funding_times_ms: list[int]) -> None:
+        self.funding_times_ms = funding_times_ms
+        self.funding_calls: list[tuple[int, int]] = []
+        self.ratio_calls = 0
+
+    def fetch_funding_rate(
+        self,
+        symbol: str,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        limit: int = 1000,
+    ) -> list[dict[str, Any]]:
+        assert start_time is not None and end_time is not None
+        start_ms = int(start_time.timestamp() * 1000)
+        end_ms = int(end_time.timestamp() * 1000)
+        self.funding_calls.append((start_ms, end_ms))
+        return [
+            {"symbol": symbol, "funding_rate": 0.0001, "funding_time": ts, "mark_price": 100.0}
+            for ts in self.funding_times_ms
+            if start_ms <= ts <= end_ms
+        ][:limit]
+
+    def fetch_top_trader_long_short_account_ratio(self, symbol: str, **kwargs: Any) -> list[dict[str, Any]]:
+        self.ratio_calls += 1
+        return []
+
+    def fetch_global_long_short_account_ratio(self, symbol: str, **kwargs: Any) -> list[dict[str, Any]]:
+        self.ratio_calls += 1
+        return []
+
+
+def _ms(value: datetime) -> int:
+    return int(value.timestamp() * 1000)
+
+
+def test_history_mirror_serves_backfill_hours_locally_after_one_sync(tmp_path: Path) -> None:
+    day = datetime(2025, 6, 1, tzinfo=UTC)
+    funding_times = [_ms(day + timedelta(hours=8 * index)) for index in range(-3, 9)]
+    rest = _FakeHistoryRest(funding_times)
+    now = day + timedelta(days=10)
+    mirror = HistoryMirror(
+        tmp_path / "state.sqlite",
+        rest,  # type: ignore[arg-type]
+        "btcusdt",
+        clock=lambda: now,
+    )
+
+    hours = [day + timedelta(hours=offset) for offset in range(48)]
+    served = [mirror.funding_rates(hour - timedelta(hours=8), hour + timedelta(hours=1)) for hour in hours]
+    for hour in hours:
+        mirror.top_trader_ratios(hour, hour + timedelta(hours=1))
+        mirror.global_ratios(hour, hour + timedelta(hours=1))
+
+    # The first hour pages ahead to the settle horizon, so every later hour reads from disk.
+    assert rest.funding_calls == [(_ms(day - timedelta(hours=8)), _ms(now - timedelta(minutes=10)))]
+    assert rest.ratio_calls == 2
+    assert [row["funding_time"] for row in served[0]] == [_ms(day - timedelta(hours=8)), _ms(day)]
+    assert [row["funding_time"] for row in served[9]] == [_ms(day + timedelta(hours=8))]
+
+    day_rows = mirror.funding_rates(day, day + timedelta(hours=24))
+    assert [row["funding_time"] for row in day_rows] == [_ms(day + timedelta(hours=8 * i)) for i in range(4)]
+    assert day_rows[0] == {"symbol": "BTCUSDT", "funding_rate": 0.0001, "funding_time": _ms(day), "mark_price": 100.0}
+    assert len(rest.funding_calls) == 1
+
+
+def test_history_mirror_bounds_page_ahead_to_backfill_target(tmp_path: Path) -> None:
+    day = datetime(2025, 6, 1, tzinfo=UTC)
+    rest = _FakeHistoryRest([])
+    mirror = HistoryMirror(
+        tmp_path / "state.sqlite",
+        rest,  # type: ignore[arg-type]
+        "BTCUSDT",
+        clock=lambda: day + timedelta(days=10),
+    )
+
+    with mirror.sync_ahead(day + timedelta(hours=6)):
+        for offset in range(6):
+            mirror.funding_rates(day + timedelta(hours=offset), day + timedelta(hours=offset + 1))
+
+    assert rest.funding_calls == [(_ms(day), _ms(day + timedelta(hours=6)))]
+    mirror.funding_rates(day + timedelta(hours=6), day + timedelta(hours=7))
+    assert rest.funding_calls[1][0] == _ms(day + timedelta(hours=6)) + 1
+
+
+def test_history_mirror_refetches_unsettled_recent_points(tmp_path: Path) -> None:
+    now = datetime(2025, 6, 1, 12, 0, tzinfo=UTC)
+    rest = _FakeHistoryRest([])
+    mirror = HistoryMirror(tmp_path / "state.sqlite", rest, "BTCUSDT", clock=lambda: now)  # type: ignore[arg-type]
+
+    mirror.funding_rates(now - timedelta(minutes=5), now)
+    rest.funding_times_ms.append(_ms(now - timedelta(minutes=1)))
+    rows = mirror.funding_rates(now - timedelta(minutes=5), now)
+
+    assert len(rest.funding_calls) == 2
+    assert [row["funding_time"] for row in rows] == [_ms(now - timedelta(minutes=1))]
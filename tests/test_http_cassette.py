@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+import httpx
+import pytest
+
+from binance_minute_lake.sources.http_cassette import (
+    CassetteMissError,
+    CassetteStore,
+    RecordingTransport,
+    ReplayTransport,
+)
+from binance_minute_lake.sources.rest import BinanceRESTClient
+from binance_minute_lake.sources.vision import VisionClient
+
+
+def test_recorded_responses_replay_offline_for_rest_and_vision(tmp_path: Path) -> None:
+    live_calls: list[str] = []
+
+    def exchange(request: httpx.Request) -> httpx.Response:
+        live_calls.append(f"{request.method} {request.url.path}")
+        if request.url.path.endswith("/openInterest"):
+            return httpx.Response(
+                status_code=200,
+                request=request,
+                headers={"X-MBX-USED-WEIGHT-1M": "3"},
+                json={"symbol": "BTCUSDT", "openInterest": "12.5", "time": 7},
+            )
+        return httpx.Response(status_code=404, request=request)
+
+    rest_store = CassetteStore(tmp_path / "rest")
+    vision_store = CassetteStore(tmp_path / "vision")
+    recorder = BinanceRESTClient(
+        base_url="https://fapi.binance.com",
+        transport=RecordingTransport(rest_store, inner=httpx.MockTransport(exchange)),
+    )
+    vision_recorder = VisionClient(
+        base_url="https://data.binance.vision/data/futures/um/daily",
+        transport=RecordingTransport(vision_store, inner=httpx.MockTransport(exchange)),
+    )
+    try:
+        recorded = recorder.fetch_open_interest("BTCUSDT")
+        recorded_status = vision_recorder.object_status("aggTrades", "BTCUSDT", date(2026, 1, 1))
+    finally:
+        recorder.close()
+        vision_recorder.close()
+
+    slept: list[float] = []
+    replay = ReplayTransport(rest_store, latency_seconds=0.05, rate_limit_every=2, sleep=slept.append)
+    replayer = BinanceRESTClient(base_url="https://fapi.binance.com", transport=replay)
+    vision_replayer = VisionClient(
+        base_url="https://data.binance.vision/data/futures/um/daily",
+        transport=ReplayTransport(vision_store),
+    )
+    try:
+        assert replayer.fetch_open_interest("BTCUSDT") == recorded
+        # The second request is answered with a simulated 429; the client retries onto the recording.
+        assert replayer.fetch_open_interest("BTCUSDT") == recorded
+        assert vision_replayer.object_status("aggTrades", "BTCUSDT", date(2026, 1, 1)) == recorded_status
+        with pytest.raises(CassetteMissError):
+            replayer.fetch_open_interest("ETHUSDT")
+    finally:
+        replayer.close()
+        vision_replayer.close()
+
+    assert live_calls == [
+        "GET /fapi/v1/openInterest",
+        "HEAD /data/futures/um/daily/aggTrades/BTCUSDT/BTCUSDT-aggTrades-2026-01-01.zip",
+    ]
+    # Five replayed requests: two recordings, two simulated 429s and the final miss.
+    assert slept == [0.05] * 5
+    metrics = replay.metrics()
+    assert (metrics.replayed, metrics.simulated_rate_limits, metrics.misses) == (2, 2, 1)
+    assert replayer.rate_limiter.metrics().server_used_weight == 3
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from binance_minute_lake.core.json_codec import JsonCodec
+
+
+def test_json_codec_backends_agree_and_record_timings() -> None:
+    stdlib = JsonCodec("json")
+    auto = JsonCodec()
+    payload = {"s": "BTCUSDT", "E": 1, "b": [["99.5", "1.0"]]}
+
+    assert stdlib.dumps(payload) == auto.dumps(payload) == '{"E":1,"b":[["99.5","1.0"]],"s":"BTCUSDT"}'
+    assert auto.loads(b'{"E":1,"s":"BTCUSDT"}') == {"E": 1, "s": "BTCUSDT"}
+    with pytest.raises(auto.decode_errors):
+        auto.loads(b"not-json")
+
+    stats = auto.stats()
+    assert stats.decode_count == 2
+    assert stats.encode_count == 1
+    assert stats.decode_us_per_message is not None
+
+
+def test_json_codec_counts_every_call_per_thread_and_times_a_sample() -> None:
+    codec = JsonCodec("json", timing_sample_every=4)
+
+    def _decode() -> None:
+        for _ in range(8):
+            codec.loads(b'{"E":1}')
+
+    threads = [threading.Thread(target=_decode) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = codec.stats()
+    assert stats.decode_count == 16
+    assert stats.decode_timed == 4
+    assert JsonCodec("json", timing_sample_every=0).stats().decode_us_per_message is None
+
+
+def test_json_codec_rejects_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        JsonCodec("yaml")
@@ -6,13 +6,24 @@ from pathlib import Path
 import pytest
 
 from binance_minute_lake.sources.websocket import (
+    AggTradeBackfiller,
+    BinanceLiveStreamSupervisor,
+    BinanceMultiSymbolSupervisor,
+    BinanceWsPayloadProcessor,
+    DepthCheckpointBridgeError,
+    DepthCheckpointStore,
     DepthDiffEvent,
+    DepthLevels,
     DepthOrderBook,
+    DepthResyncController,
     DepthSyncError,
+    DepthWarmStartMetrics,
     InMemoryLiveCollector,
     LiquidationOrderEvent,
     LiveEventStore,
     floor_to_minute_ms,
+    now_ms,
+    plan_stream_connections,
 )
 
 
@@ -28,8 +39,8 @@ def test_depth_sync_requires_first_event_to_bridge_snapshot() -> None:
             event_time=_ms(datetime(2026, 1, 15, 10, 0, tzinfo=UTC)),
             first_update_id=120,
             final_update_id=125,
-            bid_deltas=((99.0, 10.0),),
-            ask_deltas=((101.0, 10.0),),
+            bid_deltas=DepthLevels.from_pairs(((99.0, 10.0),)),
+            ask_deltas=DepthLevels.from_pairs(((101.0, 10.0),)),
         )
     )
 
@@ -331,3 +342,551 @@ def test_live_collector_reads_agg_trades_from_event_store_window(tmp_path: Path)
     assert rows[0]["is_buyer_maker"] is True
     assert rows[1]["transact_time"] == minute + 19_900
     assert rows[1]["is_buyer_maker"] is False
+
+
+def test_price_impact_curve_matches_single_notional_walks() -> None:
+    book = DepthOrderBook()
+    book.sync_from_snapshot(
+        last_update_id=100,
+        bids=[(99.0, 500.0), (98.0, 1_000.0), (97.0, 2_000.0)],
+        asks=[(101.0, 500.0), (102.0, 1_000.0), (103.0, 2_000.0)],
+    )
+    notionals = (1_000_000.0, 10_000.0, 100_000.0, 5_000_000.0)
+
+    curve = book.compute_price_impact_curve(notionals)
+
+    assert curve.notionals_usdt == (10_000.0, 100_000.0, 1_000_000.0, 5_000_000.0)
+    for notional in notionals:
+        expected_impact, expected_fillable = book.compute_buy_price_impact(notional)
+        impact, fillable = curve.buy_impact(notional)
+        assert fillable is expected_fillable
+        if expected_impact is None:
+            assert impact is None
+        else:
+            assert impact == pytest.approx(expected_impact)
+
+    assert curve.buy_impact(10_000.0)[0] == pytest.approx(0.01)
+    assert curve.sell_impact(10_000.0)[0] == pytest.approx(0.01)
+    sell_100k, sell_fillable = curve.sell_impact(100_000.0)
+    assert sell_fillable is True
+    assert sell_100k == pytest.approx((100.0 - 100_000.0 / (500.0 + 50_500.0 / 98.0)) / 100.0)
+    assert curve.buy_impact(5_000_000.0) == (None, False)
+    assert curve.sell_impact(5_000_000.0) == (None, False)
+
+
+def test_collector_stores_impact_curve_in_minute_features() -> None:
+    collector = InMemoryLiveCollector(impact_curve_notionals=[10_000.0, 1_000_000.0])
+    minute = floor_to_minute_ms(_ms(datetime(2026, 1, 15, 10, 0, tzinfo=UTC)))
+
+    collector.set_depth_snapshot(
+        symbol="BTCUSDT",
+        last_update_id=100,
+        bids=[(99.0, 20_000.0)],
+        asks=[(101.0, 20_000.0)],
+        minute_timestamp_ms=minute,
+    )
+    collector.ingest_depth_diff(
+        symbol="BTCUSDT",
+        event_time=minute + 1_000,
+        transact_time=minute + 990,
+        first_update_id=101,
+        final_update_id=105,
+        bid_deltas=[(99.5, 12.0)],
+        ask_deltas=[(100.5, 13.0)],
+        previous_final_update_id=100,
+        arrival_time=minute + 1_025,
+    )
+
+    snapshot = collector.snapshot_for_minute(minute)
+    assert snapshot.impact_curve_notionals == (10_000.0, 100_000.0, 1_000_000.0)
+    assert snapshot.buy_impact_curve is not None
+    assert snapshot.sell_impact_curve is not None
+    assert snapshot.buy_impact_curve[1] == pytest.approx(snapshot.price_impact_100k)
+    assert all(value is not None for value in snapshot.buy_impact_curve)
+    assert all(value is not None for value in snapshot.sell_impact_curve)
+
+    plain = InMemoryLiveCollector().snapshot_for_minute(minute)
+    assert plain.impact_curve_notionals is None
+    assert plain.buy_impact_curve is None
+
+
+def _diff(first_update_id: int, final_update_id: int, previous_final_update_id: int | None) -> DepthDiffEvent:
+    return DepthDiffEvent(
+        symbol="BTCUSDT",
+        event_time=_ms(datetime(2026, 1, 15, 10, 0, tzinfo=UTC)),
+        first_update_id=first_update_id,
+        final_update_id=final_update_id,
+        bid_deltas=DepthLevels.from_pairs(((99.5, 5.0),)),
+        ask_deltas=DepthLevels.from_pairs(((100.5, 5.0),)),
+        previous_final_update_id=previous_final_update_id,
+    )
+
+
+def test_depth_checkpoint_round_trip_and_bridge(tmp_path: Path) -> None:
+    book = DepthOrderBook()
+    book.sync_from_snapshot(last_update_id=100, bids=[(99.0, 10.0), (98.0, 4.0)], asks=[(101.0, 10.0)])
+    checkpoint = book.checkpoint("btcusdt", created_at_ms=123)
+    assert checkpoint is not None
+
+    store = DepthCheckpointStore(tmp_path / "checkpoints")
+    store.save(checkpoint)
+    loaded = store.load("BTCUSDT")
+    assert loaded == checkpoint
+
+    restored = DepthOrderBook()
+    restored.restore_from_checkpoint(loaded)
+    assert restored.is_synchronized is False
+    assert restored.checkpoint_pending is True
+
+    restored.apply_event(_diff(95, 100, 94))
+    assert restored.is_synchronized is False
+    restored.apply_event(_diff(101, 105, 100))
+    assert restored.is_synchronized is True
+    assert restored.last_update_id == 105
+    assert restored.best_bid() == 99.5
+
+    gapped = DepthOrderBook()
+    gapped.restore_from_checkpoint(loaded)
+    with pytest.raises(DepthCheckpointBridgeError):
+        gapped.apply_event(_diff(110, 115, 109))
+    # A checkpoint that never went live falls back to the cold-start state rather than degrading.
+    assert gapped.degraded is False
+    assert gapped.checkpoint_pending is False
+    assert gapped.best_bid() is None
+
+
+def test_collector_restores_checkpoint_through_stored_diffs(tmp_path: Path) -> None:
+    store = LiveEventStore(tmp_path / "live_events.sqlite")
+    writer = InMemoryLiveCollector(event_store=store, symbol="BTCUSDT")
+    minute = floor_to_minute_ms(_ms(datetime(2026, 1, 15, 10, 0, tzinfo=UTC)))
+    writer.set_depth_snapshot(
+        symbol="BTCUSDT",
+        last_update_id=100,
+        bids=[(99.0, 10_000.0)],
+        asks=[(101.0, 10_000.0)],
+        minute_timestamp_ms=minute,
+    )
+    checkpoint = writer.depth_checkpoint("BTCUSDT")
+    assert checkpoint is not None
+    for first_id, final_id, previous_id in ((101, 105, 100), (106, 110, 105)):
+        writer.ingest_depth_diff(
+            symbol="BTCUSDT",
+            event_time=minute + final_id,
+            transact_time=minute + final_id - 5,
+            first_update_id=first_id,
+            final_update_id=final_id,
+            bid_deltas=[(99.5, float(final_id))],
+            ask_deltas=[(100.5, float(final_id))],
+            previous_final_update_id=previous_id,
+            arrival_time=minute + final_id + 10,
+        )
+
+    restarted = InMemoryLiveCollector(event_store=store, symbol="BTCUSDT")
+    assert restarted.restore_depth_checkpoint(checkpoint) is True
+    # Stored diffs end where the old process stopped; only a live diff makes the book current.
+    assert restarted.depth_book_synchronized("BTCUSDT") is False
+    assert restarted.depth_checkpoint("BTCUSDT") is None
+
+    expected = writer.depth_checkpoint("BTCUSDT")
+    restarted.ingest_depth_diff(
+        symbol="BTCUSDT",
+        event_time=minute + 111,
+        transact_time=minute + 106,
+        first_update_id=111,
+        final_update_id=115,
+        bid_deltas=[],
+        ask_deltas=[],
+        previous_final_update_id=110,
+        arrival_time=minute + 121,
+    )
+    restored = restarted.depth_checkpoint("BTCUSDT")
+    assert restored is not None and expected is not None
+    assert restored.last_update_id == 115
+    assert restored.bids == expected.bids
+    assert restored.asks == expected.asks
+
+
+class _SnapshotRestClient:
+    def __init__(self, last_update_id: int) -> None:
+        self.last_update_id = last_update_id
+        self.calls = 0
+
+    def fetch_depth_snapshot(self, symbol: str, limit: int = 1000) -> dict[str, object]:
+        self.calls += 1
+        return {"last_update_id": self.last_update_id, "bids": [(99.0, 10_000.0)], "asks": [(101.0, 10_000.0)]}
+
+
+def test_supervisor_warm_start_waits_for_live_diff_and_snapshots_on_gap_without_degrading(tmp_path: Path) -> None:
+    minute = floor_to_minute_ms(now_ms())
+    book = DepthOrderBook()
+    book.sync_from_snapshot(last_update_id=100, bids=[(99.0, 10_000.0)], asks=[(101.0, 10_000.0)])
+    checkpoint_store = DepthCheckpointStore(tmp_path / "checkpoints")
+    checkpoint_store.save(book.checkpoint("BTCUSDT"))  # type: ignore[arg-type]
+
+    def _depth_payload(first_id: int, final_id: int, previous_id: int) -> dict[str, object]:
+        return {
+            "e": "depthUpdate",
+            "E": minute + final_id,
+            "T": minute + final_id - 5,
+            "s": "BTCUSDT",
+            "U": first_id,
+            "u": final_id,
+            "pu": previous_id,
+            "b": [],
+            "a": [],
+        }
+
+    def _supervisor(rest_client: object) -> tuple[BinanceLiveStreamSupervisor, InMemoryLiveCollector]:
+        collector = InMemoryLiveCollector(symbol="BTCUSDT")
+        supervisor = BinanceLiveStreamSupervisor(
+            symbol="BTCUSDT",
+            websocket_base_url="wss://fstream.binance.com/ws",
+            rest_client=rest_client,
+            collector=collector,
+            checkpoint_store=checkpoint_store,
+        )
+        assert supervisor._warm_start_depth_book() is True
+        assert collector.depth_book_synchronized("BTCUSDT") is False
+        return supervisor, collector
+
+    resumed, resumed_collector = _supervisor(_NoRestClient())
+    resumed._on_depth_message("btcusdt@depth@100ms", _depth_payload(101, 105, 100), minute + 200)
+    assert resumed_collector.depth_book_synchronized("BTCUSDT") is True
+    assert resumed.depth_warm_start_metrics() == DepthWarmStartMetrics(attempts=1, confirmed=1, fallbacks=0)
+
+    # Diffs published while the process was down are never replayed, so the first live diff shows a gap.
+    rest_client = _SnapshotRestClient(last_update_id=502)
+    restarted, restarted_collector = _supervisor(rest_client)
+    restarted._on_depth_message("btcusdt@depth@100ms", _depth_payload(500, 505, 499), minute + 600)
+    assert restarted._resync_controller.run_pending() is True
+    assert rest_client.calls == 1
+    assert restarted_collector.depth_book_synchronized("BTCUSDT") is True
+    assert restarted.depth_warm_start_metrics() == DepthWarmStartMetrics(attempts=1, confirmed=0, fallbacks=1)
+    assert restarted.depth_resync_metrics().degraded_minutes == 0
+    assert restarted_collector.snapshot_for_minute(minute).depth_degraded is False
+
+
+class _NoRestClient:
+    def fetch_depth_snapshot(self, symbol: str, limit: int = 1000) -> dict[str, object]:
+        raise AssertionError("REST depth snapshot should not be needed for a warm start")
+
+
+def test_supervisor_warm_start_uses_fresh_checkpoint(tmp_path: Path) -> None:
+    checkpoint_store = DepthCheckpointStore(tmp_path / "checkpoints")
+    book = DepthOrderBook()
+    book.sync_from_snapshot(last_update_id=100, bids=[(99.0, 10.0)], asks=[(101.0, 10.0)])
+    checkpoint = book.checkpoint("BTCUSDT")
+    assert checkpoint is not None
+    checkpoint_store.save(checkpoint)
+
+    collector = InMemoryLiveCollector(symbol="BTCUSDT")
+    supervisor = BinanceLiveStreamSupervisor(
+        symbol="BTCUSDT",
+        websocket_base_url="wss://fstream.binance.com/ws",
+        rest_client=_NoRestClient(),
+        collector=collector,
+        checkpoint_store=checkpoint_store,
+    )
+    assert supervisor._warm_start_depth_book() is True
+
+    stale_supervisor = BinanceLiveStreamSupervisor(
+        symbol="BTCUSDT",
+        websocket_base_url="wss://fstream.binance.com/ws",
+        rest_client=_NoRestClient(),
+        collector=InMemoryLiveCollector(symbol="BTCUSDT"),
+        checkpoint_store=checkpoint_store,
+        checkpoint_max_age_seconds=1.0,
+    )
+    checkpoint_store.save(book.checkpoint("BTCUSDT", created_at_ms=now_ms() - 5_000))  # type: ignore[arg-type]
+    assert stale_supervisor._warm_start_depth_book() is False
+
+
+def test_resync_controller_coalesces_requests_and_backs_off() -> None:
+    outcomes = [False, True]
+    calls: list[int] = []
+
+    def _resync(requested_at_ms: int) -> bool:
+        calls.append(requested_at_ms)
+        return outcomes.pop(0)
+
+    controller = DepthResyncController(
+        symbol="BTCUSDT",
+        resync=_resync,
+        snapshot_weight=20,
+        weight_budget_per_minute=1_200,
+    )
+    minute = floor_to_minute_ms(now_ms())
+    assert controller.request(minute) is True
+    assert controller.request(minute + 100) is False
+    assert controller.request(minute + 200) is False
+
+    assert controller.run_pending() is True
+    assert calls == [minute + 200]
+    # The failed attempt stays queued but is paced behind the backoff window.
+    assert controller.run_pending() is False
+    controller._next_allowed_monotonic = 0.0
+    assert controller.run_pending() is True
+    assert controller.run_pending() is False
+
+    metrics = controller.metrics()
+    assert metrics.requests == 3
+    assert metrics.coalesced == 2
+    assert metrics.resyncs == 1
+    assert metrics.failures == 1
+    assert metrics.in_flight is False
+    assert metrics.degraded_minutes >= 1
+
+
+def _rest_agg_trade(agg_trade_id: int, transact_time: int) -> dict[str, object]:
+    return {
+        "agg_trade_id": agg_trade_id,
+        "price": 100.0 + agg_trade_id,
+        "qty": 1.0,
+        "first_trade_id": agg_trade_id * 10,
+        "last_trade_id": agg_trade_id * 10,
+        "transact_time": transact_time,
+        "is_buyer_maker": agg_trade_id % 2 == 0,
+    }
+
+
+def test_agg_trade_gap_is_backfilled_by_trade_id(tmp_path: Path) -> None:
+    store = LiveEventStore(tmp_path / "live_events.sqlite")
+    collector = InMemoryLiveCollector(event_store=store, symbol="BTCUSDT")
+    processor = BinanceWsPayloadProcessor(collector=collector, symbol="BTCUSDT")
+    minute = _ms(datetime(2026, 1, 15, 10, 0, tzinfo=UTC))
+    rest_trades = [_rest_agg_trade(agg_id, minute + agg_id * 1_000) for agg_id in range(1, 12)]
+    fetches: list[tuple[int, int]] = []
+
+    def _fetch_from_id(from_id: int, limit: int) -> list[dict[str, object]]:
+        fetches.append((from_id, limit))
+        return [trade for trade in rest_trades if int(str(trade["agg_trade_id"])) >= from_id][:limit]
+
+    backfiller = AggTradeBackfiller(
+        symbol="BTCUSDT",
+        fetch_from_id=_fetch_from_id,
+        store=lambda trades: collector.ingest_backfilled_agg_trades(symbol="BTCUSDT", trades=trades),
+        last_agg_trade_id=collector.last_agg_trade_id("BTCUSDT"),
+        page_limit=2,
+    )
+    for agg_id in (1, 2, 7, 7, 8):
+        trade_time = minute + agg_id * 1_000
+        payload = {
+            "e": "aggTrade",
+            "E": trade_time,
+            "s": "BTCUSDT",
+            "a": agg_id,
+            "p": "100.0",
+            "q": "1.0",
+            "f": agg_id * 10,
+            "l": agg_id * 10,
+            "T": trade_time,
+            "m": False,
+        }
+        processor.process_stream_payload(stream_name="btcusdt@aggTrade", payload=payload, arrival_time_ms=trade_time)
+        backfiller.observe(agg_id, trade_time)
+
+    assert backfiller.metrics().pending_gaps == 1
+    assert backfiller.run_pending() is True
+    assert fetches == [(3, 2), (5, 2)]
+
+    rows = store.agg_trades_for_window(symbol="BTCUSDT", start_timestamp_ms=minute, end_timestamp_ms=minute + 60_000)
+    assert [row["agg_trade_id"] for row in rows] == [1, 2, 3, 4, 5, 6, 7, 8]
+    metrics = backfiller.metrics()
+    assert metrics.gaps_filled == 1
+    assert metrics.trades_backfilled == 4
+    assert collector.last_agg_trade_id("BTCUSDT") == 8
+
+
+def test_supervisor_queues_resync_instead_of_fetching_on_receive_path() -> None:
+    collector = InMemoryLiveCollector(symbol="BTCUSDT")
+    collector.set_depth_snapshot(symbol="BTCUSDT", last_update_id=100, bids=[(99.0, 10.0)], asks=[(101.0, 10.0)])
+    supervisor = BinanceLiveStreamSupervisor(
+        symbol="BTCUSDT",
+        websocket_base_url="wss://fstream.binance.com/ws",
+        rest_client=_NoRestClient(),
+        collector=collector,
+    )
+    minute = floor_to_minute_ms(now_ms())
+    for first_id, final_id, previous_id in ((110, 115, 109), (116, 120, 115)):
+        supervisor._on_depth_message(
+            "btcusdt@depth@100ms",
+            {"e": "depthUpdate", "E": minute, "s": "BTCUSDT", "U": first_id, "u": final_id, "pu": previous_id},
+            minute + 10,
+        )
+
+    metrics = supervisor.depth_resync_metrics()
+    assert metrics.requests == 1
+    assert metrics.resyncs == 0
+
+    # Diffs buffered while the snapshot is in flight bridge the eventual snapshot.
+    collector.set_depth_snapshot(symbol="BTCUSDT", last_update_id=112, bids=[(99.0, 10.0)], asks=[(101.0, 10.0)])
+    restored = collector.depth_checkpoint("BTCUSDT")
+    assert restored is not None
+    assert restored.last_update_id == 120
+
+
+def test_supervisor_combined_stream_dispatches_by_stream_name() -> None:
+    collector = InMemoryLiveCollector(symbol="BTCUSDT")
+    supervisor = BinanceLiveStreamSupervisor(
+        symbol="BTCUSDT",
+        websocket_base_url="wss://fstream.binance.com/ws",
+        rest_client=_NoRestClient(),
+        collector=collector,
+    )
+    assert supervisor._combined_stream_url(["btcusdt@depth@100ms", "btcusdt@forceOrder"]) == (
+        "wss://fstream.binance.com/stream?streams=btcusdt@depth@100ms/btcusdt@forceOrder"
+    )
+
+    minute = floor_to_minute_ms(now_ms())
+    supervisor._on_combined_connection_change(True)
+    supervisor._on_combined_message(
+        {
+            "stream": "btcusdt@forceOrder",
+            "data": {
+                "e": "forceOrder",
+                "E": minute + 1_000,
+                "o": {"s": "BTCUSDT", "S": "SELL", "p": "100.0", "ap": "100.0", "q": "2.0", "l": "2.0"},
+            },
+        },
+        minute + 1_050,
+    )
+    supervisor._on_combined_message({"stream": "ethusdt@aggTrade", "data": {"e": "aggTrade"}}, minute + 1_100)
+
+    snapshot = collector.snapshot_for_minute(minute)
+    assert snapshot.liq_long_count == 1
+    assert supervisor._connection_state["liquidation"].last_message_time == minute + 1_050
+    assert all(state.connected for state in supervisor._connection_state.values())
+
+
+def test_redundant_connections_deduplicate_and_track_win_rate() -> None:
+    collector = InMemoryLiveCollector(symbol="BTCUSDT")
+    supervisor = BinanceLiveStreamSupervisor(
+        symbol="BTCUSDT",
+        websocket_base_url="wss://fstream.binance.com/ws",
+        rest_client=_NoRestClient(),
+        collector=collector,
+        redundant_connections=True,
+        standby_websocket_base_url="wss://fstream-standby.example/ws",
+    )
+    minute = floor_to_minute_ms(now_ms())
+
+    def _liquidation(event_time: int) -> dict[str, object]:
+        order = {"s": "BTCUSDT", "S": "SELL", "p": "100.0", "ap": "100.0", "q": "2.0", "l": "2.0", "T": event_time}
+        return {"stream": "btcusdt@forceOrder", "data": {"e": "forceOrder", "E": event_time, "o": order}}
+
+    supervisor._on_combined_message(_liquidation(minute + 1_000), minute + 1_020, None, "standby")
+    supervisor._on_combined_message(_liquidation(minute + 1_000), minute + 1_050, None, "primary")
+    supervisor._on_combined_message(_liquidation(minute + 2_000), minute + 2_010, None, "primary")
+    supervisor._on_combined_message(_liquidation(minute + 2_000), minute + 2_040, None, "standby")
+    supervisor._on_combined_message(_liquidation(minute + 3_000), minute + 3_010, None, "standby")
+
+    assert collector.snapshot_for_minute(minute).liq_long_count == 3
+    metrics = {item.connection: item for item in supervisor.redundancy_metrics()}
+    assert (metrics["standby"].wins, metrics["standby"].losses) == (2, 1)
+    assert (metrics["primary"].wins, metrics["primary"].losses) == (1, 1)
+    assert metrics["standby"].win_rate == pytest.approx(2 / 3)
+    assert metrics["primary"].mean_lead_ms == 30
+
+    supervisor._on_combined_connection_change(True, "primary")
+    supervisor._on_combined_connection_change(True, "standby")
+    supervisor._on_combined_connection_change(False, "primary")
+    assert supervisor._connection_state["liquidation"].connected is True
+    supervisor._on_combined_connection_change(False, "standby")
+    assert supervisor._connection_state["liquidation"].connected is False
+
+    # Both connections hand off through the supervisor's one receive queue and its single dispatcher.
+    workers = [
+        supervisor._combined_worker(connection, base_url)
+        for connection, base_url in supervisor._connection_base_urls.items()
+    ]
+    assert {id(worker._receive_queue) for worker in workers} == {id(supervisor._receive_queue)}
+
+
+def test_plan_stream_connections_packs_and_balances() -> None:
+    streams = {symbol: [f"{symbol.lower()}@{name}" for name in "abcd"] for symbol in ("BTC", "ETH", "SOL")}
+    assert plan_stream_connections(streams, max_streams_per_connection=8) == [["BTC", "SOL"], ["ETH"]]
+
+    weighted = plan_stream_connections(
+        streams,
+        max_streams_per_connection=8,
+        symbol_weights={"BTC": 100.0, "ETH": 60.0, "SOL": 50.0},
+    )
+    assert weighted == [["BTC"], ["ETH", "SOL"]]
+
+
+def test_multi_symbol_supervisor_routes_by_symbol_to_owning_shard() -> None:
+    supervisors = [
+        BinanceLiveStreamSupervisor(
+            symbol=symbol,
+            websocket_base_url="wss://fstream.binance.com/ws",
+            rest_client=_NoRestClient(),
+            collector=InMemoryLiveCollector(symbol=symbol),
+        )
+        for symbol in ("BTCUSDT", "ETHUSDT")
+    ]
+    multi = BinanceMultiSymbolSupervisor(
+        supervisors=supervisors,
+        websocket_base_url="wss://fstream.binance.com/ws",
+        max_streams_per_connection=6,
+    )
+    multi._apply_plan(multi._compute_plan(connection_count=None))
+    assert len(multi._plan) == 2
+    btc_index = multi._owner["BTCUSDT"]
+    assert multi._shard_url(btc_index).startswith("wss://fstream.binance.com/stream?streams=btcusdt@depth@100ms/")
+
+    minute = floor_to_minute_ms(now_ms())
+    payload = {
+        "stream": "btcusdt@forceOrder",
+        "data": {
+            "e": "forceOrder",
+            "E": minute + 1_000,
+            "o": {"s": "BTCUSDT", "S": "SELL", "p": "100.0", "ap": "100.0", "q": "2.0", "l": "2.0"},
+        },
+    }
+    multi._on_shard_message(btc_index, payload, minute + 1_050, None)
+    # A shard that does not own the symbol (e.g. mid-rebalance) must not double-count it.
+    multi._on_shard_message(1 - btc_index, payload, minute + 1_060, None)
+
+    assert supervisors[0]._collector.snapshot_for_minute(minute).liq_long_count == 1
+    metrics = {item.name: item for item in multi.connection_metrics()}
+    assert metrics[f"shard-{btc_index}"].messages == 1
+    assert metrics[f"shard-{btc_index}"].symbols == ("BTCUSDT",)
+    assert metrics[f"shard-{1 - btc_index}"].messages == 1
+
+
+def test_multi_symbol_supervisor_forgets_removed_symbol_immediately() -> None:
+    supervisors = [
+        BinanceLiveStreamSupervisor(
+            symbol=symbol,
+            websocket_base_url="wss://fstream.binance.com/ws",
+            rest_client=_NoRestClient(),
+            collector=InMemoryLiveCollector(symbol=symbol),
+        )
+        for symbol in ("BTCUSDT", "ETHUSDT")
+    ]
+    multi = BinanceMultiSymbolSupervisor(
+        supervisors=supervisors,
+        websocket_base_url="wss://fstream.binance.com/ws",
+        max_streams_per_connection=6,
+    )
+    multi._apply_plan(multi._compute_plan(connection_count=None))
+    eth_index = multi._owner["ETHUSDT"]
+
+    # No worker loop is running, so no later rebalance would clean up after the removal.
+    multi.remove_symbol("ethusdt")
+
+    assert "ETHUSDT" not in multi._owner
+    assert all("ETHUSDT" not in item.symbols for item in multi.connection_metrics())
+    minute = floor_to_minute_ms(now_ms())
+    payload = {
+        "stream": "ethusdt@forceOrder",
+        "data": {
+            "e": "forceOrder",
+            "s": "ETHUSDT",
+            "E": minute + 1_000,
+            "o": {"s": "ETHUSDT", "S": "SELL", "p": "10.0", "ap": "10.0", "q": "2.0", "l": "2.0"},
+        },
+    }
+    multi._on_shard_message(eth_index, payload, minute + 1_050, None)
+    multi._on_shard_connection_change(eth_index, True)
+    assert "ethusdt@depth@100ms" not in multi._shard_url(eth_index)
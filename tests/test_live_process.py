@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+from binance_minute_lake.sources.live_process import (
+    FeatureRingBuffer,
+    LiveFeaturePublisher,
+    SharedMemoryLiveCollector,
+)
+from binance_minute_lake.sources.websocket import InMemoryLiveCollector, LiquidationOrderEvent, LiveEventStore
+
+
+def _ms(dt: datetime) -> int:
+    return int(dt.timestamp() * 1000)
+
+
+def test_feature_ring_hands_minutes_between_mappings(tmp_path: Path) -> None:
+    ring_path = tmp_path / "live_features.ring"
+    writer = FeatureRingBuffer.create(ring_path, slot_count=16)
+    reader = FeatureRingBuffer(ring_path)
+    store = LiveEventStore(tmp_path / "live_events.sqlite")
+    collector = InMemoryLiveCollector(event_store=store, symbol="BTCUSDT", impact_curve_notionals=[10_000.0])
+    minute = _ms(datetime(2026, 1, 15, 10, 0, tzinfo=UTC))
+    collector.ingest_liquidation_event(
+        LiquidationOrderEvent(
+            symbol="BTCUSDT",
+            event_time=minute + 1_000,
+            side="SELL",
+            price=100.0,
+            quantity=3.0,
+            arrival_time=minute + 1_050,
+        )
+    )
+
+    publisher = LiveFeaturePublisher(collector, writer)
+    assert publisher.publish_recent(at_ms=minute + 30_000) == 3
+    shared = SharedMemoryLiveCollector(reader, store, symbol="BTCUSDT")
+
+    assert shared.snapshot_for_minute(minute) == collector.snapshot_for_minute(minute)
+    assert reader.publish_count == 3
+    # Slots are direct-mapped by minute: the same slot 16 minutes later is not this minute.
+    assert reader.read(minute + 16 * 60_000) is None
+
+    # Minutes missing from a freshly created ring are rebuilt from the shared event store.
+    writer.close()
+    reader.close()
+    empty_ring = FeatureRingBuffer.create(ring_path, slot_count=16)
+    restarted = SharedMemoryLiveCollector(empty_ring, store, symbol="BTCUSDT")
+    rebuilt = restarted.snapshot_for_minute(minute)
+    assert rebuilt is not None
+    assert rebuilt.liq_long_count == 1
+    empty_ring.close()
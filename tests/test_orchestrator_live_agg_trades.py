@@ -1,18 +1,27 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import threading
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+import polars as pl
+
 from binance_minute_lake.core.config import Settings
 from binance_minute_lake.core.enums import IngestionBand
 from binance_minute_lake.pipeline.orchestrator import MinuteIngestionPipeline
+from binance_minute_lake.sources.rest import AGG_TRADE_FRAME_SCHEMA
 from binance_minute_lake.sources.websocket import LiveCollector, LiveMinuteFeatures
 
 
 class _StubLiveCollector(LiveCollector):
-    def __init__(self, rows: list[dict[str, object]]) -> None:
+    def __init__(
+        self,
+        rows: list[dict[str, object]],
+        minute_bars: dict[str, list[dict[str, object]]] | None = None,
+    ) -> None:
         self.rows = rows
+        self.minute_bars = minute_bars or {}
         self.calls = 0
 
     def snapshot_for_minute(self, minute_timestamp_ms: int) -> LiveMinuteFeatures | None:
@@ -28,6 +37,16 @@ class _StubLiveCollector(LiveCollector):
         self.calls += 1
         return list(self.rows)
 
+    def minute_bars_for_window(
+        self,
+        *,
+        symbol: str,
+        kind: str,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> list[dict[str, object]]:
+        return list(self.minute_bars.get(kind, []))
+
 
 def _settings(tmp_path: Path) -> Settings:
     return Settings(
@@ -67,40 +86,46 @@ def test_collect_uses_live_ws_agg_trades_before_rest(tmp_path: Path) -> None:
         raise AssertionError("REST aggTrades should not be called when live rows are available")
 
     try:
-        pipeline._rest.fetch_agg_trades = _raise_if_called  # type: ignore[method-assign]
-        pipeline._rest.fetch_klines = lambda *args, **kwargs: [  # type: ignore[method-assign]
-            {
-                "open_time": minute_ms,
-                "open": 100.0,
-                "high": 101.0,
-                "low": 99.0,
-                "close": 100.5,
-                "volume_btc": 2.0,
-                "close_time": minute_ms + 59_999,
-                "volume_usdt": 200000.0,
-                "trade_count": 2,
-                "taker_buy_vol_btc": 1.0,
-                "taker_buy_vol_usdt": 100000.0,
-            }
-        ]
-        pipeline._rest.fetch_mark_price_klines = lambda *args, **kwargs: [  # type: ignore[method-assign]
-            {
-                "open_time": minute_ms,
-                "mark_price_open": 100.0,
-                "mark_price_high": 101.0,
-                "mark_price_low": 99.0,
-                "mark_price_close": 100.5,
-            }
-        ]
-        pipeline._rest.fetch_index_price_klines = lambda *args, **kwargs: [  # type: ignore[method-assign]
-            {
-                "open_time": minute_ms,
-                "index_price_open": 100.0,
-                "index_price_high": 101.0,
-                "index_price_low": 99.0,
-                "index_price_close": 100.5,
-            }
-        ]
+        pipeline._rest.fetch_agg_trades_frame = _raise_if_called  # type: ignore[method-assign]
+        pipeline._rest.fetch_klines_frame = lambda *args, **kwargs: pl.DataFrame(  # type: ignore[method-assign]
+            [
+                {
+                    "open_time": minute_ms,
+                    "open": 100.0,
+                    "high": 101.0,
+                    "low": 99.0,
+                    "close": 100.5,
+                    "volume_btc": 2.0,
+                    "close_time": minute_ms + 59_999,
+                    "volume_usdt": 200000.0,
+                    "trade_count": 2,
+                    "taker_buy_vol_btc": 1.0,
+                    "taker_buy_vol_usdt": 100000.0,
+                }
+            ]
+        )
+        pipeline._rest.fetch_mark_price_klines_frame = lambda *args, **kwargs: pl.DataFrame(  # type: ignore[method-assign]
+            [
+                {
+                    "open_time": minute_ms,
+                    "mark_price_open": 100.0,
+                    "mark_price_high": 101.0,
+                    "mark_price_low": 99.0,
+                    "mark_price_close": 100.5,
+                }
+            ]
+        )
+        pipeline._rest.fetch_index_price_klines_frame = lambda *args, **kwargs: pl.DataFrame(  # type: ignore[method-assign]
+            [
+                {
+                    "open_time": minute_ms,
+                    "index_price_open": 100.0,
+                    "index_price_high": 101.0,
+                    "index_price_low": 99.0,
+                    "index_price_close": 100.5,
+                }
+            ]
+        )
         pipeline._rest.fetch_book_ticker = lambda *args, **kwargs: {  # type: ignore[method-assign]
             "bid_price": 100.0,
             "bid_qty": 10.0,
@@ -135,40 +160,46 @@ def test_collect_warm_band_skips_rest_agg_trades_fallback(tmp_path: Path) -> Non
         raise AssertionError("REST aggTrades should be skipped for warm windows without live rows")
 
     try:
-        pipeline._rest.fetch_agg_trades = _raise_if_called  # type: ignore[method-assign]
-        pipeline._rest.fetch_klines = lambda *args, **kwargs: [  # type: ignore[method-assign]
-            {
-                "open_time": minute_ms,
-                "open": 100.0,
-                "high": 101.0,
-                "low": 99.0,
-                "close": 100.5,
-                "volume_btc": 2.0,
-                "close_time": minute_ms + 59_999,
-                "volume_usdt": 200000.0,
-                "trade_count": 2,
-                "taker_buy_vol_btc": 1.0,
-                "taker_buy_vol_usdt": 100000.0,
-            }
-        ]
-        pipeline._rest.fetch_mark_price_klines = lambda *args, **kwargs: [  # type: ignore[method-assign]
-            {
-                "open_time": minute_ms,
-                "mark_price_open": 100.0,
-                "mark_price_high": 101.0,
-                "mark_price_low": 99.0,
-                "mark_price_close": 100.5,
-            }
-        ]
-        pipeline._rest.fetch_index_price_klines = lambda *args, **kwargs: [  # type: ignore[method-assign]
-            {
-                "open_time": minute_ms,
-                "index_price_open": 100.0,
-                "index_price_high": 101.0,
-                "index_price_low": 99.0,
-                "index_price_close": 100.5,
-            }
-        ]
+        pipeline._rest.fetch_agg_trades_frame = _raise_if_called  # type: ignore[method-assign]
+        pipeline._rest.fetch_klines_frame = lambda *args, **kwargs: pl.DataFrame(  # type: ignore[method-assign]
+            [
+                {
+                    "open_time": minute_ms,
+                    "open": 100.0,
+                    "high": 101.0,
+                    "low": 99.0,
+                    "close": 100.5,
+                    "volume_btc": 2.0,
+                    "close_time": minute_ms + 59_999,
+                    "volume_usdt": 200000.0,
+                    "trade_count": 2,
+                    "taker_buy_vol_btc": 1.0,
+                    "taker_buy_vol_usdt": 100000.0,
+                }
+            ]
+        )
+        pipeline._rest.fetch_mark_price_klines_frame = lambda *args, **kwargs: pl.DataFrame(  # type: ignore[method-assign]
+            [
+                {
+                    "open_time": minute_ms,
+                    "mark_price_open": 100.0,
+                    "mark_price_high": 101.0,
+                    "mark_price_low": 99.0,
+                    "mark_price_close": 100.5,
+                }
+            ]
+        )
+        pipeline._rest.fetch_index_price_klines_frame = lambda *args, **kwargs: pl.DataFrame(  # type: ignore[method-assign]
+            [
+                {
+                    "open_time": minute_ms,
+                    "index_price_open": 100.0,
+                    "index_price_high": 101.0,
+                    "index_price_low": 99.0,
+                    "index_price_close": 100.5,
+                }
+            ]
+        )
         pipeline._rest.fetch_book_ticker = lambda *args, **kwargs: {  # type: ignore[method-assign]
             "bid_price": 100.0,
             "bid_qty": 10.0,
@@ -191,3 +222,262 @@ def test_collect_warm_band_skips_rest_agg_trades_fallback(tmp_path: Path) -> Non
     row = frame.row(0, named=True)
     assert row["count_buy_trades"] == 0
     assert row["count_sell_trades"] == 0
+
+
+def test_collect_hot_band_builds_minutes_from_streams_and_fills_gaps_from_rest(tmp_path: Path) -> None:
+    minute = datetime(2026, 1, 15, 10, 0, tzinfo=UTC)
+    minute_ms = int(minute.timestamp() * 1000)
+
+    def _kline(open_time: int, close: float) -> dict[str, object]:
+        return {
+            "open_time": open_time,
+            "open": close,
+            "high": close,
+            "low": close,
+            "close": close,
+            "volume_btc": 1.0,
+            "close_time": open_time + 59_999,
+            "volume_usdt": close,
+            "trade_count": 1,
+            "taker_buy_vol_btc": 0.5,
+            "taker_buy_vol_usdt": close / 2,
+        }
+
+    def _mark(open_time: int, prefix: str) -> dict[str, object]:
+        return {"open_time": open_time, **{f"{prefix}_{part}": 100.0 for part in ("open", "high", "low", "close")}}
+
+    collector = _StubLiveCollector(
+        rows=[],
+        minute_bars={
+            # The second minute's kline never arrived over the stream.
+            "kline": [_kline(minute_ms, 100.0)],
+            "mark_price_kline": [_mark(minute_ms, "mark_price"), _mark(minute_ms + 60_000, "mark_price")],
+            "index_price_kline": [_mark(minute_ms, "index_price"), _mark(minute_ms + 60_000, "index_price")],
+            "book_ticker": [
+                {"bid_price": 99.9, "bid_qty": 1.0, "ask_price": 100.1, "ask_qty": 2.0, "event_time": minute_ms + 5}
+            ],
+        },
+    )
+    pipeline = MinuteIngestionPipeline(settings=_settings(tmp_path), live_collector=collector)
+    kline_calls: list[datetime] = []
+
+    def _rest_klines(symbol: str, start: datetime, end: datetime) -> pl.DataFrame:
+        kline_calls.append(start)
+        return pl.DataFrame([_kline(minute_ms, 1.0), _kline(minute_ms + 60_000, 101.0)])
+
+    def _raise_if_called(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("REST should not be called for stream-covered minutes")
+
+    try:
+        pipeline._rest.fetch_klines_frame = _rest_klines  # type: ignore[method-assign]
+        pipeline._rest.fetch_mark_price_klines_frame = _raise_if_called  # type: ignore[method-assign]
+        pipeline._rest.fetch_index_price_klines_frame = _raise_if_called  # type: ignore[method-assign]
+        pipeline._rest.fetch_book_ticker = _raise_if_called  # type: ignore[method-assign]
+        pipeline._rest.fetch_agg_trades_frame = lambda *args, **kwargs: pl.DataFrame(  # type: ignore[method-assign]
+            schema=AGG_TRADE_FRAME_SCHEMA
+        )
+
+        frame = pipeline._collect_and_transform(
+            window_start=minute,
+            window_end=minute + timedelta(minutes=1),
+            band=IngestionBand.HOT,
+            include_rest_enrichment=False,
+        )
+    finally:
+        pipeline.close()
+
+    assert len(kline_calls) == 1
+    assert frame.height == 2
+    assert frame.get_column("close").to_list() == [100.0, 101.0]
+
+
+def test_collect_fans_out_independent_rest_fetches_concurrently(tmp_path: Path) -> None:
+    minute = datetime(2026, 1, 15, 10, 0, tzinfo=UTC)
+    minute_ms = int(minute.timestamp() * 1000)
+    trade = {
+        "agg_trade_id": 1,
+        "price": 100.0,
+        "qty": 1.0,
+        "first_trade_id": 10,
+        "last_trade_id": 10,
+        "transact_time": minute_ms + 1_000,
+        "is_buyer_maker": False,
+    }
+    collector = _StubLiveCollector(rows=[trade])
+    pipeline = MinuteIngestionPipeline(settings=_settings(tmp_path), live_collector=collector)
+    # Each stub blocks until all four are in flight, so a serial fetch order would break the barrier.
+    barrier = threading.Barrier(4, timeout=5.0)
+
+    def _concurrent(row: dict[str, object]) -> Any:
+        def _fetch(*args: Any, **kwargs: Any) -> Any:
+            barrier.wait()
+            return pl.DataFrame([row]) if "open_time" in row else dict(row)
+
+        return _fetch
+
+    prices = ("open", "high", "low", "close")
+    try:
+        pipeline._rest.fetch_klines_frame = _concurrent(  # type: ignore[method-assign]
+            {
+                "open_time": minute_ms,
+                **dict.fromkeys(prices, 100.0),
+                "volume_btc": 1.0,
+                "close_time": minute_ms + 59_999,
+                "volume_usdt": 100.0,
+                "trade_count": 1,
+                "taker_buy_vol_btc": 1.0,
+                "taker_buy_vol_usdt": 100.0,
+            }
+        )
+        pipeline._rest.fetch_mark_price_klines_frame = _concurrent(  # type: ignore[method-assign]
+            {"open_time": minute_ms, **{f"mark_price_{part}": 100.0 for part in prices}}
+        )
+        pipeline._rest.fetch_index_price_klines_frame = _concurrent(  # type: ignore[method-assign]
+            {"open_time": minute_ms, **{f"index_price_{part}": 100.0 for part in prices}}
+        )
+        pipeline._rest.fetch_book_ticker = _concurrent(  # type: ignore[method-assign]
+            {"bid_price": 99.9, "bid_qty": 1.0, "ask_price": 100.1, "ask_qty": 1.0, "event_time": minute_ms}
+        )
+
+        frame = pipeline._collect_and_transform(
+            window_start=minute,
+            window_end=minute,
+            band=IngestionBand.HOT,
+            include_rest_enrichment=False,
+        )
+    finally:
+        pipeline.close()
+
+    assert not barrier.broken
+    assert frame.height == 1
+    assert frame.row(0, named=True)["close"] == 100.0
+
+
+def test_catch_up_fetches_klines_for_the_whole_range_in_one_batch(tmp_path: Path) -> None:
+    start = datetime(2026, 1, 15, 10, 0, tzinfo=UTC)
+    settings = _settings(tmp_path)
+    pipeline = MinuteIngestionPipeline(settings=settings, live_collector=_StubLiveCollector(rows=[]))
+    kline_calls: list[tuple[datetime, datetime]] = []
+
+    def _minutes(fetch_start: datetime, fetch_end: datetime) -> list[int]:
+        first = int(fetch_start.timestamp() * 1000)
+        last = int(fetch_end.timestamp() * 1000)
+        return list(range(first, last + 1, 60_000))
+
+    def _klines(symbol: str, fetch_start: datetime, fetch_end: datetime, limit: int = 1500) -> pl.DataFrame:
+        kline_calls.append((fetch_start, fetch_end))
+        rows = [
+            {
+                "open_time": ms,
+                **dict.fromkeys(("open", "high", "low", "close"), 100.0),
+                "volume_btc": 1.0,
+                "close_time": ms + 59_999,
+                "volume_usdt": 100.0,
+                "trade_count": 1,
+                "taker_buy_vol_btc": 0.5,
+                "taker_buy_vol_usdt": 50.0,
+            }
+            for ms in _minutes(fetch_start, fetch_end)[:limit]
+        ]
+        return pl.DataFrame(rows)
+
+    def _price_klines(prefix: str) -> Any:
+        def _fetch(symbol: str, fetch_start: datetime, fetch_end: datetime, limit: int = 1500) -> pl.DataFrame:
+            return pl.DataFrame(
+                [
+                    {"open_time": ms, **{f"{prefix}_{part}": 100.0 for part in ("open", "high", "low", "close")}}
+                    for ms in _minutes(fetch_start, fetch_end)[:limit]
+                ]
+            )
+
+        return _fetch
+
+    try:
+        pipeline.rewind_watermark(start - timedelta(minutes=1))
+        pipeline._rest.fetch_klines_frame = _klines  # type: ignore[method-assign]
+        pipeline._rest.fetch_mark_price_klines_frame = _price_klines("mark_price")  # type: ignore[method-assign]
+        pipeline._rest.fetch_index_price_klines_frame = _price_klines("index_price")  # type: ignore[method-assign]
+        pipeline._rest.fetch_agg_trades_frame = lambda *args, **kwargs: pl.DataFrame(  # type: ignore[method-assign]
+            schema=AGG_TRADE_FRAME_SCHEMA
+        )
+        pipeline._rest.fetch_book_ticker = lambda *args, **kwargs: {  # type: ignore[method-assign]
+            "bid_price": 99.9,
+            "bid_qty": 1.0,
+            "ask_price": 100.1,
+            "ask_qty": 1.0,
+            "event_time": 0,
+        }
+        pipeline._rest.fetch_premium_index = lambda *args, **kwargs: {  # type: ignore[method-assign]
+            "mark_price": 100.0,
+            "index_price": 100.0,
+            "last_funding_rate": 0.0001,
+            "next_funding_time": 0,
+            "predicted_funding": 0.0001,
+            "event_time": 0,
+        }
+        pipeline._rest.fetch_open_interest = lambda *args, **kwargs: {  # type: ignore[method-assign]
+            "symbol": "BTCUSDT",
+            "open_interest": 10.0,
+            "event_time": 0,
+        }
+        pipeline._rest.fetch_funding_rate = lambda *args, **kwargs: []  # type: ignore[method-assign]
+        pipeline._rest.fetch_top_trader_long_short_account_ratio = lambda *args, **kwargs: []  # type: ignore[method-assign]
+        pipeline._rest.fetch_global_long_short_account_ratio = lambda *args, **kwargs: []  # type: ignore[method-assign]
+
+        summary = pipeline.run_until_target(
+            target_horizon=start + timedelta(hours=24, minutes=59),
+            now_for_band=start + timedelta(days=2),
+        )
+    finally:
+        pipeline.close()
+
+    assert summary.partitions_committed == 25
+    # 25 hours of klines fit in two 1500-row pages instead of 25 per-hour calls.
+    assert len(kline_calls) == 2
+    assert kline_calls[0][0] == start
+
+
+def test_rest_agg_trades_are_paged_by_id_in_parallel_slices(tmp_path: Path) -> None:
+    start = datetime(2026, 1, 15, 10, 0, tzinfo=UTC)
+    start_ms = int(start.timestamp() * 1000)
+    # 5,000 trades, one every 720ms, spread over the hour.
+    tape = pl.DataFrame(
+        {
+            "agg_trade_id": list(range(1_000, 6_000)),
+            "price": [100.0] * 5_000,
+            "qty": [0.1] * 5_000,
+            "first_trade_id": list(range(1_000, 6_000)),
+            "last_trade_id": list(range(1_000, 6_000)),
+            "transact_time": [start_ms + index * 720 for index in range(5_000)],
+            "is_buyer_maker": [index % 2 == 0 for index in range(5_000)],
+        },
+        schema=AGG_TRADE_FRAME_SCHEMA,
+    )
+    time_calls: list[tuple[datetime, datetime]] = []
+    id_calls: list[int] = []
+    lock = threading.Lock()
+
+    def _by_time(symbol: str, start_time: datetime, end_time: datetime, limit: int = 1000) -> pl.DataFrame:
+        with lock:
+            time_calls.append((start_time, end_time))
+        first_ms, last_ms = int(start_time.timestamp() * 1000), int(end_time.timestamp() * 1000)
+        window = pl.col("transact_time").is_between(first_ms, last_ms)
+        return tape.filter(window).head(limit)
+
+    def _by_id(symbol: str, from_id: int, limit: int = 1000) -> pl.DataFrame:
+        with lock:
+            id_calls.append(from_id)
+        return tape.filter(pl.col("agg_trade_id") >= from_id).head(limit)
+
+    pipeline = MinuteIngestionPipeline(settings=_settings(tmp_path), live_collector=_StubLiveCollector(rows=[]))
+    try:
+        pipeline._rest.fetch_agg_trades_frame = _by_time  # type: ignore[method-assign]
+        pipeline._rest.fetch_agg_trades_frame_from_id = _by_id  # type: ignore[method-assign]
+        trades = pipeline._fetch_agg_trades_paginated(start, start + timedelta(hours=1))
+    finally:
+        pipeline.close()
+
+    assert trades["agg_trade_id"].to_list() == list(range(1_000, 6_000))
+    assert len(time_calls) == 4
+    # Each 1,250-trade slice needs one time-bounded page plus one fromId page.
+    assert len(id_calls) == 4
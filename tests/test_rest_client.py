@@ -1,7 +1,21 @@
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
 import httpx
+import polars as pl
 import pytest
 
-from binance_minute_lake.sources.rest import BinanceRESTClient
+from binance_minute_lake.core.enums import RestPriority
+from binance_minute_lake.sources.rate_limit import RestWeightLimiter, rest_priority, rest_request_weight
+from binance_minute_lake.sources.rest import (
+    AGG_TRADE_FRAME_SCHEMA,
+    KLINE_FRAME_SCHEMA,
+    MARK_PRICE_KLINE_FRAME_SCHEMA,
+    REST_HEDGE_MIN_SAMPLES,
+    BinanceRESTClient,
+)
 
 
 def test_rest_client_retries_on_429_then_succeeds() -> None:
@@ -112,3 +126,309 @@ def test_rest_client_parses_long_short_ratio_endpoints() -> None:
     assert top[0]["long_account"] == 0.55
     assert global_ratio[0]["ratio"] == 1.10
     assert global_ratio[0]["short_account"] == 0.47
+
+
+def test_weight_limiter_budget_is_shared_across_instances_and_tracks_server_usage(tmp_path: Path) -> None:
+    now = [1_000.0]
+    slept: list[float] = []
+
+    def _sleep(seconds: float) -> None:
+        slept.append(seconds)
+        now[0] += seconds
+
+    state_path = tmp_path / "state.sqlite"
+    first = RestWeightLimiter(100, headroom=1.0, state_path=state_path, clock=lambda: now[0], sleep=_sleep)
+    second = RestWeightLimiter(100, headroom=1.0, state_path=state_path, clock=lambda: now[0], sleep=_sleep)
+
+    assert rest_request_weight("/fapi/v1/klines", {"limit": 1500}) == 10
+    assert rest_request_weight("/fapi/v1/depth", {"limit": 1000}) == 20
+    assert first.try_acquire(60) == 0.0
+    # The second instance (another client or process) sees the 60 weight already spent.
+    assert second.try_acquire(60) == pytest.approx(12.0)
+    assert second.acquire(40) == 0.0
+
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(
+            status_code=200,
+            request=request,
+            headers={"X-MBX-USED-WEIGHT-1M": "90"},
+            json={"symbol": "BTCUSDT", "openInterest": "10.5", "time": 1},
+        )
+
+    now[0] += 30.0
+    client = BinanceRESTClient(
+        base_url="https://fapi.binance.com",
+        transport=httpx.MockTransport(handler),
+        rate_limiter=first,
+    )
+    try:
+        client.fetch_open_interest("BTCUSDT")
+        # The server reports 90 of 100 used, so 10 is left even though the bucket had refilled to 50.
+        assert first.try_acquire(10) == 0.0
+        assert first.try_acquire(6) == pytest.approx(3.6)
+    finally:
+        client.close()
+
+    assert requests == ["/fapi/v1/openInterest"]
+    assert slept == []
+    assert first.metrics().server_used_weight == 90
+
+
+def test_rest_client_parses_klines_and_agg_trades_into_typed_frames() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/klines"):
+            return httpx.Response(
+                status_code=200,
+                request=request,
+                json=[
+                    [60_000, "100.0", "101.5", "99.5", "101.0", "12.5", 119_999, "1262.5", 42, "6.0", "606.0", "0"],
+                ],
+            )
+        if request.url.path.endswith("/markPriceKlines"):
+            return httpx.Response(status_code=200, request=request, json=[])
+        return httpx.Response(
+            status_code=200,
+            request=request,
+            json=[
+                {"a": 7, "p": "100.5", "q": "0.25", "f": 10, "l": 12, "T": 60_500, "m": True},
+                {"a": 8, "p": "100.6", "q": "1.0", "f": 13, "l": 13, "T": 60_700, "m": False},
+            ],
+        )
+
+    client = BinanceRESTClient(
+        base_url="https://fapi.binance.com",
+        transport=httpx.MockTransport(handler),
+    )
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    try:
+        klines = client.fetch_klines_frame("BTCUSDT", start, start)
+        trades = client.fetch_agg_trades_frame("BTCUSDT", start, start)
+        empty = client.fetch_mark_price_klines_frame("BTCUSDT", start, start)
+    finally:
+        client.close()
+
+    assert klines.schema == pl.Schema(KLINE_FRAME_SCHEMA)
+    assert klines.row(0, named=True) == {
+        "open_time": 60_000,
+        "open": 100.0,
+        "high": 101.5,
+        "low": 99.5,
+        "close": 101.0,
+        "volume_btc": 12.5,
+        "close_time": 119_999,
+        "volume_usdt": 1262.5,
+        "trade_count": 42,
+        "taker_buy_vol_btc": 6.0,
+        "taker_buy_vol_usdt": 606.0,
+    }
+    assert trades.schema == pl.Schema(AGG_TRADE_FRAME_SCHEMA)
+    assert trades["agg_trade_id"].to_list() == [7, 8]
+    assert trades["qty"].to_list() == [0.25, 1.0]
+    assert trades["is_buyer_maker"].to_list() == [True, False]
+    assert empty.height == 0
+    assert empty.schema == pl.Schema(MARK_PRICE_KLINE_FRAME_SCHEMA)
+
+
+def test_rest_client_fails_over_and_hedges_slow_requests_to_alternate_hosts(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("binance_minute_lake.sources.rest.time.sleep", lambda _seconds: None)
+    primary_down = True
+    primary_stalled = threading.Event()
+    release_primary = threading.Event()
+    hosts_seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        hosts_seen.append(host)
+        if host == "fapi.binance.com":
+            if primary_down:
+                return httpx.Response(status_code=503, request=request, json={"msg": "unavailable"})
+            if primary_stalled.is_set():
+                release_primary.wait(timeout=5)
+        return httpx.Response(status_code=200, request=request, json={"serverTime": 1, "host": host})
+
+    client = BinanceRESTClient(
+        base_url="https://fapi.binance.com",
+        retries=3,
+        transport=httpx.MockTransport(handler),
+        alternate_base_urls=["https://fapi1.binance.com"],
+    )
+    try:
+        assert client._get("/fapi/v1/time", {})["host"] == "fapi1.binance.com"
+        assert hosts_seen == ["fapi.binance.com", "fapi1.binance.com"]
+
+        primary_down = False
+        for _ in range(25):
+            client._get("/fapi/v1/time", {})
+        assert client.hedge_metrics().hedge_delay_seconds is not None
+
+        # Reset host preference so the stalled primary is tried first.
+        for host in client._hosts:
+            host.consecutive_failures = 0
+        primary_stalled.set()
+        assert client._get("/fapi/v1/time", {})["host"] == "fapi1.binance.com"
+        metrics = client.hedge_metrics()
+    finally:
+        release_primary.set()
+        client.close()
+
+    assert metrics.hedged_requests == 1
+    assert metrics.hedge_wins == 1
+    assert [host.failures for host in metrics.hosts] == [1, 0]
+
+
+def test_rest_client_hedges_within_the_in_flight_limit_and_reports_losing_responses() -> None:
+    primary_stalled = threading.Event()
+    release_primary = threading.Event()
+    in_flight_seen: list[int] = []
+    limiter = RestWeightLimiter(max_in_flight=4)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "fapi.binance.com" and primary_stalled.is_set():
+            release_primary.wait(timeout=5)
+            return httpx.Response(status_code=429, request=request, json={"msg": "too many requests"})
+        in_flight_seen.append(limiter.metrics().in_flight)
+        return httpx.Response(status_code=200, request=request, json={"host": request.url.host})
+
+    client = BinanceRESTClient(
+        base_url="https://fapi.binance.com",
+        transport=httpx.MockTransport(handler),
+        rate_limiter=limiter,
+        alternate_base_urls=["https://fapi1.binance.com"],
+    )
+    try:
+        for _ in range(REST_HEDGE_MIN_SAMPLES):
+            client._get("/fapi/v1/time", {})
+        in_flight_seen.clear()
+        primary_stalled.set()
+        assert client._get("/fapi/v1/time", {})["host"] == "fapi1.binance.com"
+        release_primary.set()
+        deadline = time.monotonic() + 5.0
+        while limiter.metrics().throttles == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        metrics = limiter.metrics()
+    finally:
+        release_primary.set()
+        client.close()
+
+    # The hedge held its own slot next to the primary's, and the losing 429 still reached the limiter.
+    assert in_flight_seen == [2]
+    assert metrics.throttles == 1
+    assert metrics.in_flight == 0
+
+
+def test_rest_client_does_not_hedge_a_primary_still_queued_for_a_worker() -> None:
+    hosts_seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hosts_seen.append(request.url.host)
+        return httpx.Response(status_code=200, request=request, json={"serverTime": 1})
+
+    client = BinanceRESTClient(
+        base_url="https://fapi.binance.com",
+        transport=httpx.MockTransport(handler),
+        rate_limiter=RestWeightLimiter(max_in_flight=2),
+        alternate_base_urls=["https://fapi1.binance.com"],
+    )
+    release_workers = threading.Event()
+    try:
+        for _ in range(REST_HEDGE_MIN_SAMPLES):
+            client._get("/fapi/v1/time", {})
+        hosts_seen.clear()
+        delay = client.hedge_metrics().hedge_delay_seconds
+        assert delay is not None
+
+        # The pool is sized from the in-flight limit; saturate it so the next primary has to queue.
+        assert client._hedge_pool is not None
+        for _ in range(4):
+            client._hedge_pool.submit(release_workers.wait, 5)
+        threading.Timer(delay * 3, release_workers.set).start()
+        client._get("/fapi/v1/time", {})
+        metrics = client.hedge_metrics()
+        last_latency = client._latencies[-1]
+    finally:
+        release_workers.set()
+        client.close()
+
+    assert hosts_seen == ["fapi.binance.com"]
+    assert metrics.hedged_requests == 0
+    # Time spent queued for a worker counts towards the hedge delay.
+    assert last_latency >= delay
+
+
+def test_weight_limiter_keeps_reserve_for_higher_priorities_and_reports_wait_per_class() -> None:
+    now = [1_000.0]
+
+    def _sleep(seconds: float) -> None:
+        now[0] += seconds
+
+    limiter = RestWeightLimiter(100, headroom=1.0, clock=lambda: now[0], sleep=_sleep)
+
+    assert limiter.try_acquire(40, RestPriority.BULK_BACKFILL) == 0.0
+    # Bulk backfill must leave half the bucket alone: 60 left, 20 more would dip below 50.
+    assert limiter.try_acquire(20, RestPriority.BULK_BACKFILL) == pytest.approx(6.0)
+    assert limiter.try_acquire(20, RestPriority.LIVE_CRITICAL) == 0.0
+    with rest_priority(RestPriority.REPAIR):
+        assert limiter.try_acquire(20) == pytest.approx(6.0)
+
+    assert limiter.acquire(10, RestPriority.BULK_BACKFILL) == pytest.approx(12.0)
+    assert limiter.acquire(10, RestPriority.LIVE_CRITICAL) == 0.0
+
+    by_priority = {metrics.priority: metrics for metrics in limiter.metrics().priorities}
+    assert by_priority[RestPriority.BULK_BACKFILL].waits == 1
+    assert by_priority[RestPriority.BULK_BACKFILL].max_wait_seconds == pytest.approx(12.0)
+    assert by_priority[RestPriority.LIVE_CRITICAL].requests == 1
+    assert by_priority[RestPriority.LIVE_CRITICAL].wait_seconds == 0.0
+    assert by_priority[RestPriority.REPAIR].requests == 0
+
+
+def test_weight_limiter_adapts_to_throttling_and_pauses_every_caller_on_ban(tmp_path: Path) -> None:
+    now = [1_000.0]
+
+    def _sleep(seconds: float) -> None:
+        now[0] += seconds
+
+    state_path = tmp_path / "state.sqlite"
+    limiter = RestWeightLimiter(
+        100, headroom=1.0, state_path=state_path, max_in_flight=8, clock=lambda: now[0], sleep=_sleep
+    )
+    other_process = RestWeightLimiter(100, headroom=1.0, state_path=state_path, clock=lambda: now[0], sleep=_sleep)
+    statuses = [429, 200, 418]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = statuses.pop(0)
+        headers = {"Retry-After": "0"} if status == 429 else {"Retry-After": "30"} if status == 418 else {}
+        return httpx.Response(
+            status_code=status,
+            request=request,
+            headers=headers,
+            json={"symbol": "BTCUSDT", "openInterest": "10.5", "time": 1},
+        )
+
+    client = BinanceRESTClient(
+        base_url="https://fapi.binance.com",
+        retries=2,
+        transport=httpx.MockTransport(handler),
+        rate_limiter=limiter,
+    )
+    try:
+        client.fetch_open_interest("BTCUSDT")
+        throttled = limiter.metrics()
+        with pytest.raises(httpx.HTTPStatusError):
+            client.fetch_open_interest("BTCUSDT")
+    finally:
+        client.close()
+
+    # 429 halved the shared rate and the in-flight limit; the following success added back a little.
+    assert throttled.throttles == 1
+    assert throttled.rate_factor == pytest.approx(0.52)
+    assert 4.0 < throttled.concurrency_limit < 5.0
+
+    banned = limiter.metrics()
+    assert banned.bans == 1
+    assert banned.rate_factor == pytest.approx(0.26)
+    # The ban pauses every caller sharing the budget, live-critical included.
+    assert other_process.try_acquire(1, RestPriority.LIVE_CRITICAL) == pytest.approx(30.0)
+    assert limiter.try_acquire(1, RestPriority.BULK_BACKFILL) == pytest.approx(30.0)
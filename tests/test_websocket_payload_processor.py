@@ -1,18 +1,29 @@
 from __future__ import annotations
 
+import asyncio
 import sqlite3
+import threading
+import time
+from collections.abc import Callable
 from contextlib import closing
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 import pytest
 
+from binance_minute_lake.core.json_codec import JsonCodec
 from binance_minute_lake.sources.websocket import (
+    BinanceWebSocketLoop,
+    BinanceWebSocketWorker,
     BinanceWsPayloadProcessor,
+    DepthLevels,
     InMemoryLiveCollector,
     LiquidationOrderEvent,
     LiveEventStore,
+    ReceiveQueue,
     floor_to_minute_ms,
+    now_ms,
 )
 
 
@@ -96,6 +107,34 @@ def test_payload_processor_ingests_depth_liquidation_and_trade() -> None:
     assert snapshot.latency_network == 30
 
 
+def test_payload_processor_parses_depth_levels_into_arrays(tmp_path: Path) -> None:
+    store = LiveEventStore(tmp_path / "live_events.sqlite")
+    collector = InMemoryLiveCollector(event_store=store, symbol="BTCUSDT")
+    processor = BinanceWsPayloadProcessor(collector=collector, symbol="BTCUSDT")
+    minute = _ms(datetime(2026, 1, 15, 10, 0, tzinfo=UTC))
+
+    processor.process_stream_payload(
+        stream_name="btcusdt@depth@100ms",
+        payload={
+            "e": "depthUpdate",
+            "E": minute + 5_000,
+            "s": "BTCUSDT",
+            "U": 101,
+            "u": 105,
+            "pu": 100,
+            "b": [["99.5", "12.0"], ["bad", "1.0"], ["99.0"], ["98.5", "0.000"]],
+            "a": [["100.5", "15.0"], None],
+        },
+        arrival_time_ms=minute + 5_020,
+    )
+
+    (event,) = store.iter_depth_events(symbol="BTCUSDT", after_update_id=0)
+    assert isinstance(event.bid_deltas, DepthLevels)
+    assert event.bid_deltas.prices.typecode == "d"
+    assert list(event.bid_deltas) == [(99.5, 12.0), (98.5, 0.0)]
+    assert list(event.ask_deltas) == [(100.5, 15.0)]
+
+
 def test_live_event_store_writes_raw_tables_and_heartbeats(tmp_path: Path) -> None:
     store = LiveEventStore(tmp_path / "live_events.sqlite")
     collector = InMemoryLiveCollector(event_store=store)
@@ -268,3 +307,333 @@ def test_live_event_store_closes_sqlite_connections_per_write(tmp_path: Path) ->
     after = _open_file_descriptor_count()
     assert after is not None
     assert (after - before) < 25
+
+
+class _ScriptedConnection:
+    def __init__(self, url: str, frames: list[str], on_exhausted: Callable[[str], None]) -> None:
+        self._url = url
+        self._frames = frames
+        self._on_exhausted = on_exhausted
+
+    async def __aenter__(self) -> _ScriptedConnection:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def __aiter__(self) -> _ScriptedConnection:
+        return self
+
+    async def __anext__(self) -> str:
+        await asyncio.sleep(0)
+        if self._frames:
+            return self._frames.pop(0)
+        self._on_exhausted(self._url)
+        # Like an idle socket: only a stop/reconnect signal ends the wait.
+        await asyncio.Event().wait()
+        raise StopAsyncIteration
+
+
+class _ScriptedWebsockets:
+    def __init__(self, frames_by_url: dict[str, list[str]], on_exhausted: Callable[[str], None]) -> None:
+        self._frames_by_url = frames_by_url
+        self._on_exhausted = on_exhausted
+
+    def connect(self, url: str, **_: object) -> _ScriptedConnection:
+        return _ScriptedConnection(url, self._frames_by_url[url], self._on_exhausted)
+
+
+def test_websocket_loop_runs_all_workers_on_one_thread() -> None:
+    received: list[tuple[str, int, int]] = []
+    connections: list[tuple[str, bool]] = []
+
+    def _worker(name: str) -> BinanceWebSocketWorker:
+        return BinanceWebSocketWorker(
+            name=name,
+            url=f"wss://example/{name}",
+            on_message=lambda payload, _arrival, _raw: received.append((name, payload["seq"], threading.get_ident())),
+            on_connection_change=lambda connected: connections.append((name, connected)),
+        )
+
+    workers = [_worker("depth"), _worker("agg_trade")]
+    loop = BinanceWebSocketLoop(workers)
+    exhausted: set[str] = set()
+
+    def _on_exhausted(url: str) -> None:
+        exhausted.add(url)
+        if len(exhausted) == len(workers):
+            for worker in workers:
+                worker.request_stop()
+
+    frames = {f"wss://example/{worker.name}": [f'{{"seq": {seq}}}' for seq in range(3)] for worker in workers}
+    asyncio.run(loop.run_workers(_ScriptedWebsockets(frames, _on_exhausted)))
+
+    assert len({thread_id for _, _, thread_id in received}) == 1
+    for name in ("depth", "agg_trade"):
+        assert [seq for worker_name, seq, _ in received if worker_name == name] == [0, 1, 2]
+    assert ("depth", True) in connections and ("depth", False) in connections
+
+
+def test_processor_builds_minute_bars_from_market_data_streams(tmp_path: Path) -> None:
+    store = LiveEventStore(tmp_path / "live_events.sqlite")
+    collector = InMemoryLiveCollector(event_store=store, symbol="BTCUSDT")
+    processor = BinanceWsPayloadProcessor(collector=collector, symbol="BTCUSDT")
+    minute = _ms(datetime(2026, 1, 15, 10, 0, tzinfo=UTC))
+
+    for offset, mark, index in ((1_000, 100.0, 99.9), (20_000, 101.5, 100.1), (59_000, 100.5, 99.5)):
+        mark_payload = {
+            "e": "markPriceUpdate",
+            "E": minute + offset,
+            "s": "BTCUSDT",
+            "p": str(mark),
+            "i": str(index),
+            "r": "0.0001",
+            "T": minute + 3_600_000,
+        }
+        processor.process_stream_payload(stream_name="btcusdt@markPrice@1s", payload=mark_payload)
+    ticker = {"e": "bookTicker", "E": minute + 30_000, "s": "BTCUSDT", "b": "100.0", "B": "5", "a": "100.1", "A": "7"}
+    processor.process_stream_payload(stream_name="btcusdt@bookTicker", payload=ticker)
+    kline = {
+        "t": minute,
+        "T": minute + 59_999,
+        "s": "BTCUSDT",
+        "i": "1m",
+        "o": "100",
+        "c": "100.5",
+        "h": "101",
+        "l": "99",
+        "v": "2",
+        "n": 3,
+        "x": False,
+        "q": "200",
+        "V": "1",
+        "Q": "100",
+    }
+    processor.process_stream_payload(stream_name="btcusdt@kline_1m", payload={"e": "kline", "k": kline})
+    processor.process_stream_payload(stream_name="btcusdt@kline_1m", payload={"e": "kline", "k": {**kline, "x": True}})
+    collector.flush_market_minutes(minute + 60_000)
+
+    def _bars(kind: str) -> list[dict[str, object]]:
+        return collector.minute_bars_for_window(
+            symbol="BTCUSDT",
+            kind=kind,
+            start_time=datetime(2026, 1, 15, 10, 0, tzinfo=UTC),
+            end_time=datetime(2026, 1, 15, 10, 1, tzinfo=UTC),
+        )
+
+    (kline_bar,) = _bars("kline")
+    assert kline_bar["open_time"] == minute
+    assert (kline_bar["high"], kline_bar["close"], kline_bar["trade_count"]) == (101.0, 100.5, 3)
+    assert kline_bar["taker_buy_vol_usdt"] == 100.0
+    (mark_bar,) = _bars("mark_price_kline")
+    assert (mark_bar["mark_price_open"], mark_bar["mark_price_high"]) == (100.0, 101.5)
+    assert (mark_bar["mark_price_low"], mark_bar["mark_price_close"]) == (100.0, 100.5)
+    assert _bars("index_price_kline")[0]["index_price_low"] == 99.5
+    assert _bars("book_ticker")[0]["ask_qty"] == 7.0
+    assert _bars("premium_index")[0]["mark_price"] == 100.5
+
+
+def test_worker_stop_interrupts_idle_receive_promptly() -> None:
+    worker = BinanceWebSocketWorker(
+        name="idle",
+        url="wss://example/idle",
+        on_message=lambda _payload, _arrival, _raw: None,
+        reconnect_seconds=30.0,
+    )
+    idle = threading.Event()
+
+    async def _run() -> float:
+        task = asyncio.create_task(
+            worker.run_forever(_ScriptedWebsockets({"wss://example/idle": []}, lambda _url: idle.set()))
+        )
+        await asyncio.to_thread(idle.wait, 5.0)
+        started = time.monotonic()
+        threading.Thread(target=worker.request_stop).start()
+        await asyncio.wait_for(task, timeout=5.0)
+        return time.monotonic() - started
+
+    assert asyncio.run(_run()) < 0.5
+
+
+def test_worker_ignores_stale_wake_without_a_pending_request() -> None:
+    worker = BinanceWebSocketWorker(
+        name="idle",
+        url="wss://example/idle",
+        on_message=lambda _payload, _arrival, _raw: None,
+        reconnect_seconds=30.0,
+    )
+    connects: list[str] = []
+    idle = threading.Event()
+
+    def _on_exhausted(url: str) -> None:
+        connects.append(url)
+        idle.set()
+
+    async def _run() -> None:
+        task = asyncio.create_task(worker.run_forever(_ScriptedWebsockets({"wss://example/idle": []}, _on_exhausted)))
+        await asyncio.to_thread(idle.wait, 5.0)
+        # A wake whose reconnect request was already consumed must not churn the connection.
+        assert worker._wake is not None
+        worker._wake.set()
+        await asyncio.sleep(0.05)
+        threading.Thread(target=worker.request_stop).start()
+        await asyncio.wait_for(task, timeout=5.0)
+
+    asyncio.run(_run())
+    assert connects == ["wss://example/idle"]
+
+
+def test_processor_stores_raw_frames_without_reencoding(tmp_path: Path) -> None:
+    store = LiveEventStore(tmp_path / "live_events.sqlite")
+    collector = InMemoryLiveCollector(event_store=store, symbol="BTCUSDT")
+    processor = BinanceWsPayloadProcessor(collector=collector, symbol="BTCUSDT")
+    minute = _ms(datetime(2026, 1, 15, 10, 0, tzinfo=UTC))
+    event_time = minute + 10_000
+    frame = (
+        f'{{"stream":"btcusdt@forceOrder","data":{{"e":"forceOrder","E":{event_time},'
+        f'"o":{{"s":"BTCUSDT","S":"SELL","p":"100.0","ap":"100.0","q":"3.0","l":"2.5","T":{event_time}}}}}}}'
+    )
+
+    processor.process_combined_payload(store._codec.loads(frame), minute + 10_050, raw_frame=frame.encode())
+
+    with closing(sqlite3.connect(tmp_path / "live_events.sqlite")) as connection:
+        (raw_json,) = connection.execute("SELECT raw_json FROM ws_liq_events").fetchone()
+    assert raw_json == frame
+
+    restarted = InMemoryLiveCollector(event_store=store, symbol="BTCUSDT")
+    snapshot = restarted.snapshot_for_minute(minute)
+    assert snapshot.liq_long_count == 1
+    assert snapshot.liq_unfilled_ratio is not None
+
+
+def test_receive_queue_overflow_policies(tmp_path: Path) -> None:
+    handled: list[int] = []
+    codec = JsonCodec("json")
+
+    def _queue(policy: str) -> ReceiveQueue:
+        return ReceiveQueue(
+            name=policy,
+            handler=lambda payload, _arrival, _raw: handled.append(payload["seq"]),
+            codec=codec,
+            maxsize=2,
+            overflow_policy=policy,
+            spill_path=tmp_path / f"{policy}.spill.jsonl",
+        )
+
+    blocking = _queue("block")
+    assert [blocking.offer({"seq": seq}, 0, f'{{"seq":{seq}}}') for seq in range(3)] == [True, True, False]
+
+    dropping = _queue("drop_oldest")
+    for seq in range(4):
+        assert dropping.offer({"seq": seq}, 0, f'{{"seq":{seq}}}') is True
+    assert dropping.drain() == 2
+    assert handled == [2, 3]
+    assert dropping.metrics().dropped == 2
+
+    handled.clear()
+    spilling = _queue("spill")
+    for seq in range(5):
+        assert spilling.offer({"seq": seq}, now_ms(), f'{{"seq":{seq}}}') is True
+    metrics = spilling.metrics()
+    assert metrics.spilled == 3
+    assert metrics.depth == 5
+    assert metrics.enqueued == 5
+    # Offering never touches the disk; the writer (here: ``drain``) appends spilled frames.
+    assert not (tmp_path / "spill.spill.jsonl").exists()
+    assert spilling.drain() == 5
+    assert handled == [0, 1, 2, 3, 4]
+    assert spilling.metrics().depth == 0
+    assert not (tmp_path / "spill.spill.jsonl").exists()
+
+
+def test_receive_queue_wakes_blocked_put_and_spills_through_writer_thread(tmp_path: Path) -> None:
+    handled: list[int] = []
+    release = threading.Event()
+
+    def _handler(payload: dict[str, Any], _arrival: int, _raw: str | bytes) -> None:
+        release.wait(timeout=5.0)
+        handled.append(payload["seq"])
+
+    blocking = ReceiveQueue(name="block", handler=_handler, codec=JsonCodec("json"), maxsize=1)
+
+    async def _put_all() -> None:
+        for seq in range(3):
+            await blocking.put({"seq": seq}, now_ms(), f'{{"seq":{seq}}}')
+
+    blocking.start()
+    try:
+        threading.Timer(0.05, release.set).start()
+        asyncio.run(asyncio.wait_for(_put_all(), timeout=5.0))
+        deadline = time.monotonic() + 5.0
+        while len(handled) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        blocking.stop()
+    assert handled == [0, 1, 2]
+
+    handled.clear()
+    release.clear()
+    spilling = ReceiveQueue(
+        name="spill",
+        handler=_handler,
+        codec=JsonCodec("json"),
+        maxsize=1,
+        overflow_policy="spill",
+        spill_path=tmp_path / "spill.jsonl",
+    )
+    spilling.start()
+    try:
+        for seq in range(6):
+            assert spilling.offer({"seq": seq}, now_ms(), f'{{"seq":{seq}}}') is True
+        release.set()
+        deadline = time.monotonic() + 5.0
+        while len(handled) < 6 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        spilling.stop()
+    assert handled == [0, 1, 2, 3, 4, 5]
+    metrics = spilling.metrics()
+    assert (metrics.enqueued, metrics.processed, metrics.depth) == (6, 6, 0)
+    assert metrics.streams[0].enqueued == 6
+
+
+def test_receive_queue_dispatches_all_sources_in_order_and_counts_per_stream(tmp_path: Path) -> None:
+    handled: list[tuple[str, int, int]] = []
+    queue = ReceiveQueue(
+        name="ws-btcusdt",
+        codec=JsonCodec("json"),
+        maxsize=3,
+        overflow_policy="drop_oldest",
+        spill_path=tmp_path / "shared.spill.jsonl",
+    )
+    queue.register(
+        "combined",
+        lambda payload, _arrival, _raw: handled.append(("combined", payload["data"]["seq"], threading.get_ident())),
+    )
+    queue.register(
+        "depth-standby",
+        lambda payload, _arrival, _raw: handled.append(("standby", payload["seq"], threading.get_ident())),
+        stream="btcusdt@depth@100ms",
+    )
+
+    arrival = now_ms()
+    queue.offer({"stream": "btcusdt@aggTrade", "data": {"seq": 0}}, arrival, "{}", source="combined")
+    queue.offer({"seq": 1}, arrival, "{}", source="depth-standby")
+    queue.offer({"stream": "btcusdt@depth@100ms", "data": {"seq": 2}}, arrival, "{}", source="combined")
+    queue.offer({"stream": "btcusdt@aggTrade", "data": {"seq": 3}}, arrival, "{}", source="combined")
+
+    queue.start()
+    try:
+        deadline = time.monotonic() + 5.0
+        while len(handled) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        queue.stop()
+
+    # One dispatcher thread handles every source, in enqueue order.
+    assert [(source, seq) for source, seq, _ in handled] == [("standby", 1), ("combined", 2), ("combined", 3)]
+    assert len({thread_id for _, _, thread_id in handled}) == 1
+    streams = {item.stream: item for item in queue.metrics().streams}
+    assert (streams["btcusdt@aggTrade"].enqueued, streams["btcusdt@aggTrade"].dropped) == (2, 1)
+    assert (streams["btcusdt@depth@100ms"].enqueued, streams["btcusdt@depth@100ms"].processed) == (2, 2)
+    assert all(item.depth == 0 for item in streams.values())